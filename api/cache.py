@@ -0,0 +1,305 @@
+"""
+Cache des réponses JSON pré-sérialisées.
+
+Le jeu de données étant en lecture seule entre deux chargements, une réponse
+peut être rendue une seule fois en octets puis resservie telle quelle, sans
+validation Pydantic ni `jsonable_encoder`. Chaque entrée porte un ETag qui
+permet de répondre `304 Not Modified` aux clients qui l'ont déjà.
+
+Les entrées sont associées à la génération courante du `UserStore` : un
+rechargement des données vide le cache.
+
+Les variantes compressées (gzip, et brotli si le paquet `brotli` est
+installé) sont calculées à la première demande puis conservées avec la
+réponse : une liste n'est compressée qu'une fois par chargement des données.
+"""
+
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import orjson
+
+try:
+    import brotli
+except ImportError:  # compression brotli optionnelle (pip install brotli)
+    brotli = None
+
+# Encodages proposés aux clients, par ordre de préférence
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Args:
+        body (bytes): Corps à compresser.
+        encoding (str): `gzip` ou `br`.
+
+    Returns:
+        bytes: Corps compressé.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime fixe : même contenu, mêmes octets (ETag stable)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Compresse au fil de l'eau une réponse en flux (format gzip).
+
+    Chaque morceau est vidé du compresseur dès qu'il est produit : le client
+    peut décoder les données reçues sans attendre la fin du flux.
+
+    Args:
+        chunks (Iterable[bytes]): Morceaux du corps non compressé.
+
+    Returns:
+        Iterator[bytes]: Morceaux du corps compressé.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: Tuple[str, ...] = ENCODINGS) -> Optional[str]:
+    """
+    Choisit l'encodage de la réponse d'après l'en-tête `Accept-Encoding`.
+
+    Args:
+        accept_encoding (Optional[str]): Valeur de l'en-tête (ex. `gzip, br;q=0.8`).
+        encodings (Tuple[str, ...]): Encodages disponibles, par ordre de préférence.
+
+    Returns:
+        Optional[str]: Encodage retenu, ou None pour une réponse non compressée.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Réponse pré-rendue.
+
+    Attributs :
+        body (bytes)            : Corps JSON encodé en UTF-8.
+        etag (str)              : ETag fort calculé sur le corps.
+        headers (Dict[str, str]): En-têtes supplémentaires à renvoyer.
+        variants (Dict[str, bytes]): Corps compressés déjà calculés, par encodage.
+    """
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    variants: Dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    def encoded(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """
+        Args:
+            encoding (Optional[str]): Encodage négocié (None = corps brut).
+
+        Returns:
+            Tuple[bytes, str]: Corps dans cet encodage et son ETag (chaque
+            variante a le sien, comme l'exige un ETag fort).
+        """
+        if encoding is None:
+            return self.body, self.etag
+        body = self.variants.get(encoding)
+        if body is None:
+            # Deux requêtes simultanées peuvent compresser la même réponse :
+            # résultat identique, la dernière écriture l'emporte
+            body = self.variants[encoding] = compress(self.body, encoding)
+        return body, f'{self.etag[:-1]}-{encoding}"'
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Sérialise `content` avec orjson : mêmes octets que `JSONResponse` de
+    Starlette (UTF-8, sans espaces), plusieurs fois plus vite que `json.dumps`.
+
+    Args:
+        content (Any): Données JSON-compatibles.
+
+    Returns:
+        bytes: JSON encodé en UTF-8.
+    """
+    return orjson.dumps(content)
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Args:
+        body (bytes): Corps de la réponse.
+
+    Returns:
+        str: ETag fort (entre guillemets) dérivé du contenu.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indique si l'en-tête `If-None-Match` du client correspond à l'ETag courant.
+
+    Args:
+        if_none_match (Optional[str]): Valeur de l'en-tête (liste séparée par des virgules).
+        etag (str): ETag de la réponse.
+
+    Returns:
+        bool: True si le client possède déjà cette version.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Cache LRU de réponses pré-rendues, borné en octets et invalidé à chaque
+    changement de génération.
+
+    La taille comptée est celle des corps conservés, variantes compressées
+    comprises. Une réponse de plus de `max_entry_bytes` octets (ex. liste
+    complète) est rendue à chaque requête sans être conservée : elle
+    évincerait à elle seule la plupart des autres entrées.
+
+    Attributs :
+        max_bytes (int)      : Taille maximale cumulée des corps conservés.
+        max_entry_bytes (int): Taille maximale d'un corps conservé.
+        size (int)           : Taille cumulée actuelle des corps conservés.
+        hits (int)           : Réponses servies depuis le cache.
+        misses (int)         : Réponses rendues (absentes du cache).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: int = 8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        # Taille comptée pour chaque entrée (corps et variantes déjà calculées)
+        self._sizes: Dict[Hashable, int] = {}
+        self._generation: Optional[int] = None
+        self._lock = Lock()
+
+    def get_or_render(
+        self,
+        generation: int,
+        key: Hashable,
+        render: Callable[[], Tuple[Any, Dict[str, str]]],
+    ) -> CachedResponse:
+        """
+        Retourne la réponse en cache pour `key`, ou la rend et la mémorise.
+
+        Args:
+            generation (int): Génération courante du jeu de données.
+            key (Hashable): Clé de la réponse, construite à partir des paramètres
+                validés de la route (pas de l'URL brute : des paramètres inconnus
+                ou réordonnés ne doivent pas créer de nouvelles entrées).
+            render (Callable): Fonction renvoyant le contenu JSON et les en-têtes.
+                Une exception levée par `render` (ex. 404) n'est pas mise en cache.
+
+        Returns:
+            CachedResponse: Réponse pré-rendue.
+        """
+        with self._lock:
+            if generation != self._generation:
+                self._clear()
+                self._generation = generation
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Rendu hors verrou : deux requêtes simultanées peuvent rendre la même
+        # réponse, ce qui est sans conséquence (le résultat est identique).
+        content, headers = render()
+        body = render_json(content)
+        entry = CachedResponse(body=body, etag=compute_etag(body), headers=headers)
+
+        if len(body) <= min(self.max_entry_bytes, self.max_bytes):
+            with self._lock:
+                if generation == self._generation:
+                    self._remove(key)
+                    self._entries[key] = entry
+                    self._sizes[key] = len(body)
+                    self.size += len(body)
+                    self._shrink()
+        return entry
+
+    def encoded(self, key: Hashable, entry: CachedResponse, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """
+        Équivalent de `entry.encoded(encoding)` qui compte dans la taille du
+        cache une variante compressée nouvellement calculée.
+
+        Args:
+            key (Hashable): Clé passée à `get_or_render`.
+            entry (CachedResponse): Réponse renvoyée par `get_or_render`.
+            encoding (Optional[str]): Encodage négocié (None = corps brut).
+
+        Returns:
+            Tuple[bytes, str]: Corps dans cet encodage et son ETag.
+        """
+        computed = encoding is not None and encoding not in entry.variants
+        body, etag = entry.encoded(encoding)
+        if computed:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    size = len(entry.body) + sum(len(variant) for variant in list(entry.variants.values()))
+                    self.size += size - self._sizes[key]
+                    self._sizes[key] = size
+                    self._shrink()
+        return body, etag
+
+    def _remove(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.size -= self._sizes.pop(key)
+
+    def _shrink(self) -> None:
+        while self.size > self.max_bytes:
+            key, _ = self._entries.popitem(last=False)
+            self.size -= self._sizes.pop(key)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,28 +5,56 @@ Cette application charge des utilisateurs GitHub filtrés à partir d'un fichier
 et expose une API REST pour interroger ces utilisateurs, avec authentification JWT.
 """
 
+from anyio import to_thread
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .routes import router, users_data
-from .models import User
-import json
+from .metrics import MetricsMiddleware, cache_metrics, dataset_metrics
+from .routes import response_cache, router, users_store
+from .reload import DatasetReloader
+from .security import token_cache
+import asyncio
 import os
 
+# Détermination du chemin vers le fichier filtered_users.json
+data_file = os.getenv(
+    "USERS_DATA_FILE",
+    os.path.join(os.path.dirname(__file__), "..", "data", "filtered_users.json"),
+)
+
+# Chargement des utilisateurs depuis le fichier JSON (au démarrage de l'app) :
+# conversion en objets Pydantic User et construction des index
+reloader = DatasetReloader(users_store, data_file, interval=float(os.getenv("DATA_RELOAD_INTERVAL", 0)))
+reloader.reload()
+
+# Nombre de threads servant les routes synchrones (recherches, sérialisation des listes)
+threadpool_size = int(os.getenv("THREADPOOL_SIZE", 40))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Dimensionne le pool de threads des routes synchrones et lance la
+    surveillance du fichier d'utilisateurs pendant la vie de l'application.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    watcher = asyncio.create_task(reloader.watch()) if reloader.interval > 0 else None
+    yield
+    if watcher is not None:
+        watcher.cancel()
+
 # Instanciation de l'application FastAPI avec titre, description et version
 app = FastAPI(
     title="GitHub Users API",
     description="API pour gérer les utilisateurs GitHub filtrés",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan,
 )
+app.state.reloader = reloader
 
-# Détermination du chemin vers le fichier filtered_users.json
-data_file = os.path.join(os.path.dirname(__file__), "..", "data", "filtered_users.json")
-
-# Chargement des utilisateurs depuis le fichier JSON (au démarrage de l'app)
-with open(data_file, "r", encoding="utf-8") as f:
-    raw_users = json.load(f)
-
-# Conversion des dictionnaires JSON en objets Pydantic User
-users_data.extend([User(**u) for u in raw_users])
+# Métriques Prometheus (GET /metrics) : mesure de chaque requête, état du
+# jeu de données et des caches lu au moment de la collecte
+app.add_middleware(MetricsMiddleware)
+dataset_metrics(reloader)
+cache_metrics({"response": response_cache, "token": token_cache})
 
 # Inclusion des routes définies dans le routeur principal
 app.include_router(router)
@@ -0,0 +1,335 @@
+"""
+Métriques Prometheus de l'API (route `GET /metrics`).
+
+Implémentation sans dépendance du format texte d'exposition Prometheus,
+limitée à ce dont l'API a besoin : compteurs, jauges et histogrammes avec
+étiquettes. Le coût par requête reste de quelques opérations sur des
+dictionnaires (pas de middleware `BaseHTTPMiddleware`, pas d'allocation de
+tâche) : l'instrumentation peut rester active en production.
+
+Deux familles de métriques :
+- mesurées à chaque requête par `MetricsMiddleware` (nombre de requêtes,
+  latence, taille des réponses, requêtes en cours, échecs d'authentification) ;
+- lues au moment de la collecte via une fonction `collect` (taille et
+  génération du jeu de données, rechargements, caches) : aucun coût hors
+  des collectes.
+
+Chaque processus uvicorn a ses propres compteurs : avec plusieurs workers,
+chaque collecte décrit le worker qui l'a servie.
+"""
+
+import time
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bornes (s) des histogrammes de latence
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Bornes (octets) des histogrammes de taille de réponse
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Labels, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    """
+    Métrique nommée, éventuellement étiquetée.
+
+    Attributs :
+        name (str)                  : Nom Prometheus de la métrique.
+        documentation (str)         : Description (ligne `# HELP`).
+        labelnames (Tuple[str, ...]): Noms des étiquettes, dans l'ordre des valeurs.
+        collect (Optional[Callable]): Si fournie, appelée à chaque collecte ; renvoie
+            un dictionnaire valeurs d'étiquettes → valeur (ou une valeur seule sans étiquette).
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], object]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+        self._values: Dict[Labels, float] = {}
+        self._lock = Lock()
+
+    def samples(self) -> Iterable[Sample]:
+        """
+        Returns:
+            Iterable[Sample]: Échantillons (suffixe du nom, valeurs d'étiquettes, valeur).
+        """
+        if self.collect is not None:
+            values = self.collect()
+            if not isinstance(values, dict):
+                values = {(): values}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [("", labels, value) for labels, value in values.items()]
+
+    def render(self) -> Iterator[str]:
+        """Lignes du format texte Prometheus pour cette métrique."""
+        yield f"# HELP {self.name} {_escape(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for suffix, labels, value in self.samples():
+            # Les séries `_bucket` d'un histogramme portent en plus la borne `le`
+            names = self.labelnames + ("le",) if suffix == "_bucket" else self.labelnames
+            label_text = ",".join(f'{name}="{_escape(str(v))}"' for name, v in zip(names, labels))
+            if label_text:
+                yield f"{self.name}{suffix}{{{label_text}}} {_format_value(value)}"
+            else:
+                yield f"{self.name}{suffix} {_format_value(value)}"
+
+
+class Counter(Metric):
+    """Compteur croissant."""
+
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """
+        Args:
+            labels (Labels): Valeurs des étiquettes, dans l'ordre de `labelnames`.
+            amount (float): Incrément (positif).
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    """Valeur instantanée (peut monter et descendre)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    """
+    Histogramme à bornes fixes (séries `_bucket`, `_sum` et `_count`).
+
+    Attributs :
+        buckets (Tuple[float, ...]): Bornes supérieures croissantes (+Inf ajoutée).
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # Valeurs d'étiquettes → [compte par intervalle (non cumulé)..., somme]
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """
+        Args:
+            value (float): Valeur observée.
+            labels (Labels): Valeurs des étiquettes.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        samples = []
+        for labels, values in series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                samples.append(("_bucket", labels + (_format_value(bound),), cumulative))
+            samples.append(("_sum", labels, values[-1]))
+            samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    """Ensemble des métriques exposées par `GET /metrics`."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Ajoute (ou remplace) une métrique.
+
+        Args:
+            metric (Metric): Métrique à exposer.
+
+        Returns:
+            Metric: La métrique, pour un enregistrement en une ligne.
+        """
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> bytes:
+        """
+        Returns:
+            bytes: Toutes les métriques au format texte Prometheus.
+        """
+        lines = [line for metric in list(self._metrics.values()) for line in metric.render()]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "Requêtes HTTP traitées.", ("method", "route", "status")
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "Durée de traitement des requêtes HTTP.", ("method", "route")
+))
+http_response_size = registry.register(Histogram(
+    "http_response_size_bytes", "Taille des corps de réponse HTTP.", ("route",), buckets=SIZE_BUCKETS
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "Requêtes HTTP en cours de traitement."
+))
+http_auth_failures = registry.register(Counter(
+    "http_auth_failures_total", "Réponses 401 (identifiants ou token invalides, token absent).", ("route",)
+))
+
+
+def route_label(scope: dict) -> str:
+    """
+    Args:
+        scope (dict): Scope ASGI après routage.
+
+    Returns:
+        str: Modèle de chemin de la route (ex. `/users/{login}`), ou
+        `unmatched` : les chemins inconnus ne créent pas de nouvelles séries.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched") if route is not None else "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI qui mesure chaque requête HTTP.
+
+    Attributs :
+        app : Application ASGI instrumentée.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            route = route_label(scope)
+            method = scope["method"]
+            http_requests.inc((method, route, str(status_code)))
+            http_request_duration.observe(duration, (method, route))
+            http_response_size.observe(size, (route,))
+            if status_code == 401:
+                http_auth_failures.inc((route,))
+
+
+def cache_metrics(caches: Dict[str, object]) -> None:
+    """
+    Expose les compteurs `hits` / `misses` de caches et leur taux de succès.
+
+    Args:
+        caches (Dict[str, object]): Nom du cache → objet avec `hits`, `misses` et `__len__`.
+    """
+    registry.register(Counter(
+        "cache_hits_total", "Lectures servies par le cache.", ("cache",),
+        collect=lambda: {(name,): cache.hits for name, cache in caches.items()},
+    ))
+    registry.register(Counter(
+        "cache_misses_total", "Lectures absentes du cache.", ("cache",),
+        collect=lambda: {(name,): cache.misses for name, cache in caches.items()},
+    ))
+    registry.register(Gauge(
+        "cache_hit_ratio", "Part des lectures servies par le cache depuis le démarrage.", ("cache",),
+        collect=lambda: {
+            (name,): cache.hits / (cache.hits + cache.misses) if cache.hits + cache.misses else 0
+            for name, cache in caches.items()
+        },
+    ))
+    registry.register(Gauge(
+        "cache_entries", "Entrées présentes dans le cache.", ("cache",),
+        collect=lambda: {(name,): len(cache) for name, cache in caches.items()},
+    ))
+
+
+def dataset_metrics(reloader) -> None:
+    """
+    Expose l'état du jeu de données et des rechargements d'un `DatasetReloader`.
+
+    Args:
+        reloader (DatasetReloader): Rechargeur de l'application.
+    """
+    registry.register(Gauge(
+        "users_dataset_size", "Utilisateurs du jeu de données chargé.", collect=lambda: len(reloader.store)
+    ))
+    registry.register(Gauge(
+        "users_dataset_generation", "Génération du jeu de données (incrémentée à chaque chargement).",
+        collect=lambda: reloader.store.generation,
+    ))
+    registry.register(Gauge(
+        "users_dataset_loaded_timestamp_seconds", "Date (epoch) du dernier chargement réussi.",
+        collect=lambda: reloader.loaded_at or 0,
+    ))
+    registry.register(Gauge(
+        "users_dataset_load_duration_seconds", "Durée du dernier chargement réussi.",
+        collect=lambda: reloader.load_duration or 0,
+    ))
+    registry.register(Counter(
+        "users_dataset_reloads_total", "Tentatives de chargement du jeu de données, par résultat.", ("result",),
+        collect=lambda: {("success",): reloader.reloads, ("error",): reloader.failures},
+    ))
@@ -2,11 +2,16 @@
 Définition du modèle de données `User` utilisé pour représenter un utilisateur GitHub.
 
 Ce modèle est utilisé pour la validation, la sérialisation et la documentation automatique
-des objets utilisateur à travers l'application.
+des objets utilisateur à travers l'application. Les modèles `BatchRequest` et
+`BatchResponse` décrivent la route de consultation groupée `POST /users/batch`.
 """
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import AbstractSet, Any, Dict, List, Optional
+import os
+
+# Nombre maximal de logins et d'ids par requête POST /users/batch
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", 1000))
 
 class User(BaseModel):
     """
@@ -24,3 +29,58 @@ class User(BaseModel):
     created_at: str
     avatar_url: str
     bio: Optional[str]
+
+class BatchRequest(BaseModel):
+    """
+    Corps de `POST /users/batch`.
+
+    Chaque liste est limitée à `BATCH_MAX_SIZE` éléments dès la validation :
+    un lot démesuré est rejeté (422) avant que ses éléments soient validés
+    un par un.
+
+    Attributs :
+        logins (List[str]) : Logins recherchés.
+        ids (List[int])    : Identifiants GitHub recherchés.
+        ignore_case (bool) : Si True, les logins sont comparés sans tenir compte de la casse.
+    """
+    logins: List[str] = Field(default=[], max_length=BATCH_MAX_SIZE)
+    ids: List[int] = Field(default=[], max_length=BATCH_MAX_SIZE)
+    ignore_case: bool = False
+
+class BatchMissing(BaseModel):
+    """
+    Éléments de `BatchRequest` sans utilisateur correspondant.
+
+    Attributs :
+        logins (List[str]) : Logins introuvables.
+        ids (List[int])    : Identifiants introuvables.
+    """
+    logins: List[str]
+    ids: List[int]
+
+class BatchResponse(BaseModel):
+    """
+    Réponse de `POST /users/batch`.
+
+    Attributs :
+        users (List[User])    : Utilisateurs trouvés (logins puis ids, dans l'ordre de la requête).
+        missing (BatchMissing): Logins et ids introuvables.
+    """
+    users: List[User]
+    missing: BatchMissing
+
+def select_fields(record: Dict[str, Any], fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+    """
+    Réduit les champs d'un utilisateur déjà sous forme de dictionnaire (voir
+    `UserStore.page_records`) aux champs demandés.
+
+    Args:
+        record (Dict[str, Any]): Champs de l'utilisateur.
+        fields (Optional[AbstractSet[str]]): Champs à conserver (tous si None).
+
+    Returns:
+        Dict[str, Any]: Champs conservés, dans l'ordre du modèle.
+    """
+    if fields is None:
+        return record
+    return {name: value for name, value in record.items() if name in fields}
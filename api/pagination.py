@@ -0,0 +1,74 @@
+"""
+Outils de pagination et de projection pour les routes de liste.
+
+- Curseurs opaques : l'id du dernier utilisateur d'une page, encodé en base64
+  afin que les clients ne dépendent pas de son format.
+- Projection : sélection des champs renvoyés via le paramètre `fields`.
+"""
+
+import base64
+import binascii
+from typing import Optional, Set
+from fastapi import HTTPException, status
+from .models import User
+
+USER_FIELDS = tuple(User.model_fields)
+
+
+def encode_cursor(user_id: int) -> str:
+    """
+    Args:
+        user_id (int): Id du dernier utilisateur de la page.
+
+    Returns:
+        str: Curseur opaque à transmettre au client.
+    """
+    return base64.urlsafe_b64encode(f"id:{user_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Décode un curseur produit par `encode_cursor`.
+
+    Args:
+        cursor (str): Curseur reçu du client.
+
+    Returns:
+        int: Id du dernier utilisateur de la page précédente.
+
+    Raises:
+        HTTPException: Si le curseur est invalide.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, value = raw.split(":", 1)
+        if prefix != "id":
+            raise ValueError(raw)
+        return int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Curseur invalide")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """
+    Analyse le paramètre `fields` (liste de champs séparés par des virgules).
+
+    Args:
+        fields (Optional[str]): Valeur du paramètre, ex. "login,id".
+
+    Returns:
+        Optional[Set[str]]: Champs demandés, ou None pour tous les champs.
+
+    Raises:
+        HTTPException: Si un champ demandé n'existe pas.
+    """
+    if not fields:
+        return None
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = selected.difference(USER_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Champs inconnus : {', '.join(sorted(unknown))}",
+        )
+    return selected
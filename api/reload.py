@@ -0,0 +1,160 @@
+"""
+Rechargement à chaud du fichier d'utilisateurs.
+
+Le nouveau jeu de données (colonnes et index en mémoire, snapshot projeté ou
+base SQLite) est entièrement préparé à côté de l'ancien, puis substitué en
+une seule affectation : les requêtes en cours terminent sur l'ancien
+instantané, les suivantes voient le nouveau, et aucune ne voit de liste
+partielle. Si le fichier est invalide, l'ancien jeu de données reste en place.
+
+Deux déclencheurs :
+- la route protégée `POST /admin/reload` ;
+- la surveillance du fichier (`DATA_RELOAD_INTERVAL` secondes entre deux
+  vérifications de sa date de modification, 0 = désactivée).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional, Tuple
+from .models import User
+from .snapshot import SNAPSHOT_SUFFIX, SnapshotDataset
+from .sqlite_store import SQLITE_SUFFIXES, SqliteDataset
+from .store import UserBackend, UserDataset, UserStore
+
+logger = logging.getLogger(__name__)
+
+
+def read_users(path: str) -> Iterator[User]:
+    """
+    Lit et valide les utilisateurs d'un fichier JSON (`filtered_users.json`).
+
+    Args:
+        path (str): Chemin du fichier.
+
+    Returns:
+        Iterator[User]: Utilisateurs validés, dans l'ordre du fichier.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        raw_users = json.load(f)
+    return (User(**u) for u in raw_users)
+
+
+def load_dataset(path: str) -> UserBackend:
+    """
+    Ouvre le moteur de stockage correspondant à l'extension du fichier :
+    base SQLite (`.sqlite`, `.db`), snapshot binaire (`.snap`) ou JSON chargé en mémoire.
+
+    Args:
+        path (str): Chemin du fichier.
+
+    Returns:
+        UserBackend: Jeu de données prêt à être installé dans le `UserStore`.
+    """
+    if path.endswith(SQLITE_SUFFIXES):
+        return SqliteDataset(path)
+    if path.endswith(SNAPSHOT_SUFFIX):
+        return SnapshotDataset(path)
+    return UserDataset(read_users(path))
+
+
+class DatasetReloader:
+    """
+    Recharge un `UserStore` depuis un fichier lorsque celui-ci change.
+
+    Attributs :
+        store (UserStore)          : Stockage à alimenter.
+        path (str)                 : Fichier des utilisateurs (JSON, snapshot `.snap` ou base `.sqlite`).
+        interval (float)           : Période de surveillance du fichier (s), 0 = désactivée.
+        loaded_at (Optional[float]): Date (epoch) du dernier chargement réussi.
+        load_duration (Optional[float]): Durée (s) du dernier chargement réussi.
+        last_error (Optional[str]) : Erreur du dernier rechargement échoué.
+        reloads (int)              : Nombre de chargements réussis.
+        failures (int)             : Nombre de chargements échoués.
+    """
+
+    def __init__(self, store: UserStore, path: str, interval: float = 0):
+        self.store = store
+        self.path = path
+        self.interval = interval
+        self.loaded_at: Optional[float] = None
+        self.load_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.reloads = 0
+        self.failures = 0
+        self._signature: Optional[Tuple[int, int]] = None
+        # Un seul rechargement à la fois (route et surveillance peuvent se chevaucher)
+        self._lock = Lock()
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reconstruit le jeu de données si le fichier a changé, puis le substitue.
+
+        Appel bloquant : à exécuter hors de la boucle asyncio.
+
+        Args:
+            force (bool): Si True, recharge même si le fichier n'a pas changé.
+
+        Returns:
+            bool: True si un nouveau jeu de données a été installé.
+
+        Raises:
+            OSError, TypeError, ValueError: Si le fichier est illisible ou invalide
+                (l'ancien jeu de données est conservé).
+        """
+        with self._lock:
+            try:
+                signature = self._file_signature()
+                if not force and signature == self._signature:
+                    return False
+                start = time.perf_counter()
+                dataset = load_dataset(self.path)
+            except (OSError, TypeError, ValueError) as e:
+                self.last_error = str(e)
+                self.failures += 1
+                raise
+            self.store.swap(dataset)
+            self._signature = signature
+            self.loaded_at = time.time()
+            self.load_duration = time.perf_counter() - start
+            self.last_error = None
+            self.reloads += 1
+            logger.info("%d utilisateurs chargés depuis %s (génération %d)", len(dataset), self.path, self.store.generation)
+            return True
+
+    async def watch(self) -> None:
+        """
+        Surveille le fichier et le recharge dès qu'il est modifié.
+
+        La construction du jeu de données se fait dans un thread : la boucle
+        asyncio continue de servir les requêtes pendant ce temps.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.reload)
+            except (OSError, TypeError, ValueError) as e:
+                # Fichier en cours d'écriture ou invalide : nouvel essai au prochain tour
+                logger.warning("Rechargement de %s impossible : %s", self.path, e)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: État du jeu de données chargé.
+        """
+        return {
+            "path": self.path,
+            "users": len(self.store),
+            "generation": self.store.generation,
+            "loaded_at": self.loaded_at,
+            "last_error": self.last_error,
+            "reloads": self.reloads,
+            "failures": self.failures,
+        }
@@ -3,27 +3,124 @@ Module FastAPI pour la gestion des routes utilisateur et de l'authentification.
 
 Ce routeur propose :
 - Une route d'accueil
-- L'accès à la liste des utilisateurs (protégée)
+- L'accès à la liste des utilisateurs, paginée, filtrable et projetable (protégée)
+- L'export en flux NDJSON de tous les utilisateurs (protégé)
 - La recherche d'utilisateurs par login (protégée)
-- La consultation détaillée d'un utilisateur (protégée)
+- La consultation détaillée d'un utilisateur par login ou par id (protégée)
+- La consultation groupée de nombreux logins ou ids en une requête (protégée)
+- Le rechargement à chaud du fichier d'utilisateurs (protégé)
+- Les métriques Prometheus
 - Une route protégée de test
 - L'authentification via token JWT
 
-Les routes nécessitent un token valide sauf pour l'accueil et la génération du token.
+Les routes nécessitent un token valide sauf pour l'accueil, les métriques et la génération du token.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from .models import User
-from .security import authenticate_user, create_access_token, get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from .cache import ResponseCache, compress, etag_matches, gzip_stream, negotiate_encoding, render_json
+from .metrics import CONTENT_TYPE, registry
+from .models import BATCH_MAX_SIZE, BatchRequest, BatchResponse, User, select_fields
+from .pagination import decode_cursor, encode_cursor, parse_fields
+from .store import UserStore, timestamp_bound
+from .security import authenticate_user_async, create_access_token, get_current_user
 from fastapi.security import OAuth2PasswordRequestForm
 import os
 
 router = APIRouter()
 access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 
-# Stockage temporaire des utilisateurs (en mémoire)
-users_data: List[User] = []
+# Taille maximale d'une page de /users/
+max_page_size = 10000
+
+# Stockage des utilisateurs (en mémoire, indexé par login et par id)
+users_store = UserStore()
+
+# Réponses JSON pré-rendues (liste, détails, recherches), vidées à chaque rechargement :
+# taille totale bornée en octets, réponses trop volumineuses rendues sans être conservées
+response_cache = ResponseCache(
+    max_bytes=int(os.getenv("RESPONSE_CACHE_BYTES", 64 * 1024 * 1024)),
+    max_entry_bytes=int(os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", 8 * 1024 * 1024)),
+)
+
+# Taille (octets) à partir de laquelle une réponse est compressée si le client l'accepte
+compression_min_size = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+
+# Nombre d'utilisateurs lus et envoyés à la fois par /users/export
+export_chunk_size = 1000
+
+# Nombre maximal de logins et d'ids (au total) par requête POST /users/batch ;
+# chaque liste est déjà bornée à BATCH_MAX_SIZE par le modèle BatchRequest
+max_batch_size = BATCH_MAX_SIZE
+
+def cached_json_response(
+    request: Request,
+    key: Hashable,
+    render: Callable[[], Tuple[Any, Dict[str, str]]],
+) -> Response:
+    """
+    Sert une réponse JSON depuis le cache, avec prise en charge de `If-None-Match`.
+
+    Les réponses d'au moins `compression_min_size` octets sont compressées
+    selon l'en-tête `Accept-Encoding` ; la variante compressée est conservée
+    dans le cache avec la réponse.
+
+    Args:
+        request (Request): Requête courante (en-têtes de négociation).
+        key (Hashable): Clé de cache : nom de la route et paramètres validés
+            dont dépend la réponse.
+        render (Callable): Fonction produisant le contenu JSON et les en-têtes
+            (qui ne doivent dépendre que des paramètres de `key`).
+
+    Returns:
+        Response: Corps pré-rendu avec son ETag, ou `304 Not Modified`.
+    """
+    entry = response_cache.get_or_render(users_store.generation, key, render)
+    headers = {}
+    encoding = None
+    if len(entry.body) >= compression_min_size:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+    body, etag = response_cache.encoded(key, entry, encoding)
+    headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**entry.headers, **headers},
+    )
+
+def json_response(request: Request, content: Any) -> Response:
+    """
+    Réponse JSON non mise en cache (orjson, compression négociée comme pour
+    `cached_json_response`).
+
+    Args:
+        request (Request): Requête courante.
+        content (Any): Données JSON-compatibles.
+
+    Returns:
+        Response: Corps JSON, compressé si le client l'accepte.
+    """
+    body = render_json(content)
+    headers = {}
+    if len(body) >= compression_min_size:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            body = compress(body, encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def user_not_found() -> HTTPException:
+    """HTTPException: Erreur 404 commune aux routes de détail."""
+    return HTTPException(status_code=404, detail="Utilisateur non trouvé")
 
 @router.get("/", summary="Page d'accueil")
 async def root():
@@ -36,39 +133,221 @@ async def root():
     return {"message": "Bienvenue sur l'API utilisateurs"}
 
 @router.get("/users/", response_model=List[User], summary="Liste des utilisateurs")
-def get_all_users(current_user: str = Depends(get_current_user)):
+def get_all_users(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=max_page_size),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    has_bio: Optional[bool] = None,
+    current_user: str = Depends(get_current_user),
+):
     """
-    Retourne la liste complète des utilisateurs (protégé par authentification).
+    Retourne la liste des utilisateurs (protégé par authentification).
+
+    Sans pagination ni filtre, la liste complète est renvoyée dans l'ordre du
+    fichier chargé, doublons compris, comme avant l'ajout de la pagination.
+    Dès qu'un paramètre de pagination (`limit`, `offset`, `cursor`) ou un
+    filtre est donné, les utilisateurs sont triés par id, un seul par id
+    (celui chargé en premier). Avec `limit`, la réponse
+    contient les en-têtes `X-Next-Cursor` et `Link` (rel="next") tant qu'il
+    reste des utilisateurs, ainsi que `X-Total-Count` (nombre d'utilisateurs
+    correspondant aux filtres).
+
+    Les filtres de dates sont servis par un index trié des dates de création
+    (recherche dichotomique des bornes) : leur coût dépend du nombre
+    d'utilisateurs retenus, pas de la taille du jeu de données.
 
     Args:
+        request (Request): Requête courante (construction du lien suivant).
+        limit (Optional[int]): Taille de la page.
+        offset (int): Nombre d'utilisateurs à sauter.
+        cursor (Optional[str]): Curseur opaque renvoyé par la page précédente.
+        fields (Optional[str]): Champs à renvoyer, séparés par des virgules.
+        created_after (Optional[datetime]): Comptes créés à partir de cette date (incluse).
+        created_before (Optional[datetime]): Comptes créés avant cette date (exclue).
+        has_bio (Optional[bool]): Utilisateurs avec (true) ou sans (false) bio.
         current_user (str): Utilisateur courant authentifié (injecté).
 
     Returns:
-        List[User]: Liste des utilisateurs.
+        Response: Liste des utilisateurs de la page.
     """
-    return users_data
+    selected = parse_fields(fields)
+    after_id = decode_cursor(cursor) if cursor else None
+    filters = {
+        "created_after": timestamp_bound(created_after) if created_after is not None else None,
+        "created_before": timestamp_bound(created_before) if created_before is not None else None,
+        "has_bio": has_bio,
+    }
+    key = ("users", limit, offset, after_id, None if selected is None else frozenset(selected), *filters.values())
+
+    def render():
+        # Champs lus directement dans les colonnes (validés au chargement) : sérialisation directe
+        if limit is None and offset == 0 and after_id is None and all(value is None for value in filters.values()):
+            records = users_store.all_records()
+            next_id, total = None, len(records)
+        else:
+            records, next_id, total = users_store.page_records(limit=limit, offset=offset, after_id=after_id, **filters)
+        content = records if selected is None else [select_fields(record, selected) for record in records]
+        headers = {"X-Total-Count": str(total)}
+        if next_id is not None:
+            headers["X-Next-Cursor"] = encode_cursor(next_id)
+        return content, headers
+
+    response = cached_json_response(request, key, render)
+    next_cursor = response.headers.get("X-Next-Cursor")
+    if next_cursor is not None:
+        # Lien construit à partir de l'URL de chaque requête (hors clé de cache)
+        next_url = request.url.remove_query_params("offset").include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
+
+@router.get("/users/export", summary="Export NDJSON des utilisateurs")
+def export_users(
+    request: Request,
+    since_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    current_user: str = Depends(get_current_user),
+):
+    """
+    Exporte tous les utilisateurs triés par id, un objet JSON par ligne (NDJSON).
+
+    La réponse est produite en flux, par paquets de `export_chunk_size`
+    utilisateurs : la mémoire utilisée ne dépend pas de la taille du jeu de
+    données et les premières lignes partent immédiatement. L'export porte
+    sur le jeu de données en place au début de la requête, même si un
+    rechargement a lieu pendant le transfert. Le flux est compressé en gzip
+    si le client l'accepte.
+
+    Args:
+        request (Request): Requête courante.
+        since_id (Optional[int]): Si fourni, n'exporte que les utilisateurs d'id
+            strictement supérieur (synchronisation incrémentale : dernier id reçu).
+        fields (Optional[str]): Champs à exporter, séparés par des virgules.
+        current_user (str): Utilisateur authentifié.
+
+    Returns:
+        StreamingResponse: Flux `application/x-ndjson`.
+    """
+    selected = parse_fields(fields)
+    dataset = users_store.dataset
+
+    def lines() -> Iterator[bytes]:
+        after_id = since_id
+        while True:
+            records, next_id, _ = dataset.page_records(limit=export_chunk_size, after_id=after_id)
+            if records:
+                yield b"".join(render_json(select_fields(record, selected)) + b"\n" for record in records)
+            if next_id is None:
+                return
+            after_id = next_id
+
+    headers = {"Vary": "Accept-Encoding"}
+    body = lines()
+    if negotiate_encoding(request.headers.get("accept-encoding"), ("gzip",)) == "gzip":
+        headers["Content-Encoding"] = "gzip"
+        body = gzip_stream(body)
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
 
 @router.get("/users/search", response_model=List[User], summary="Recherche utilisateur")
-def search_users(q: str, current_user: str = Depends(get_current_user)):
+def search_users(request: Request, q: str, prefix: bool = False, in_bio: bool = False, current_user: str = Depends(get_current_user)):
     """
     Recherche d'utilisateurs par login (insensible à la casse).
 
     Args:
+        request (Request): Requête courante.
         q (str): Terme de recherche à filtrer dans les logins.
+        prefix (bool): Si True, ne retient que les logins commençant par `q`.
+        in_bio (bool): Si True, recherche aussi `q` dans les bios.
         current_user (str): Utilisateur authentifié.
 
     Returns:
         List[User]: Liste des utilisateurs correspondant à la recherche.
     """
-    return [user for user in users_data if q.lower() in user.login.lower()]
+    def render():
+        return users_store.search_records(q, prefix=prefix, in_bio=in_bio), {}
+
+    return cached_json_response(request, ("search", q, prefix, in_bio), render)
+
+@router.post("/users/batch", response_model=BatchResponse, summary="Consultation groupée d'utilisateurs")
+def get_users_batch(request: Request, batch: BatchRequest, current_user: str = Depends(get_current_user)):
+    """
+    Retourne en une seule réponse les utilisateurs de nombreux logins et ids.
+
+    Le token, le routage et la sérialisation ne sont payés qu'une fois pour
+    tout le lot, au lieu d'une fois par utilisateur avec `GET /users/{login}`.
+    Toutes les recherches portent sur le même jeu de données, même si un
+    rechargement a lieu pendant la requête. Les doublons de la requête ne
+    sont traités qu'une fois.
+
+    Args:
+        request (Request): Requête courante.
+        batch (BatchRequest): Logins et ids recherchés (`max_batch_size` au total au plus).
+        current_user (str): Utilisateur authentifié.
+
+    Returns:
+        Response: Utilisateurs trouvés et éléments introuvables (`BatchResponse`).
+
+    Raises:
+        HTTPException: Si le lot dépasse `max_batch_size` éléments (413).
+    """
+    if len(batch.logins) + len(batch.ids) > max_batch_size:
+        raise HTTPException(
+            # Valeur littérale : le nom de la constante diffère selon la version de Starlette
+            status_code=413,
+            detail=f"Au plus {max_batch_size} logins et ids par requête",
+        )
+    dataset = users_store.dataset
+    users, missing_logins, missing_ids = [], [], []
+    for login in dict.fromkeys(batch.logins):
+        record = dataset.get_record_by_login(login, ignore_case=batch.ignore_case)
+        if record is None:
+            missing_logins.append(login)
+        else:
+            users.append(record)
+    for user_id in dict.fromkeys(batch.ids):
+        record = dataset.get_record_by_id(user_id)
+        if record is None:
+            missing_ids.append(user_id)
+        else:
+            users.append(record)
+    return json_response(request, {"users": users, "missing": {"logins": missing_logins, "ids": missing_ids}})
+
+@router.get("/users/id/{user_id}", response_model=User, summary="Détails utilisateur par id")
+def get_user_by_id(request: Request, user_id: int, current_user: str = Depends(get_current_user)):
+    """
+    Retourne les détails d'un utilisateur à partir de son identifiant GitHub.
+
+    Args:
+        request (Request): Requête courante.
+        user_id (int): Identifiant GitHub.
+        current_user (str): Utilisateur authentifié.
+
+    Returns:
+        User: Détail du profil utilisateur.
+
+    Raises:
+        HTTPException: Si l'utilisateur n'existe pas.
+    """
+    def render():
+        record = users_store.get_record_by_id(user_id)
+        if record is None:
+            raise user_not_found()
+        return record, {}
+
+    return cached_json_response(request, ("id", user_id), render)
 
 @router.get("/users/{login}", response_model=User, summary="Détails utilisateur")
-def get_user_by_login(login: str, current_user: str = Depends(get_current_user)):
+def get_user_by_login(request: Request, login: str, ignore_case: bool = False, current_user: str = Depends(get_current_user)):
     """
     Retourne les détails d'un utilisateur à partir de son login.
 
     Args:
+        request (Request): Requête courante.
         login (str): Nom d'utilisateur GitHub.
+        ignore_case (bool): Si True, le login est comparé sans tenir compte de la casse.
         current_user (str): Utilisateur authentifié.
 
     Returns:
@@ -77,10 +356,52 @@ def get_user_by_login(login: str, current_user: str = Depends(get_current_user))
     Raises:
         HTTPException: Si l'utilisateur n'existe pas.
     """
-    for user in users_data:
-        if user.login == login:
-            return user
-    raise HTTPException(status_code=404, detail="Utilisateur non trouvé")
+    def render():
+        record = users_store.get_record_by_login(login, ignore_case=ignore_case)
+        if record is None:
+            raise user_not_found()
+        return record, {}
+
+    return cached_json_response(request, ("login", login, ignore_case), render)
+
+@router.post("/admin/reload", summary="Recharge le fichier d'utilisateurs")
+def reload_users(request: Request, current_user: str = Depends(get_current_user)):
+    """
+    Recharge les utilisateurs depuis le fichier de données, sans redémarrage.
+
+    Le nouveau jeu de données est construit pendant que les autres requêtes
+    continuent d'être servies par l'ancien, puis substitué d'un seul coup.
+
+    Args:
+        request (Request): Requête courante (accès au `DatasetReloader` de l'application).
+        current_user (str): Utilisateur authentifié.
+
+    Returns:
+        dict: État du jeu de données après rechargement.
+
+    Raises:
+        HTTPException: Si le fichier est illisible ou invalide (l'ancien jeu est conservé).
+    """
+    reloader = request.app.state.reloader
+    try:
+        reloader.reload(force=True)
+    except (OSError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Rechargement impossible : {e}",
+        )
+    return reloader.status()
+
+@router.get("/metrics", summary="Métriques Prometheus", include_in_schema=False)
+def metrics():
+    """
+    Route publique de collecte Prometheus (à ne pas exposer hors du réseau
+    interne : filtrage au niveau du répartiteur de charge).
+
+    Returns:
+        Response: Métriques au format texte Prometheus.
+    """
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
 
 @router.get("/protected", summary="Route protégée")
 async def protected_route(current_user: str = Depends(get_current_user)):
@@ -111,7 +432,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     username = form_data.username
     password = form_data.password
-    if not authenticate_user(username, password):
+    if not await authenticate_user_async(username, password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Identifiants invalides",
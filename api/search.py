@@ -0,0 +1,296 @@
+"""
+Index de recherche par sous-chaîne et par préfixe.
+
+Les textes sont mis en minuscules une seule fois à la construction. L'index
+associe chaque trigramme (suite de 3 caractères) aux positions des textes qui
+le contiennent : une recherche ne vérifie donc que les candidats de la liste
+de positions la plus courte au lieu de parcourir tout le jeu de données.
+
+`MappedSubstringIndex` offre les mêmes recherches sur des tableaux plats
+(lus dans un snapshot binaire projeté en mémoire) sans rien reconstruire.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+NGRAM_SIZE = 3
+# Séparateur des textes d'un bloc `PackedTexts` (absent des logins GitHub)
+SEPARATOR = b"\x00"
+
+
+def ngrams(text: str) -> set:
+    """
+    Args:
+        text (str): Texte déjà mis en minuscules.
+
+    Returns:
+        set[str]: Ensemble des trigrammes du texte.
+    """
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class SubstringIndex:
+    """
+    Index trigramme + tableau trié permettant des recherches insensibles à la casse.
+
+    Les positions renvoyées sont toujours triées par ordre croissant, ce qui
+    conserve l'ordre d'origine des utilisateurs dans les résultats.
+    """
+
+    def __init__(self, texts: Sequence[str], lowered: bool = False):
+        # `lowered=True` : liste déjà en minuscules, partagée avec l'appelant sans copie
+        self.texts: List[str] = texts if lowered and isinstance(texts, list) else [text.lower() for text in texts]
+
+        postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(self.texts):
+            for gram in ngrams(text):
+                postings.setdefault(gram, []).append(position)
+        # array('i') : 4 octets par position au lieu d'un objet int Python
+        self.postings: Dict[str, array] = {gram: array("i", positions) for gram, positions in postings.items()}
+
+        self.sorted_positions = array("i", sorted(range(len(self.texts)), key=self.texts.__getitem__))
+        self.sorted_texts: List[str] = [self.texts[position] for position in self.sorted_positions]
+
+    def find(self, query: str) -> List[int]:
+        """
+        Recherche les textes contenant `query`.
+
+        Args:
+            query (str): Sous-chaîne recherchée (casse ignorée).
+
+        Returns:
+            List[int]: Positions des textes correspondants, triées.
+        """
+        query = query.lower()
+        if len(query) < NGRAM_SIZE:
+            # Requête trop courte pour l'index : parcours des textes déjà en minuscules
+            return [position for position, text in enumerate(self.texts) if query in text]
+
+        smallest = None
+        for gram in ngrams(query):
+            positions = self.postings.get(gram)
+            if positions is None:
+                return []
+            if smallest is None or len(positions) < len(smallest):
+                smallest = positions
+
+        texts = self.texts
+        return [position for position in smallest if query in texts[position]]
+
+    def find_prefix(self, query: str) -> List[int]:
+        """
+        Recherche les textes commençant par `query` par recherche dichotomique.
+
+        Args:
+            query (str): Préfixe recherché (casse ignorée).
+
+        Returns:
+            List[int]: Positions des textes correspondants, triées.
+        """
+        query = query.lower()
+        start = bisect_left(self.sorted_texts, query)
+        # Tout texte commençant par `query` est inférieur à query + le plus grand caractère Unicode
+        end = bisect_left(self.sorted_texts, query + chr(0x10FFFF), start)
+        return sorted(self.sorted_positions[start:end])
+
+
+def gram_code(gram: str) -> int:
+    """
+    Args:
+        gram (str): Trigramme.
+
+    Returns:
+        int: Code entier du trigramme (3 points de code de 21 bits), triable
+        dans un `array('q')`.
+    """
+    return (ord(gram[0]) << 42) | (ord(gram[1]) << 21) | ord(gram[2])
+
+
+def pack_texts(texts: Iterable[str]) -> Tuple[array, bytes]:
+    """
+    Concatène des textes en un bloc UTF-8, chacun suivi de `SEPARATOR`.
+
+    Args:
+        texts (Iterable[str]): Textes à concaténer.
+
+    Returns:
+        Tuple[array, bytes]: Décalages de début de chaque texte (plus la taille
+        totale en dernier élément) et bloc UTF-8.
+    """
+    offsets = array("q", [0])
+    parts = []
+    size = 0
+    for text in texts:
+        data = text.encode("utf-8") + SEPARATOR
+        parts.append(data)
+        size += len(data)
+        offsets.append(size)
+    return offsets, b"".join(parts)
+
+
+class PackedTexts:
+    """
+    Séquence de textes stockés dans un bloc produit par `pack_texts`, décodés à la demande.
+
+    Le bloc peut être un objet `bytes` ou un `mmap` (les textes commencent
+    alors à `base`) : dans les deux cas, une tranche renvoie des `bytes`.
+    """
+
+    def __init__(self, offsets: Sequence[int], blob, base: int = 0):
+        self.offsets = offsets
+        self.blob = blob
+        self.base = base
+
+    def raw(self, position: int) -> bytes:
+        """
+        Args:
+            position (int): Position du texte.
+
+        Returns:
+            bytes: Texte encodé en UTF-8 (sans séparateur).
+        """
+        return self.blob[self.base + self.offsets[position]:self.base + self.offsets[position + 1] - 1]
+
+    def find(self, query: bytes) -> List[int]:
+        """
+        Recherche les textes contenant `query` directement dans le bloc.
+
+        Args:
+            query (bytes): Sous-chaîne encodée en UTF-8, sans `SEPARATOR`.
+
+        Returns:
+            List[int]: Positions des textes correspondants, triées.
+        """
+        if not query:
+            # Chaîne vide : contenue dans tous les textes (`find` renverrait la fin du bloc)
+            return list(range(len(self)))
+        offsets, base = self.offsets, self.base
+        end = base + offsets[-1]
+        start = base
+        positions = []
+        while True:
+            index = self.blob.find(query, start, end)
+            if index < 0:
+                return positions
+            position = bisect_right(offsets, index - base) - 1
+            positions.append(position)
+            start = base + offsets[position + 1]
+
+    def __getitem__(self, position: int) -> str:
+        return self.raw(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class _SortedTexts:
+    """Vue triée (en octets UTF-8) d'un `PackedTexts`, pour la recherche dichotomique."""
+
+    def __init__(self, texts: PackedTexts, sorted_positions: Sequence[int]):
+        self.texts = texts
+        self.sorted_positions = sorted_positions
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.texts.raw(self.sorted_positions[index])
+
+    def __len__(self) -> int:
+        return len(self.sorted_positions)
+
+
+class MappedSubstringIndex:
+    """
+    Équivalent de `SubstringIndex` construit sur des tableaux plats.
+
+    L'ordre des octets UTF-8 étant celui des points de code, les textes triés
+    par `SubstringIndex` le restent une fois encodés : les mêmes recherches
+    dichotomiques s'appliquent.
+
+    Attributs :
+        texts (PackedTexts)      : Textes en minuscules.
+        sorted_positions (Sequence[int]): Positions triées par texte.
+        sorted_texts (Sequence[bytes])  : Textes encodés, dans l'ordre trié.
+        gram_codes (Sequence[int]): Codes des trigrammes (`gram_code`), triés.
+        gram_offsets (Sequence[int]): Début de la liste de positions de chaque trigramme.
+        postings (Sequence[int]) : Listes de positions concaténées.
+    """
+
+    def __init__(
+        self,
+        texts: PackedTexts,
+        sorted_positions: Sequence[int],
+        gram_codes: Sequence[int],
+        gram_offsets: Sequence[int],
+        postings: Sequence[int],
+    ):
+        self.texts = texts
+        self.sorted_positions = sorted_positions
+        self.sorted_texts = _SortedTexts(texts, sorted_positions)
+        self.gram_codes = gram_codes
+        self.gram_offsets = gram_offsets
+        self.postings = postings
+
+    @staticmethod
+    def flatten(index: SubstringIndex) -> Tuple[array, array, array]:
+        """
+        Aplatit les listes de positions d'un `SubstringIndex`.
+
+        Args:
+            index (SubstringIndex): Index en mémoire.
+
+        Returns:
+            Tuple[array, array, array]: `gram_codes`, `gram_offsets` et `postings`.
+        """
+        gram_codes = array("q")
+        gram_offsets = array("q", [0])
+        postings = array("i")
+        for code, positions in sorted((gram_code(gram), positions) for gram, positions in index.postings.items()):
+            gram_codes.append(code)
+            postings.extend(positions)
+            gram_offsets.append(len(postings))
+        return gram_codes, gram_offsets, postings
+
+    def find(self, query: str) -> List[int]:
+        """
+        Recherche les textes contenant `query`.
+
+        Args:
+            query (str): Sous-chaîne recherchée (casse ignorée).
+
+        Returns:
+            List[int]: Positions des textes correspondants, triées.
+        """
+        query = query.lower()
+        encoded = query.encode("utf-8")
+        if SEPARATOR in encoded:
+            return []
+        if len(query) < NGRAM_SIZE:
+            return self.texts.find(encoded)
+
+        smallest = None
+        for gram in ngrams(query):
+            code = gram_code(gram)
+            index = bisect_left(self.gram_codes, code)
+            if index == len(self.gram_codes) or self.gram_codes[index] != code:
+                return []
+            bounds = (self.gram_offsets[index], self.gram_offsets[index + 1])
+            if smallest is None or bounds[1] - bounds[0] < smallest[1] - smallest[0]:
+                smallest = bounds
+
+        texts = self.texts
+        return [position for position in self.postings[smallest[0]:smallest[1]] if encoded in texts.raw(position)]
+
+    def find_prefix(self, query: str) -> List[int]:
+        """
+        Recherche les textes commençant par `query` par recherche dichotomique.
+
+        Args:
+            query (str): Préfixe recherché (casse ignorée).
+
+        Returns:
+            List[int]: Positions des textes correspondants, triées.
+        """
+        encoded = query.lower().encode("utf-8")
+        start = bisect_left(self.sorted_texts, encoded)
+        end = bisect_left(self.sorted_texts, encoded + chr(0x10FFFF).encode("utf-8"), start)
+        return sorted(self.sorted_positions[start:end])
@@ -3,19 +3,28 @@ Module de gestion de l'authentification avec JWT pour une API FastAPI.
 
 Fonctionnalités :
 - Authentification d'utilisateur via OAuth2 + JWT
+- Mots de passe hachés (PBKDF2-SHA256), vérifiés hors de la boucle asyncio
 - Création de tokens d'accès
 - Validation de token et récupération de l'utilisateur courant
+- Cache des tokens déjà vérifiés (un client réutilise le même token pour de nombreuses requêtes)
 
 Les identifiants sont chargés depuis un fichier `.env` pour des raisons de sécurité.
 """
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
+from threading import Lock
+from typing import Callable, Optional
+import asyncio
+import hashlib
 import os
 from dotenv import load_dotenv
 import secrets
+import time
 
 # Chargement des variables d'environnement
 load_dotenv()
@@ -25,14 +34,160 @@ algorithm = os.getenv("ALGORITHM")
 access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 secret_key = os.getenv("SECRET_KEY")
 
-# Utilisateurs en mémoire (login: password)
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", 200_000))
+
+def hash_password(password: str, salt: Optional[bytes] = None, iterations: int = PASSWORD_HASH_ITERATIONS) -> str:
+    """
+    Hache un mot de passe avec PBKDF2-SHA256 et un sel aléatoire.
+
+    Args:
+        password (str): Mot de passe en clair.
+        salt (Optional[bytes]): Sel (généré si absent).
+        iterations (int): Nombre d'itérations.
+
+    Returns:
+        str: Hachage au format `pbkdf2_sha256$<itérations>$<sel>$<empreinte>`.
+    """
+    salt = salt or secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{PASSWORD_HASH_ALGORITHM}${iterations}${salt.hex()}${digest.hex()}"
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """
+    Vérifie un mot de passe contre un hachage produit par `hash_password`.
+
+    Calcul volontairement coûteux (CPU) : à appeler hors de la boucle asyncio.
+
+    Args:
+        password (str): Mot de passe fourni.
+        password_hash (str): Hachage enregistré.
+
+    Returns:
+        bool: True si le mot de passe correspond.
+    """
+    try:
+        algorithm_name, iterations, salt, digest = password_hash.split("$")
+        if algorithm_name != PASSWORD_HASH_ALGORITHM:
+            return False
+        candidate = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+    except ValueError:
+        return False
+    return secrets.compare_digest(candidate.hex(), digest)
+
+def load_password_hash(value: Optional[str]) -> Optional[str]:
+    """
+    Args:
+        value (Optional[str]): Mot de passe du .env, en clair ou déjà haché.
+
+    Returns:
+        Optional[str]: Hachage du mot de passe (None si absent).
+    """
+    if value is None or value.startswith(PASSWORD_HASH_ALGORITHM + "$"):
+        return value
+    return hash_password(value)
+
+# Utilisateurs en mémoire (login: hachage du mot de passe) ; PASSWD peut être
+# fourni en clair ou déjà haché (voir `hash_password`)
 USERS = {
-    os.getenv("ADMIN"): os.getenv("PASSWD")
+    os.getenv("ADMIN"): load_password_hash(os.getenv("PASSWD"))
 }
 
+# Hachage de référence : un login inconnu coûte autant qu'un mauvais mot de passe
+_DUMMY_PASSWORD_HASH = hash_password(secrets.token_hex(16))
+
+# Threads dédiés à la vérification des mots de passe : une rafale de logins
+# attend son tour ici au lieu d'occuper la boucle asyncio ou le pool des routes
+auth_executor = ThreadPoolExecutor(max_workers=int(os.getenv("AUTH_WORKERS", 4)), thread_name_prefix="auth")
+
 # Schéma OAuth2 pour FastAPI
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+class TokenCache:
+    """
+    Cache LRU borné des tokens JWT déjà vérifiés.
+
+    Une entrée expire au plus tard à la date `exp` du token, et au plus tard
+    `ttl` secondes après sa vérification. Les tokens sont indexés par leur
+    empreinte : le cache ne conserve pas les tokens eux-mêmes. Les tokens
+    invalides ne sont jamais mis en cache.
+
+    Attributs :
+        maxsize (int) : Nombre maximal de tokens conservés.
+        ttl (float)   : Durée maximale (s) d'une entrée.
+        hits (int)    : Vérifications évitées.
+        misses (int)  : Tokens absents ou expirés (vérification complète).
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        """
+        Args:
+            token (str): Token JWT reçu.
+
+        Returns:
+            Optional[str]: Nom d'utilisateur si le token a déjà été vérifié et
+            n'a pas expiré, sinon None.
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, username: str, exp: Optional[float] = None) -> None:
+        """
+        Mémorise un token vérifié.
+
+        Args:
+            token (str): Token JWT.
+            username (str): Utilisateur extrait du token.
+            exp (Optional[float]): Date d'expiration du token (epoch).
+        """
+        if self.maxsize <= 0:
+            return
+        expires_at = self.clock() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (username, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Tokens déjà vérifiés (taille et durée réglables dans le .env)
+token_cache = TokenCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_SIZE", 10000)),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL", 300)),
+)
+
 def authenticate_user(username: str, password: str) -> bool:
     """
     Vérifie si un nom d'utilisateur et mot de passe sont valides.
@@ -44,8 +199,26 @@ def authenticate_user(username: str, password: str) -> bool:
     Returns:
         bool: True si les identifiants sont valides, sinon False.
     """
-    correct_password = USERS.get(username)
-    return bool(correct_password and secrets.compare_digest(password, correct_password))
+    password_hash = USERS.get(username)
+    if not password_hash:
+        verify_password(password, _DUMMY_PASSWORD_HASH)
+        return False
+    return verify_password(password, password_hash)
+
+async def authenticate_user_async(username: str, password: str) -> bool:
+    """
+    Variante de `authenticate_user` pour les routes asynchrones : le hachage
+    est calculé dans `auth_executor`, la boucle asyncio reste disponible.
+
+    Args:
+        username (str): Nom d'utilisateur fourni.
+        password (str): Mot de passe fourni.
+
+    Returns:
+        bool: True si les identifiants sont valides, sinon False.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(auth_executor, authenticate_user, username, password)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
@@ -68,6 +241,9 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
     """
     Décode un token JWT et retourne le nom d'utilisateur associé.
 
+    Un token déjà vérifié et non expiré est servi depuis `token_cache` sans
+    nouveau calcul de signature.
+
     Args:
         token (str): Token JWT fourni via OAuth2.
 
@@ -82,6 +258,9 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
         detail="Token invalide ou expiré",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    username = token_cache.get(token)
+    if username is not None:
+        return username
     try:
         payload = jwt.decode(token, secret_key, algorithms=[algorithm])
         username: str = payload.get("sub")
@@ -89,4 +268,5 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    token_cache.put(token, username, payload.get("exp"))
     return username
@@ -0,0 +1,217 @@
+"""
+Snapshot binaire du jeu de données, projeté en mémoire (mmap).
+
+`filtered_users.py --snapshot` écrit, à côté du JSON filtré, un fichier
+contenant les colonnes du `UserDataset` et ses index déjà calculés (ids
+triés, logins triés, listes de positions des trigrammes). Au démarrage,
+l'API projette ce fichier en mémoire au lieu de relire le JSON et de
+valider chaque utilisateur : le chargement ne dépend plus de la taille des
+données, et plusieurs workers uvicorn partagent les mêmes pages mémoire
+(cache de pages du système).
+
+Format (entiers dans l'ordre d'octets de la machine qui l'a écrit) :
+    MAGIC | longueur de l'en-tête (uint64) | en-tête JSON | sections alignées sur 8 octets
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from .models import User
+from .search import MappedSubstringIndex, PackedTexts, pack_texts
+from .store import CREATED_AT_SIZE, UserDataset, format_created_at
+
+MAGIC = b"GHUSNAP1"
+VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+
+
+def _pad(size: int) -> bytes:
+    return b"\0" * (-size % 8)
+
+
+def write_snapshot(users: Iterable[User], path: str) -> int:
+    """
+    Construit le jeu de données et l'écrit sous forme de snapshot binaire.
+
+    Le fichier est écrit à côté puis renommé : un serveur qui surveille
+    `path` ne voit jamais de snapshot incomplet.
+
+    Args:
+        users (Iterable[User]): Utilisateurs, dans l'ordre du fichier source.
+        path (str): Fichier de sortie (extension `.snap`).
+
+    Returns:
+        int: Nombre d'utilisateurs écrits.
+    """
+    dataset = UserDataset(users)
+    count = len(dataset)
+    bios = [dataset.bio(position) for position in range(count)]
+    login_offsets, logins = pack_texts(dataset.logins)
+    lower_offsets, lowers = pack_texts(dataset.logins_lower)
+    bio_offsets, bio_blob = pack_texts(bio or "" for bio in bios)
+    gram_codes, gram_offsets, postings = MappedSubstringIndex.flatten(dataset.login_index)
+
+    # (nom, contenu, format des éléments ; None pour un bloc de textes)
+    sections = [
+        ("ids", dataset.ids, "q"),
+        ("created_at", dataset.created_at, "q"),
+        ("created_text", dataset.created_text, None),
+        ("sorted_ids", dataset.sorted_ids, "q"),
+        ("id_order", dataset.id_order, "q"),
+        ("created_sorted", dataset.created_sorted, "q"),
+        ("created_order", dataset.created_order, "q"),
+        ("login_offsets", login_offsets, "q"),
+        ("logins", logins, None),
+        ("lower_offsets", lower_offsets, "q"),
+        ("lowers", lowers, None),
+        ("sorted_logins", dataset.login_index.sorted_positions, "i"),
+        ("gram_codes", gram_codes, "q"),
+        ("gram_offsets", gram_offsets, "q"),
+        ("postings", postings, "i"),
+        ("bio_offsets", bio_offsets, "q"),
+        ("bios", bio_blob, None),
+        ("bio_missing", bytes(bio is None for bio in bios), "B"),
+    ]
+
+    layout: Dict[str, Tuple[int, int, Optional[str]]] = {}
+    offset = 0
+    for name, data, typecode in sections:
+        size = len(memoryview(data).cast("B"))
+        layout[name] = (offset, size, typecode)
+        offset += size + len(_pad(size))
+
+    header = json.dumps({
+        "version": VERSION,
+        "byteorder": sys.byteorder,
+        "count": count,
+        "sections": layout,
+        "created_at_raw": dataset._created_at_raw,
+        "avatar_urls": dataset._avatar_urls,
+    }).encode("utf-8")
+    header += _pad(len(MAGIC) + 8 + len(header))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for name, data, typecode in sections:
+            data = memoryview(data).cast("B")
+            f.write(data)
+            f.write(_pad(len(data)))
+    os.replace(tmp_path, path)
+    return count
+
+
+class SnapshotDataset(UserDataset):
+    """
+    `UserDataset` dont les colonnes et les index sont lus dans un snapshot projeté en mémoire.
+
+    Même interface que `UserDataset` pour le `UserStore` ; rien n'est
+    reconstruit au chargement, les pages sont lues à la demande par le système.
+    """
+
+    def __init__(self, path: str):
+        # Pas d'appel à UserDataset.__init__ : les colonnes viennent du fichier
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Snapshot invalide : {path} est vide")
+
+        if len(self._mmap) < len(MAGIC) + 8 or self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Snapshot invalide : {path}")
+        (header_size,) = struct.unpack("<Q", self._mmap[len(MAGIC):len(MAGIC) + 8])
+        data_start = len(MAGIC) + 8 + header_size
+        header = json.loads(self._mmap[len(MAGIC) + 8:data_start].rstrip(b"\0"))
+        if header["version"] != VERSION or header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Snapshot incompatible : {path} (version {header['version']}, {header['byteorder']})")
+
+        view = memoryview(self._mmap)
+        sections = {}
+        for name, (offset, size, typecode) in header["sections"].items():
+            start = data_start + offset
+            # Les blocs de textes sont lus directement dans le mmap (tranches en bytes)
+            sections[name] = view[start:start + size].cast(typecode) if typecode else start
+
+        self.ids = sections["ids"]
+        self.created_at = sections["created_at"]
+        self.sorted_ids = sections["sorted_ids"]
+        self.id_order = sections["id_order"]
+        self.logins = PackedTexts(sections["login_offsets"], self._mmap, sections["logins"])
+        self._created_at_raw = {int(k): v for k, v in header["created_at_raw"].items()}
+        if "created_text" in sections:
+            self.created_text = self._mmap
+            self._created_text_base = sections["created_text"]
+        else:
+            # Snapshot antérieur au bloc des dates d'origine : dates reformatées une fois ici
+            self.created_text = b"".join(
+                bytes(CREATED_AT_SIZE) if position in self._created_at_raw
+                else format_created_at(timestamp).encode("ascii")
+                for position, timestamp in enumerate(self.created_at)
+            )
+            self._created_text_base = 0
+        self._avatar_urls = {int(k): v for k, v in header["avatar_urls"].items()}
+        self._bio_texts = PackedTexts(sections["bio_offsets"], self._mmap, sections["bios"])
+        self._bio_missing = sections["bio_missing"]
+        self.login_index = MappedSubstringIndex(
+            PackedTexts(sections["lower_offsets"], self._mmap, sections["lowers"]),
+            sections["sorted_logins"],
+            sections["gram_codes"],
+            sections["gram_offsets"],
+            sections["postings"],
+        )
+        self._bio_index = None
+        self._bio_orders = {}
+        self._date_orders = OrderedDict()
+        if "created_sorted" in sections:
+            self.created_sorted = sections["created_sorted"]
+            self.created_order = sections["created_order"]
+        else:
+            # Snapshot antérieur aux filtres de dates : index reconstruit en mémoire
+            self.created_sorted, self.created_order = self.build_created_index()
+
+    def position_by_login(self, login: str, ignore_case: bool = False) -> Optional[int]:
+        """
+        Recherche dichotomique dans les logins triés (O(log N)).
+
+        Args:
+            login (str): Login GitHub.
+            ignore_case (bool): Si True, la comparaison ignore la casse.
+
+        Returns:
+            Optional[int]: Position de l'utilisateur, sinon None.
+        """
+        key = login.lower().encode("utf-8")
+        index = self.login_index
+        i = bisect_left(index.sorted_texts, key)
+        # Tri stable : à login en minuscules égal, le premier du fichier vient en premier
+        while i < len(index.sorted_texts) and index.sorted_texts[i] == key:
+            position = index.sorted_positions[i]
+            if ignore_case or self.logins[position] == login:
+                return position
+            i += 1
+        return None
+
+    def has_bio(self, position: int) -> bool:
+        """Voir `UserDataset.has_bio` (chaque texte est suivi d'un séparateur)."""
+        offsets = self._bio_texts.offsets
+        return offsets[position + 1] - offsets[position] > 1
+
+    def bio(self, position: int) -> Optional[str]:
+        """
+        Args:
+            position (int): Position de l'utilisateur.
+
+        Returns:
+            Optional[str]: Bio, décodée à la demande (None si absente).
+        """
+        if self._bio_missing[position]:
+            return None
+        return self._bio_texts[position]
+
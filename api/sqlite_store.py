@@ -0,0 +1,288 @@
+"""
+Moteur de stockage SQLite pour l'API.
+
+Alternative au stockage en mémoire pour les jeux de données qui ne tiennent
+pas dans la RAM de chaque worker : la base est construite une fois (par
+`filtered_users.py --sqlite`) puis ouverte en lecture seule. Les pages du
+fichier sont projetées en mémoire (`PRAGMA mmap_size`) et donc partagées par
+tous les workers uvicorn via le cache du système.
+
+Schéma :
+- `users` : une ligne par utilisateur, `position` = ordre du fichier source ;
+  index sur le login en minuscules, sur l'id et sur la date de création
+  (timestamp `created_ts`, pour les filtres de dates) ;
+- `users_fts` : index plein texte FTS5 à trigrammes (sans contenu) sur le
+  login et la bio en minuscules, pour les recherches par sous-chaîne.
+
+Les réponses sont identiques à celles de `UserDataset` (mêmes règles de
+doublons, de casse et d'ordre).
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from queue import Empty, SimpleQueue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .models import User
+from .search import NGRAM_SIZE
+from .store import parse_created_at, parse_timestamp
+
+SQLITE_SUFFIXES = (".sqlite", ".db")
+# Taille maximale projetée en mémoire par connexion (pages partagées entre workers)
+MMAP_SIZE = 1 << 30
+USER_FIELDS = ("login", "id", "created_at", "avatar_url", "bio")
+USER_COLUMNS = ", ".join(USER_FIELDS)
+
+SCHEMA = """
+CREATE TABLE users (
+    position INTEGER PRIMARY KEY,
+    login TEXT NOT NULL,
+    login_lower TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    avatar_url TEXT NOT NULL,
+    bio TEXT,
+    first_id INTEGER NOT NULL,
+    created_ts INTEGER
+);
+CREATE VIRTUAL TABLE users_fts USING fts5(login_lower, bio_lower, content='', tokenize='trigram');
+"""
+
+INDEXES = """
+CREATE INDEX users_login_lower ON users (login_lower, position);
+CREATE INDEX users_id ON users (id, position);
+CREATE INDEX users_first_id ON users (id) WHERE first_id;
+CREATE INDEX users_created ON users (created_ts) WHERE first_id;
+"""
+
+
+def write_sqlite(users: Iterable[User], path: str, batch_size: int = 10000) -> int:
+    """
+    Construit la base SQLite des utilisateurs.
+
+    La base est écrite à côté puis renommée : un serveur qui surveille `path`
+    n'ouvre jamais une base incomplète.
+
+    Args:
+        users (Iterable[User]): Utilisateurs, dans l'ordre du fichier source.
+        path (str): Fichier de sortie (extension `.sqlite`).
+        batch_size (int): Nombre de lignes insérées par lot.
+
+    Returns:
+        int: Nombre d'utilisateurs écrits.
+    """
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    db.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + SCHEMA)
+
+    seen_ids = set()
+    rows, fts_rows = [], []
+    count = 0
+
+    def flush():
+        db.executemany("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        db.executemany("INSERT INTO users_fts (rowid, login_lower, bio_lower) VALUES (?, ?, ?)", fts_rows)
+        rows.clear()
+        fts_rows.clear()
+
+    for position, user in enumerate(users):
+        login_lower = user.login.lower()
+        # En cas d'id en double, seul le premier utilisateur est paginé
+        first_id = user.id not in seen_ids
+        seen_ids.add(user.id)
+        created_ts = parse_created_at(user.created_at)
+        if created_ts is None:
+            created_ts = parse_timestamp(user.created_at)
+        rows.append((position, user.login, login_lower, user.id, user.created_at, user.avatar_url, user.bio, first_id, created_ts))
+        fts_rows.append((position, login_lower, (user.bio or "").lower()))
+        count += 1
+        if len(rows) >= batch_size:
+            flush()
+    flush()
+
+    # Index créés après l'insertion : bien plus rapide qu'une mise à jour ligne à ligne
+    db.executescript(INDEXES + "ANALYZE;")
+    db.commit()
+    db.close()
+    os.replace(tmp_path, path)
+    return count
+
+
+def _contains(text: Optional[str], query: str) -> bool:
+    """Équivalent SQL de `query in text.lower()` (mêmes règles de casse que Python)."""
+    return text is not None and query in text.lower()
+
+
+def _match_phrase(column: str, query: str) -> str:
+    """Requête FTS5 : `query` comme sous-chaîne exacte dans `column`."""
+    return f'{column} : "{query.replace(chr(34), chr(34) * 2)}"'
+
+
+class SqliteDataset:
+    """
+    Jeu de données lu dans une base SQLite (même interface que `UserDataset`).
+
+    Les connexions en lecture seule sont réutilisées d'une requête à l'autre :
+    chaque thread du pool de FastAPI en emprunte une le temps d'une requête.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pool: "SimpleQueue[sqlite3.Connection]" = SimpleQueue()
+        try:
+            with self._connection() as db:
+                self._count = db.execute("SELECT count(*) FROM users").fetchone()[0]
+                self._total = db.execute("SELECT count(*) FROM users WHERE first_id").fetchone()[0]
+                columns = {row[1] for row in db.execute("PRAGMA table_info(users)")}
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Base SQLite invalide : {path} ({e})")
+        if "created_ts" not in columns:
+            raise ValueError(f"Base SQLite d'un ancien format : {path} (à reconstruire avec filtered_users.py --sqlite)")
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        except sqlite3.OperationalError as e:
+            raise OSError(f"Base SQLite illisible : {self.path} ({e})")
+        db.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        db.create_function("contains", 2, _contains, deterministic=True)
+        return db
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            db = self._pool.get_nowait()
+        except Empty:
+            db = self._connect()
+        try:
+            yield db
+        finally:
+            self._pool.put(db)
+
+    def _query(self, sql: str, parameters: Tuple = ()) -> List[tuple]:
+        with self._connection() as db:
+            return db.execute(sql, parameters).fetchall()
+
+    @staticmethod
+    def _record(row: tuple) -> Dict[str, Any]:
+        return dict(zip(USER_FIELDS, row))
+
+    @staticmethod
+    def _user(record: Optional[Dict[str, Any]]) -> Optional[User]:
+        return None if record is None else User.model_construct(**record)
+
+    def all(self) -> List[User]:
+        """List[User]: Tous les utilisateurs, dans l'ordre de chargement."""
+        return [self._user(record) for record in self.all_records()]
+
+    def all_records(self) -> List[Dict[str, Any]]:
+        """Voir `UserStore.all_records`."""
+        rows = self._query(f"SELECT {USER_COLUMNS} FROM users ORDER BY position")
+        return [self._record(row) for row in rows]
+
+    def get_record_by_login(self, login: str, ignore_case: bool = False) -> Optional[Dict[str, Any]]:
+        """Voir `UserStore.get_record_by_login`."""
+        rows = self._query(
+            f"SELECT {USER_COLUMNS} FROM users WHERE login_lower = ? ORDER BY position", (login.lower(),)
+        )
+        for row in rows:
+            if ignore_case or row[0] == login:
+                return self._record(row)
+        return None
+
+    def get_record_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Voir `UserStore.get_record_by_id`."""
+        rows = self._query(f"SELECT {USER_COLUMNS} FROM users WHERE id = ? ORDER BY position LIMIT 1", (user_id,))
+        return self._record(rows[0]) if rows else None
+
+    def get_by_login(self, login: str, ignore_case: bool = False) -> Optional[User]:
+        """Voir `UserStore.get_by_login`."""
+        return self._user(self.get_record_by_login(login, ignore_case))
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Voir `UserStore.get_by_id`."""
+        return self._user(self.get_record_by_id(user_id))
+
+    def page_records(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """Voir `UserStore.page_records`."""
+        conditions, parameters = ["first_id"], []
+        if created_after is not None:
+            conditions.append("created_ts >= ?")
+            parameters.append(created_after)
+        if created_before is not None:
+            conditions.append("created_ts < ?")
+            parameters.append(created_before)
+        if has_bio is not None:
+            conditions.append("(bio IS NOT NULL AND bio != '') = ?")
+            parameters.append(has_bio)
+        where = " AND ".join(conditions)
+        total = self._total
+        if len(conditions) > 1:
+            total = self._query(f"SELECT count(*) FROM users WHERE {where}", tuple(parameters))[0][0]
+
+        # Une ligne de plus que demandé : indique s'il existe une page suivante
+        rows = self._query(
+            f"SELECT {USER_COLUMNS} FROM users WHERE {where} AND id > ? ORDER BY id LIMIT ? OFFSET ?",
+            (*parameters, after_id if after_id is not None else -(1 << 63), -1 if limit is None else limit + 1, offset),
+        )
+        has_next = limit is not None and len(rows) > limit
+        records = [self._record(row) for row in rows[:limit]]
+        next_id = records[-1]["id"] if records and has_next else None
+        return records, next_id, total
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[User], Optional[int], int]:
+        """Voir `UserStore.page`."""
+        records, next_id, total = self.page_records(limit, offset, after_id, created_after, created_before, has_bio)
+        return [self._user(record) for record in records], next_id, total
+
+    def search_records(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[Dict[str, Any]]:
+        """Voir `UserStore.search_records`."""
+        q = q.lower()
+        conditions, parameters = [], []
+        if prefix:
+            # Bornes de la plage de logins commençant par `q` (utilise l'index)
+            conditions.append("(login_lower >= ? AND login_lower < ?)")
+            parameters += [q, q + chr(0x10FFFF)]
+        elif len(q) >= NGRAM_SIZE:
+            conditions.append("position IN (SELECT rowid FROM users_fts WHERE users_fts MATCH ?)")
+            parameters.append(_match_phrase("login_lower", q))
+        else:
+            # Requête trop courte pour les trigrammes : parcours de la table
+            conditions.append("contains(login_lower, ?)")
+            parameters.append(q)
+        if in_bio:
+            if len(q) >= NGRAM_SIZE:
+                conditions.append("position IN (SELECT rowid FROM users_fts WHERE users_fts MATCH ?)")
+                parameters.append(_match_phrase("bio_lower", q))
+            else:
+                conditions.append("contains(bio, ?)")
+                parameters.append(q)
+        rows = self._query(
+            f"SELECT {USER_COLUMNS} FROM users WHERE {' OR '.join(conditions)} ORDER BY position", tuple(parameters)
+        )
+        return [self._record(row) for row in rows]
+
+    def search(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[User]:
+        """Voir `UserStore.search`."""
+        return [self._user(record) for record in self.search_records(q, prefix, in_bio)]
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,848 @@
+"""
+Stockage en mémoire des utilisateurs GitHub et index de recherche associés.
+
+Le jeu de données est chargé une seule fois puis n'est plus modifié : chaque
+chargement construit un nouveau `UserDataset` (colonnes + index) qui remplace
+l'ancien en une seule affectation. Les routes ne voient donc jamais des
+colonnes et des index désynchronisés.
+
+Pour tenir plusieurs millions d'utilisateurs par worker, les données sont
+rangées en colonnes compactes plutôt qu'en objets `User` :
+- ids et dates de création dans des `array` d'entiers 64 bits, dates
+  d'origine dans un bloc ASCII à largeur fixe (relues sans reformatage) ;
+- URL d'avatar déduite de l'id quand elle suit le format de GitHub ;
+- bios concaténées dans un seul bloc UTF-8, décodées à la demande.
+Les routes lisent les utilisateurs en dictionnaires directement tirés des
+colonnes (`page_records`, `search_records`...) ; les objets `User` ne sont
+construits que pour les méthodes qui les renvoient (`page`, `search`...).
+
+`UserStore` délègue les requêtes à un moteur de stockage (`UserBackend`) :
+ce module en fournit la version en mémoire, `snapshot.py` et `sqlite_store.py`
+les versions projetée en mémoire et SQLite.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+from .models import User
+from .search import SubstringIndex
+
+# URL d'avatar attribuée par GitHub, reconstruite à partir de l'id
+AVATAR_URL_TEMPLATE = "https://avatars.githubusercontent.com/u/{id}?v=4"
+CREATED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Longueur d'une date au format GitHub (largeur du bloc des dates d'origine)
+CREATED_AT_SIZE = 20
+# Nombre de plages de dates dont les positions triées par id restent en mémoire
+DATE_ORDER_CACHE_SIZE = 8
+
+
+def parse_created_at(value: str) -> Optional[int]:
+    """
+    Convertit une date GitHub (`2015-01-01T23:59:36Z`) en timestamp Unix.
+
+    Args:
+        value (str): Date au format ISO 8601.
+
+    Returns:
+        Optional[int]: Timestamp (s), ou None si la date ne peut pas être
+        restituée à l'identique à partir du timestamp.
+    """
+    if len(value) != 20 or value[-1] != "Z":
+        return None
+    try:
+        timestamp = int(datetime.fromisoformat(value[:-1] + "+00:00").timestamp())
+    except ValueError:
+        return None
+    return timestamp if format_created_at(timestamp) == value else None
+
+
+def parse_timestamp(value: str) -> Optional[int]:
+    """
+    Variante tolérante de `parse_created_at` pour les dates hors format GitHub
+    (ex. `2015-01-01`), utilisée par l'index des dates de création.
+
+    Args:
+        value (str): Date ISO 8601 (sans fuseau : UTC).
+
+    Returns:
+        Optional[int]: Timestamp (s), ou None si la date est illisible.
+    """
+    try:
+        date = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return timestamp_bound(date, upper=False)
+
+
+def timestamp_bound(value: datetime, upper: bool = True) -> int:
+    """
+    Convertit une date en borne entière pour l'index des dates de création.
+
+    Args:
+        value (datetime): Date (sans fuseau : UTC).
+        upper (bool): Si True, arrondi à la seconde supérieure, sinon inférieure.
+
+    Returns:
+        int: Timestamp (s).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    timestamp = value.timestamp()
+    return math.ceil(timestamp) if upper else math.floor(timestamp)
+
+
+def format_created_at(timestamp: int) -> str:
+    """
+    Args:
+        timestamp (int): Timestamp Unix (s).
+
+    Returns:
+        str: Date au format GitHub (`AAAA-MM-JJTHH:MM:SSZ`).
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(CREATED_AT_FORMAT)
+
+
+class UserDataset:
+    """
+    Instantané immuable des utilisateurs, rangés en colonnes, et de leurs index.
+
+    Chaque utilisateur est désigné par sa position dans l'ordre du fichier source.
+
+    Attributs :
+        logins (List[str])              : Logins.
+        logins_lower (List[str])        : Logins en minuscules (partagés avec `login_index`).
+        ids (array)                     : Identifiants GitHub.
+        created_at (array)              : Dates de création (timestamps Unix).
+        created_text (bytes)            : Dates de création d'origine, `CREATED_AT_SIZE`
+            octets ASCII par utilisateur (zéros pour les dates hors format).
+        by_login_lower (Dict[str, int]) : Login en minuscules → position.
+        sorted_ids (array)              : Ids uniques triés (pagination, recherche par id).
+        id_order (array)                : Positions alignées sur `sorted_ids`.
+        created_sorted (array)          : Dates de création triées (filtres de dates).
+        created_order (array)           : Positions alignées sur `created_sorted`.
+        login_index (SubstringIndex)    : Index de recherche sur les logins.
+    """
+
+    def __init__(self, users: Iterable[User] = ()):
+        self.logins: List[str] = []
+        self.logins_lower: List[str] = []
+        self.ids = array("q")
+        self.created_at = array("q")
+        self.by_login_lower: Dict[str, int] = {}
+        created_text = bytearray()
+
+        # Valeurs hors format standard, conservées telles quelles (rares)
+        self._created_at_raw: Dict[int, str] = {}
+        self._avatar_urls: Dict[int, str] = {}
+        # Logins ne différant d'un login précédent que par la casse
+        self._by_login_exact: Dict[str, int] = {}
+
+        bios = bytearray()
+        self._bio_offsets = array("q", [0])
+        self._bio_missing = bytearray()
+
+        for position, user in enumerate(users):
+            login = user.login
+            login_lower = login.lower()
+            if login_lower == login:
+                login_lower = login
+            self.logins.append(login)
+            self.logins_lower.append(login_lower)
+            self.ids.append(user.id)
+            # En cas de doublon, le premier utilisateur rencontré est conservé
+            first = self.by_login_lower.setdefault(login_lower, position)
+            if first != position and self.logins[first] != login:
+                self._by_login_exact.setdefault(login, position)
+
+            timestamp = parse_created_at(user.created_at)
+            if timestamp is None:
+                self._created_at_raw[position] = user.created_at
+                timestamp = 0
+                created_text += bytes(CREATED_AT_SIZE)
+            else:
+                created_text += user.created_at.encode("ascii")
+            self.created_at.append(timestamp)
+
+            if user.avatar_url != AVATAR_URL_TEMPLATE.format(id=user.id):
+                self._avatar_urls[position] = user.avatar_url
+
+            self._bio_missing.append(user.bio is None)
+            if user.bio:
+                bios += user.bio.encode("utf-8")
+            self._bio_offsets.append(len(bios))
+
+        self._bios = bytes(bios)
+        self.created_text = bytes(created_text)
+        # Début du bloc des dates dans `created_text` (non nul pour un snapshot projeté)
+        self._created_text_base = 0
+
+        self.sorted_ids = array("q")
+        self.id_order = array("q")
+        for position in sorted(range(len(self.ids)), key=self.ids.__getitem__):
+            user_id = self.ids[position]
+            if not self.sorted_ids or self.sorted_ids[-1] != user_id:
+                self.sorted_ids.append(user_id)
+                self.id_order.append(position)
+        self.created_sorted, self.created_order = self.build_created_index()
+
+        self.login_index = SubstringIndex(self.logins_lower, lowered=True)
+        self._bio_index: Optional[SubstringIndex] = None
+        self._bio_orders: Dict[bool, array] = {}
+        self._date_orders: "OrderedDict[Tuple, array]" = OrderedDict()
+
+    def build_created_index(self) -> Tuple[array, array]:
+        """
+        Trie par date de création les utilisateurs listés par `page` (un par id).
+
+        Les dates sont déjà converties en timestamps au chargement ; les
+        dates hors format sont relues une fois ici et les dates illisibles
+        sont absentes de l'index (jamais retenues par un filtre de dates).
+
+        Returns:
+            Tuple[array, array]: Timestamps triés et positions correspondantes.
+        """
+        timestamps = {
+            position: parse_timestamp(raw) for position, raw in self._created_at_raw.items()
+        }
+
+        def timestamp(position: int) -> Optional[int]:
+            if position in timestamps:
+                return timestamps[position]
+            return self.created_at[position]
+
+        positions = sorted((position for position in self.id_order if timestamp(position) is not None), key=timestamp)
+        return array("q", (timestamp(position) for position in positions)), array("q", positions)
+
+    def position_by_login(self, login: str, ignore_case: bool = False) -> Optional[int]:
+        """
+        Args:
+            login (str): Login GitHub.
+            ignore_case (bool): Si True, la comparaison ignore la casse.
+
+        Returns:
+            Optional[int]: Position de l'utilisateur, sinon None.
+        """
+        position = self.by_login_lower.get(login.lower())
+        if position is None or ignore_case or self.logins[position] == login:
+            return position
+        return self._by_login_exact.get(login)
+
+    def position_by_id(self, user_id: int) -> Optional[int]:
+        """
+        Recherche dichotomique d'un id (O(log N), sans dictionnaire d'entiers Python).
+
+        Args:
+            user_id (int): Identifiant GitHub.
+
+        Returns:
+            Optional[int]: Position de l'utilisateur, sinon None.
+        """
+        index = bisect_left(self.sorted_ids, user_id)
+        if index < len(self.sorted_ids) and self.sorted_ids[index] == user_id:
+            return self.id_order[index]
+        return None
+
+    def bio(self, position: int) -> Optional[str]:
+        """
+        Args:
+            position (int): Position de l'utilisateur.
+
+        Returns:
+            Optional[str]: Bio, décodée à la demande (None si absente).
+        """
+        if self._bio_missing[position]:
+            return None
+        return self._bios[self._bio_offsets[position]:self._bio_offsets[position + 1]].decode("utf-8")
+
+    def has_bio(self, position: int) -> bool:
+        """
+        Args:
+            position (int): Position de l'utilisateur.
+
+        Returns:
+            bool: True si l'utilisateur a une bio non vide (sans la décoder).
+        """
+        return self._bio_offsets[position + 1] > self._bio_offsets[position]
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """
+        Lit les champs de l'utilisateur d'une position directement dans les
+        colonnes, sans objet `User` ni nouvelle validation (les données l'ont
+        déjà été au chargement) : c'est le chemin de sérialisation des routes.
+
+        Args:
+            position (int): Position de l'utilisateur.
+
+        Returns:
+            Dict[str, Any]: Champs de l'utilisateur, dans l'ordre du modèle `User`.
+        """
+        return self.records((position,))[0]
+
+    def records(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Version par lot de `record` (colonnes lues une fois pour tout le lot).
+
+        Args:
+            positions (Iterable[int]): Positions des utilisateurs.
+
+        Returns:
+            List[Dict[str, Any]]: Champs des utilisateurs, dans l'ordre des positions.
+        """
+        ids, logins, bio = self.ids, self.logins, self.bio
+        created_text, base = self.created_text, self._created_text_base
+        created_at_raw, avatar_urls = self._created_at_raw, self._avatar_urls
+        avatar_prefix, avatar_suffix = AVATAR_URL_TEMPLATE.split("{id}")
+        records = []
+        for position in positions:
+            user_id = ids[position]
+            created_at = created_at_raw.get(position) if created_at_raw else None
+            if created_at is None:
+                start = base + position * CREATED_AT_SIZE
+                created_at = created_text[start:start + CREATED_AT_SIZE].decode("ascii")
+            avatar_url = avatar_urls.get(position) if avatar_urls else None
+            if avatar_url is None:
+                avatar_url = f"{avatar_prefix}{user_id}{avatar_suffix}"
+            records.append({
+                "login": logins[position],
+                "id": user_id,
+                "created_at": created_at,
+                "avatar_url": avatar_url,
+                "bio": bio(position),
+            })
+        return records
+
+    def user(self, position: int) -> User:
+        """
+        Args:
+            position (int): Position de l'utilisateur.
+
+        Returns:
+            User: Utilisateur (construit sans nouvelle validation).
+        """
+        return User.model_construct(**self.record(position))
+
+    def users(self, positions: Iterable[int]) -> List[User]:
+        """
+        Args:
+            positions (Iterable[int]): Positions des utilisateurs.
+
+        Returns:
+            List[User]: Utilisateurs correspondants, dans l'ordre des positions.
+        """
+        return [self.user(position) for position in positions]
+
+    @property
+    def bio_index(self) -> SubstringIndex:
+        """
+        SubstringIndex: Index de recherche sur les bios.
+
+        Construit à la première recherche dans les bios : il est bien plus
+        volumineux que celui des logins et inutile si la fonctionnalité
+        n'est jamais utilisée.
+        """
+        if self._bio_index is None:
+            self._bio_index = SubstringIndex([self.bio(position) or "" for position in range(len(self))])
+        return self._bio_index
+
+    def all(self) -> List[User]:
+        """List[User]: Tous les utilisateurs, dans l'ordre de chargement."""
+        return self.users(range(len(self)))
+
+    def all_records(self) -> List[Dict[str, Any]]:
+        """Voir `UserStore.all_records`."""
+        return self.records(range(len(self)))
+
+    def get_record_by_login(self, login: str, ignore_case: bool = False) -> Optional[Dict[str, Any]]:
+        """Voir `UserStore.get_record_by_login`."""
+        position = self.position_by_login(login, ignore_case)
+        return None if position is None else self.record(position)
+
+    def get_record_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Voir `UserStore.get_record_by_id`."""
+        position = self.position_by_id(user_id)
+        return None if position is None else self.record(position)
+
+    def get_by_login(self, login: str, ignore_case: bool = False) -> Optional[User]:
+        """Voir `UserStore.get_by_login`."""
+        position = self.position_by_login(login, ignore_case)
+        return None if position is None else self.user(position)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Voir `UserStore.get_by_id`."""
+        position = self.position_by_id(user_id)
+        return None if position is None else self.user(position)
+
+    def bio_order(self, has_bio: bool) -> array:
+        """
+        Positions listées par `page`, triées par id, des utilisateurs avec
+        (ou sans) bio. Calculées au premier filtre `has_bio` puis conservées.
+
+        Args:
+            has_bio (bool): Utilisateurs avec bio (True) ou sans bio (False).
+
+        Returns:
+            array: Positions triées par id.
+        """
+        order = self._bio_orders.get(has_bio)
+        if order is None:
+            order = self._bio_orders[has_bio] = array(
+                "q", (position for position in self.id_order if self.has_bio(position) == has_bio)
+            )
+        return order
+
+    def date_order(
+        self,
+        created_after: Optional[int],
+        created_before: Optional[int],
+        has_bio: Optional[bool],
+    ) -> array:
+        """
+        Positions listées par `page`, triées par id, des utilisateurs créés
+        dans une plage de dates (et avec ou sans bio).
+
+        Les bornes sont trouvées en O(log N) dans l'index des dates ; le tri
+        par id des k positions retenues n'est fait qu'à la première page : les
+        `DATE_ORDER_CACHE_SIZE` dernières plages demandées sont conservées, et
+        les pages suivantes d'un parcours par curseur ne coûtent plus qu'une
+        recherche dichotomique et une tranche.
+
+        Args:
+            created_after (Optional[int]): Borne inférieure incluse (timestamp).
+            created_before (Optional[int]): Borne supérieure exclue (timestamp).
+            has_bio (Optional[bool]): Filtre sur la bio (None = sans filtre).
+
+        Returns:
+            array: Positions triées par id.
+        """
+        key = (created_after, created_before, has_bio)
+        order = self._date_orders.get(key)
+        if order is not None:
+            try:
+                self._date_orders.move_to_end(key)
+            except KeyError:  # évincée entre-temps par une autre requête
+                pass
+            return order
+
+        start = 0 if created_after is None else bisect_left(self.created_sorted, created_after)
+        end = len(self.created_sorted) if created_before is None else bisect_left(self.created_sorted, created_before)
+        positions = self.created_order[start:end]
+        if has_bio is not None:
+            positions = [position for position in positions if self.has_bio(position) == has_bio]
+        order = array("q", sorted(positions, key=self.ids.__getitem__))
+        self._date_orders[key] = order
+        while len(self._date_orders) > DATE_ORDER_CACHE_SIZE:
+            try:
+                self._date_orders.popitem(last=False)
+            except KeyError:
+                break
+        return order
+
+    def page_records(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """Voir `UserStore.page_records`."""
+        order: Sequence[int]
+        if created_after is not None or created_before is not None:
+            order = self.date_order(created_after, created_before, has_bio)
+        elif has_bio is not None:
+            order = self.bio_order(has_bio)
+        else:
+            order = self.id_order
+
+        total = len(order)
+        start = offset
+        if after_id is not None and order is self.id_order:
+            start += bisect_right(self.sorted_ids, after_id)
+        elif after_id is not None:
+            start += bisect_right(order, after_id, key=self.ids.__getitem__)
+        end = total if limit is None else start + limit
+        records = self.records(order[start:end])
+        next_id = records[-1]["id"] if records and end < total else None
+        return records, next_id, total
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[User], Optional[int], int]:
+        """Voir `UserStore.page`."""
+        records, next_id, total = self.page_records(limit, offset, after_id, created_after, created_before, has_bio)
+        return [User.model_construct(**record) for record in records], next_id, total
+
+    def search_records(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[Dict[str, Any]]:
+        """Voir `UserStore.search_records`."""
+        if prefix:
+            positions = self.login_index.find_prefix(q)
+        else:
+            positions = self.login_index.find(q)
+        if in_bio:
+            positions = sorted(set(positions).union(self.bio_index.find(q)))
+        return self.records(positions)
+
+    def search(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[User]:
+        """Voir `UserStore.search`."""
+        return [User.model_construct(**record) for record in self.search_records(q, prefix, in_bio)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class UserBackend(Protocol):
+    """
+    Interface commune des moteurs de stockage installables dans un `UserStore`
+    (`UserDataset`, `SnapshotDataset`, `SqliteDataset`).
+    """
+
+    def all(self) -> List[User]: ...
+
+    def all_records(self) -> List[Dict[str, Any]]: ...
+
+    def get_by_login(self, login: str, ignore_case: bool = False) -> Optional[User]: ...
+
+    def get_by_id(self, user_id: int) -> Optional[User]: ...
+
+    def get_record_by_login(self, login: str, ignore_case: bool = False) -> Optional[Dict[str, Any]]: ...
+
+    def get_record_by_id(self, user_id: int) -> Optional[Dict[str, Any]]: ...
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[User], Optional[int], int]: ...
+
+    def date_order(
+        self,
+        created_after: Optional[int],
+        created_before: Optional[int],
+        has_bio: Optional[bool],
+    ) -> array:
+        """
+        Positions listées par `page`, triées par id, des utilisateurs créés
+        dans une plage de dates (et avec ou sans bio).
+
+        Les bornes sont trouvées en O(log N) dans l'index des dates ; le tri
+        par id des k positions retenues n'est fait qu'à la première page : les
+        `DATE_ORDER_CACHE_SIZE` dernières plages demandées sont conservées, et
+        les pages suivantes d'un parcours par curseur ne coûtent plus qu'une
+        recherche dichotomique et une tranche.
+
+        Args:
+            created_after (Optional[int]): Borne inférieure incluse (timestamp).
+            created_before (Optional[int]): Borne supérieure exclue (timestamp).
+            has_bio (Optional[bool]): Filtre sur la bio (None = sans filtre).
+
+        Returns:
+            array: Positions triées par id.
+        """
+        key = (created_after, created_before, has_bio)
+        order = self._date_orders.get(key)
+        if order is not None:
+            try:
+                self._date_orders.move_to_end(key)
+            except KeyError:  # évincée entre-temps par une autre requête
+                pass
+            return order
+
+        start = 0 if created_after is None else bisect_left(self.created_sorted, created_after)
+        end = len(self.created_sorted) if created_before is None else bisect_left(self.created_sorted, created_before)
+        positions = self.created_order[start:end]
+        if has_bio is not None:
+            positions = [position for position in positions if self.has_bio(position) == has_bio]
+        order = array("q", sorted(positions, key=self.ids.__getitem__))
+        self._date_orders[key] = order
+        while len(self._date_orders) > DATE_ORDER_CACHE_SIZE:
+            try:
+                self._date_orders.popitem(last=False)
+            except KeyError:
+                break
+        return order
+
+    def page_records(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]: ...
+
+    def search(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[User]: ...
+
+    def search_records(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[Dict[str, Any]]: ...
+
+    def __len__(self) -> int: ...
+
+
+class UserStore:
+    """
+    Point d'accès unique aux utilisateurs pour les routes de l'API.
+
+    Les requêtes sont déléguées au moteur de stockage courant (en mémoire,
+    snapshot projeté ou base SQLite). Le remplacement du moteur se fait par
+    une simple affectation de référence : une requête en cours continue de
+    travailler sur l'ancien jusqu'à sa fin.
+    """
+
+    def __init__(self, users: Iterable[User] = ()):
+        self._dataset: UserBackend = UserDataset(users)
+        # Incrémentée à chaque chargement (invalide les caches dérivés des données)
+        self.generation = 0
+
+    @property
+    def dataset(self) -> UserBackend:
+        """UserBackend: Moteur de stockage courant (à lire une seule fois par requête)."""
+        return self._dataset
+
+    def load(self, users: Iterable[User]) -> None:
+        """
+        Remplace l'ensemble des utilisateurs et reconstruit les index en mémoire.
+
+        Args:
+            users (Iterable[User]): Nouveaux utilisateurs.
+        """
+        self.swap(UserDataset(users))
+
+    def swap(self, dataset: UserBackend) -> None:
+        """
+        Installe un moteur de stockage déjà prêt (rechargement à chaud).
+
+        Args:
+            dataset (UserBackend): Nouveau jeu de données.
+        """
+        # Le jeu de données est remplacé avant la génération : une requête qui
+        # lit l'ancienne génération ne peut pas servir de données plus anciennes
+        self._dataset = dataset
+        self.generation += 1
+
+    def all(self) -> List[User]:
+        """
+        Returns:
+            List[User]: Tous les utilisateurs, dans l'ordre de chargement.
+        """
+        return self._dataset.all()
+
+    def all_records(self) -> List[Dict[str, Any]]:
+        """
+        Équivalent de `all` sous forme de dictionnaires (liste complète de
+        `GET /users/`).
+
+        Returns:
+            List[Dict[str, Any]]: Tous les utilisateurs, dans l'ordre de chargement.
+        """
+        return self._dataset.all_records()
+
+    def get_by_login(self, login: str, ignore_case: bool = False) -> Optional[User]:
+        """
+        Recherche un utilisateur par login.
+
+        Args:
+            login (str): Login GitHub.
+            ignore_case (bool): Si True, la comparaison ignore la casse.
+
+        Returns:
+            Optional[User]: L'utilisateur trouvé, sinon None.
+        """
+        return self._dataset.get_by_login(login, ignore_case)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Recherche un utilisateur par identifiant GitHub.
+
+        Args:
+            user_id (int): Identifiant GitHub.
+
+        Returns:
+            Optional[User]: L'utilisateur trouvé, sinon None.
+        """
+        return self._dataset.get_by_id(user_id)
+
+    def get_record_by_login(self, login: str, ignore_case: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Variante de `get_by_login` renvoyant les champs de l'utilisateur en
+        dictionnaire, lus directement dans le moteur de stockage (sérialisation
+        des routes, sans objet `User`).
+
+        Args:
+            login (str): Login GitHub.
+            ignore_case (bool): Si True, la comparaison ignore la casse.
+
+        Returns:
+            Optional[Dict[str, Any]]: Champs de l'utilisateur trouvé, sinon None.
+        """
+        return self._dataset.get_record_by_login(login, ignore_case)
+
+    def get_record_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Variante de `get_by_id` renvoyant les champs en dictionnaire (voir `get_record_by_login`).
+
+        Args:
+            user_id (int): Identifiant GitHub.
+
+        Returns:
+            Optional[Dict[str, Any]]: Champs de l'utilisateur trouvé, sinon None.
+        """
+        return self._dataset.get_record_by_id(user_id)
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[User], Optional[int], int]:
+        """
+        Retourne une page d'utilisateurs triés par id.
+
+        La pagination par curseur (`after_id`) reprend juste après le dernier id
+        reçu : elle reste correcte même si le jeu de données est rechargé entre
+        deux pages. En cas d'id en double, seul le premier utilisateur est listé.
+
+        Args:
+            limit (Optional[int]): Taille de la page (None = jusqu'à la fin).
+            offset (int): Nombre d'utilisateurs à sauter.
+            after_id (Optional[int]): Dernier id de la page précédente.
+            created_after (Optional[int]): Si fourni, seuls les comptes créés à
+                partir de ce timestamp (inclus) sont listés.
+            created_before (Optional[int]): Si fourni, seuls les comptes créés
+                avant ce timestamp (exclu) sont listés.
+            has_bio (Optional[bool]): Si fourni, seuls les utilisateurs avec
+                (True) ou sans (False) bio non vide sont listés.
+
+        Returns:
+            Tuple[List[User], Optional[int], int]: Utilisateurs de la page, id à
+            utiliser comme curseur pour la page suivante (None s'il n'y en a pas)
+            et nombre total d'utilisateurs correspondant aux filtres.
+        """
+        return self._dataset.page(
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
+            created_after=created_after,
+            created_before=created_before,
+            has_bio=has_bio,
+        )
+
+    def date_order(
+        self,
+        created_after: Optional[int],
+        created_before: Optional[int],
+        has_bio: Optional[bool],
+    ) -> array:
+        """
+        Positions listées par `page`, triées par id, des utilisateurs créés
+        dans une plage de dates (et avec ou sans bio).
+
+        Les bornes sont trouvées en O(log N) dans l'index des dates ; le tri
+        par id des k positions retenues n'est fait qu'à la première page : les
+        `DATE_ORDER_CACHE_SIZE` dernières plages demandées sont conservées, et
+        les pages suivantes d'un parcours par curseur ne coûtent plus qu'une
+        recherche dichotomique et une tranche.
+
+        Args:
+            created_after (Optional[int]): Borne inférieure incluse (timestamp).
+            created_before (Optional[int]): Borne supérieure exclue (timestamp).
+            has_bio (Optional[bool]): Filtre sur la bio (None = sans filtre).
+
+        Returns:
+            array: Positions triées par id.
+        """
+        key = (created_after, created_before, has_bio)
+        order = self._date_orders.get(key)
+        if order is not None:
+            try:
+                self._date_orders.move_to_end(key)
+            except KeyError:  # évincée entre-temps par une autre requête
+                pass
+            return order
+
+        start = 0 if created_after is None else bisect_left(self.created_sorted, created_after)
+        end = len(self.created_sorted) if created_before is None else bisect_left(self.created_sorted, created_before)
+        positions = self.created_order[start:end]
+        if has_bio is not None:
+            positions = [position for position in positions if self.has_bio(position) == has_bio]
+        order = array("q", sorted(positions, key=self.ids.__getitem__))
+        self._date_orders[key] = order
+        while len(self._date_orders) > DATE_ORDER_CACHE_SIZE:
+            try:
+                self._date_orders.popitem(last=False)
+            except KeyError:
+                break
+        return order
+
+    def page_records(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        has_bio: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """
+        Variante de `page` renvoyant les utilisateurs en dictionnaires (voir
+        `get_record_by_login`) ; mêmes paramètres et même curseur.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[int], int]: Champs des
+            utilisateurs de la page, curseur suivant et nombre total.
+        """
+        return self._dataset.page_records(
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
+            created_after=created_after,
+            created_before=created_before,
+            has_bio=has_bio,
+        )
+
+    def search_records(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[Dict[str, Any]]:
+        """
+        Variante de `search` renvoyant les utilisateurs en dictionnaires (voir `get_record_by_login`).
+
+        Args:
+            q (str): Terme recherché.
+            prefix (bool): Si True, seuls les logins commençant par `q` sont retenus.
+            in_bio (bool): Si True, les bios contenant `q` sont aussi retenues.
+
+        Returns:
+            List[Dict[str, Any]]: Champs des utilisateurs correspondants, dans l'ordre de chargement.
+        """
+        return self._dataset.search_records(q, prefix=prefix, in_bio=in_bio)
+
+    def search(self, q: str, prefix: bool = False, in_bio: bool = False) -> List[User]:
+        """
+        Recherche des utilisateurs par login (insensible à la casse).
+
+        Args:
+            q (str): Terme recherché.
+            prefix (bool): Si True, seuls les logins commençant par `q` sont retenus.
+            in_bio (bool): Si True, les bios contenant `q` sont aussi retenues.
+
+        Returns:
+            List[User]: Utilisateurs correspondants, dans l'ordre de chargement.
+        """
+        return self._dataset.search(q, prefix=prefix, in_bio=in_bio)
+
+    def __len__(self) -> int:
+        return len(self._dataset)
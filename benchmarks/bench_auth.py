@@ -0,0 +1,55 @@
+"""
+Microbenchmark de la vérification des tokens JWT (`get_current_user`).
+
+Compare la vérification complète (décodage + signature HMAC) avec un token
+déjà présent dans le cache des tokens vérifiés.
+
+À lancer avec :
+    python -m benchmarks.bench_auth
+"""
+
+import argparse
+import os
+import time
+
+# Valeurs par défaut si aucun .env n'est présent
+os.environ.setdefault("ADMIN", "admin")
+os.environ.setdefault("PASSWD", "password")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from api.security import create_access_token, get_current_user, token_cache  # noqa: E402
+
+
+def measure(func, repeat):
+    """
+    Retourne la latence moyenne (µs) d'un appel à `func`.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(repeat):
+    token = create_access_token({"sub": os.environ["ADMIN"]})
+
+    def uncached():
+        token_cache.clear()
+        get_current_user(token)
+
+    full = measure(uncached, repeat)
+    token_cache.clear()
+    hits = token_cache.hits
+    cached = measure(lambda: get_current_user(token), repeat)
+    print(f"vérification complète : {full:8.2f} µs")
+    print(f"token en cache        : {cached:8.2f} µs ({full / cached:.0f}x)")
+    print(f"succès du cache       : {token_cache.hits - hits} / {repeat} (échecs cumulés : {token_cache.misses})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+    run(args.repeat)
@@ -0,0 +1,79 @@
+"""
+Benchmark des moteurs de stockage de l'API.
+
+Compare, pour un même jeu de données synthétique, la latence des requêtes
+des routes (login, id, page par curseur, recherche par sous-chaîne et par
+préfixe) sur :
+- le stockage en mémoire (`UserDataset`) ;
+- le snapshot binaire projeté en mémoire (`SnapshotDataset`) ;
+- la base SQLite (`SqliteDataset`).
+
+À lancer avec :
+    python -m benchmarks.bench_backends
+    python -m benchmarks.bench_backends --size 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from api.models import User
+from api.snapshot import SnapshotDataset, write_snapshot
+from api.sqlite_store import SqliteDataset, write_sqlite
+from api.store import UserDataset
+from benchmarks.synthetic import generate_users
+
+
+def measure(func, keys, repeat=3):
+    """
+    Retourne la latence moyenne (µs) d'un appel à `func` sur les clés données.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for key in keys:
+            func(key)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(keys)) * 1e6
+
+
+def run(size, lookups):
+    raw_users = generate_users(size)
+    users = [User(**u) for u in raw_users]
+    rng = random.Random(size)
+    sample = [rng.choice(users) for _ in range(lookups)]
+    logins = [u.login for u in sample]
+    ids = [u.id for u in sample]
+    # Sous-chaînes de 5 caractères tirées des logins (partie numérique incluse)
+    substrings = [u.login[-5:] for u in sample[:100]]
+    prefixes = [u.login[:-2] for u in sample[:100]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap_path = os.path.join(tmp, "users.snap")
+        sqlite_path = os.path.join(tmp, "users.sqlite")
+        write_snapshot(users, snap_path)
+        write_sqlite(users, sqlite_path)
+        backends = {
+            "mémoire": UserDataset(users),
+            "snapshot": SnapshotDataset(snap_path),
+            "sqlite": SqliteDataset(sqlite_path),
+        }
+
+        print(f"{size} utilisateurs")
+        print(f"{'moteur':>10} | {'login (µs)':>10} | {'id (µs)':>8} | {'page 100 (µs)':>13} | {'sous-chaîne (µs)':>16} | {'préfixe (µs)':>12}")
+        for name, backend in backends.items():
+            by_login = measure(backend.get_by_login, logins)
+            by_id = measure(backend.get_by_id, ids)
+            page = measure(lambda user_id: backend.page(limit=100, after_id=user_id), ids[:1000])
+            substring = measure(backend.search, substrings)
+            prefix = measure(lambda q: backend.search(q, prefix=True), prefixes)
+            print(f"{name:>10} | {by_login:10.1f} | {by_id:8.1f} | {page:13.1f} | {substring:16.1f} | {prefix:12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000, help="Nombre de recherches par mesure")
+    args = parser.parse_args()
+    run(args.size, args.lookups)
@@ -0,0 +1,74 @@
+"""
+Benchmark de la consultation groupée (POST /users/batch).
+
+Récupère `--count` utilisateurs par leur login, avec un vrai token JWT :
+- un par un avec `GET /users/{login}` (réponses hors cache : chaque login
+  n'est demandé qu'une fois) ;
+- en lots de `--batch` logins avec `POST /users/batch`.
+Les requêtes passent par l'application ASGI complète (middlewares, routage,
+authentification, sérialisation), sans réseau.
+
+À lancer avec :
+    python -m benchmarks.bench_batch
+    python -m benchmarks.bench_batch --count 5000 --batch 1000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+# Valeurs par défaut si aucun .env n'est présent
+os.environ.setdefault("ADMIN", "admin")
+os.environ.setdefault("PASSWD", "password")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+import httpx  # noqa: E402
+
+from api import routes  # noqa: E402
+from api.main import app  # noqa: E402
+from api.models import User  # noqa: E402
+from benchmarks.synthetic import generate_users  # noqa: E402
+
+
+async def run(size, count, batch):
+    users = generate_users(size, seed=1)
+    routes.users_store.load(User(**u) for u in users)
+    logins = [u["login"] for u in random.Random(2).sample(users, count)]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/token", data={"username": os.environ["ADMIN"], "password": os.environ["PASSWD"]})
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        start = time.perf_counter()
+        found = 0
+        for login in logins:
+            found += (await client.get(f"/users/{login}")).status_code == 200
+        one_by_one = time.perf_counter() - start
+        assert found == count
+
+        start = time.perf_counter()
+        found = 0
+        for i in range(0, count, batch):
+            response = await client.post("/users/batch", json={"logins": logins[i:i + batch]})
+            found += len(response.json()["users"])
+        batched = time.perf_counter() - start
+        assert found == count
+
+    print(f"{count} logins parmi {size} utilisateurs")
+    print(f"GET /users/{{login}}     : {count} requêtes, {one_by_one:.2f} s ({one_by_one / count * 1e6:.0f} µs/utilisateur)")
+    requests = -(-count // batch)
+    print(f"POST /users/batch       : {requests} requêtes, {batched:.2f} s ({batched / count * 1e6:.0f} µs/utilisateur, x{one_by_one / batched:.0f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--count", type=int, default=2_000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.size, args.count, args.batch))
@@ -0,0 +1,69 @@
+"""
+Benchmark des filtres de dates de création de /users/.
+
+Compare, pour une plage de dates plus ou moins large :
+- le filtrage linéaire côté client (parcours de toute la liste et
+  comparaison des chaînes `created_at`) ;
+- `UserStore.page(created_after=..., created_before=...)`, servi par l'index
+  trié des dates (recherche dichotomique des bornes puis k utilisateurs).
+Les deux renvoient une page de 100 utilisateurs.
+
+À lancer avec :
+    python -m benchmarks.bench_date_filters
+    python -m benchmarks.bench_date_filters --size 1000000
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from api.models import User
+from api.store import UserStore, timestamp_bound
+from benchmarks.synthetic import generate_users
+
+# Plages (début inclus, fin exclue) d'une heure, d'un jour et d'un mois
+# (les comptes synthétiques sont créés à partir du 1er janvier 2015, un toutes les 37 s)
+RANGES = [
+    ("2015-01-10T00:00:00Z", "2015-01-10T01:00:00Z"),
+    ("2015-01-10T00:00:00Z", "2015-01-11T00:00:00Z"),
+    ("2015-01-10T00:00:00Z", "2015-02-10T00:00:00Z"),
+]
+
+
+def measure(func, repeat):
+    """Retourne la latence moyenne (ms) d'un appel à `func`."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def run(size, repeat):
+    users = [User(**u) for u in generate_users(size, seed=1)]
+    start = time.perf_counter()
+    store = UserStore(users)
+    print(f"{size} utilisateurs (chargement et index : {time.perf_counter() - start:.1f} s)\n")
+    listed = sorted(users, key=lambda user: user.id)
+
+    print(f"{'plage':>45} | {'retenus':>8} | {'linéaire (ms)':>13} | {'index (ms)':>10}")
+    for after, before in RANGES:
+        after_ts = timestamp_bound(datetime.fromisoformat(after))
+        before_ts = timestamp_bound(datetime.fromisoformat(before))
+        _, _, total = store.page(limit=1, created_after=after_ts, created_before=before_ts)
+
+        def linear():
+            return [user for user in listed if after <= user.created_at < before][:100]
+
+        def indexed():
+            return store.page(limit=100, created_after=after_ts, created_before=before_ts)[0]
+
+        assert linear() == indexed()
+        print(f"{after + ' → ' + before:>45} | {total:8d} | {measure(linear, repeat):13.2f} | {measure(indexed, repeat):10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.size, args.repeat)
@@ -0,0 +1,75 @@
+"""
+Benchmark de l'export NDJSON (/users/export) face à la liste complète (/users/).
+
+Pour chaque taille de jeu de données, mesure le pic de mémoire allouée
+(tracemalloc) et le délai avant le premier octet :
+- `/users/` : toute la liste est rendue en un seul corps JSON ;
+- `/users/export` : le flux est produit par paquets de `export_chunk_size`.
+
+À lancer avec :
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --sizes 10000 200000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from starlette.requests import Request
+
+from api import routes
+from api.models import User
+from benchmarks.synthetic import generate_users
+
+
+def make_request(path):
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": [], "server": ("bench", 80), "scheme": "http"})
+
+
+def full_list():
+    """Corps de /users/ sans le cache (rendu complet)."""
+    routes.response_cache.clear()
+    start = time.perf_counter()
+    response = routes.get_all_users(make_request("/users/"), limit=None, offset=0, cursor=None, fields=None, current_user="bench")
+    return time.perf_counter() - start, len(response.body)
+
+
+async def export():
+    """Corps de /users/export, lu en entier en flux."""
+    start = time.perf_counter()
+    response = routes.export_users(make_request("/users/export"), since_id=None, fields=None, current_user="bench")
+    first_byte, size = None, 0
+    async for chunk in response.body_iterator:
+        if first_byte is None:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+    return first_byte, size
+
+
+def measure(func):
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def run(sizes):
+    print(f"{'taille':>10} | {'route':>13} | {'1er octet (ms)':>14} | {'octets':>12} | {'pic mémoire (Mo)':>16}")
+    for size in sizes:
+        routes.users_store.load(User(**u) for u in generate_users(size, seed=1))
+        (first_byte, body_size), peak = measure(full_list)
+        print(f"{size:10d} | {'/users/':>13} | {first_byte * 1e3:14.1f} | {body_size:12d} | {peak / 1e6:16.1f}")
+        (first_byte, body_size), peak = measure(lambda: asyncio.run(export()))
+        print(f"{size:10d} | {'/users/export':>13} | {first_byte * 1e3:14.1f} | {body_size:12d} | {peak / 1e6:16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    run(args.sizes)
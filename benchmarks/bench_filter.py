@@ -0,0 +1,62 @@
+"""
+Benchmark du filtrage métier de `filtered_users.py`.
+
+Compare `filter_users` (une date `datetime.fromisoformat` par utilisateur),
+`filter_batch` (critères simples en un passage, dates décodées en colonne)
+et `filter_users_parallel` (lots répartis sur plusieurs processus), et vérifie
+que les trois produisent le même résultat.
+
+À lancer avec :
+    python -m benchmarks.bench_filter
+    python -m benchmarks.bench_filter --sizes 100000 --workers 4
+"""
+
+import argparse
+import os
+import random
+import time
+
+from benchmarks.synthetic import generate_users
+from filtered_users import filter_batch, filter_users, filter_users_parallel
+
+
+def make_dataset(size):
+    """
+    Utilisateurs synthétiques dont environ un tiers échoue à un des critères.
+    """
+    rng = random.Random(size)
+    users = generate_users(size)
+    for user in users:
+        draw = rng.random()
+        if draw < 0.1:
+            user["bio"] = None
+        elif draw < 0.2:
+            user["created_at"] = "2013" + user["created_at"][4:]
+        elif draw < 0.25:
+            user["avatar_url"] = ""
+    return users
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(sizes, workers):
+    print(f"{'taille':>10} | {'filter_users (s)':>16} | {'filter_batch (s)':>16} | {f'parallèle x{workers} (s)':>18} | {'enr/s (batch)':>13}")
+    for size in sizes:
+        users = make_dataset(size)
+        expected, reference = timed(filter_users, users)
+        batched, batch = timed(filter_batch, users)
+        parallel_result, parallel = timed(filter_users_parallel, users, workers)
+        assert batched == expected and parallel_result == expected, "résultats différents"
+        print(f"{size:>10} | {reference:16.3f} | {batch:16.3f} | {parallel:18.3f} | {size / batch:13,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    run(args.sizes, args.workers)
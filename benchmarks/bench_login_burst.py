@@ -0,0 +1,80 @@
+"""
+Test de charge : latence de l'API pendant une rafale de logins.
+
+Envoie `--logins` requêtes `POST /token` simultanées et mesure pendant ce
+temps la latence de `GET /` (route asynchrone, servie par la boucle
+asyncio). Avec `--on-loop`, la vérification du mot de passe est faite
+directement dans la boucle (ancien comportement), pour comparaison.
+
+À lancer avec :
+    python -m benchmarks.bench_login_burst
+    python -m benchmarks.bench_login_burst --on-loop
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# Valeurs par défaut si aucun .env n'est présent
+os.environ.setdefault("ADMIN", "admin")
+os.environ.setdefault("PASSWD", "password")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+import httpx  # noqa: E402
+
+from api import routes, security  # noqa: E402
+from api.main import app  # noqa: E402
+
+
+async def probe(client, stop, latencies, gaps):
+    """
+    Interroge `GET /` en boucle jusqu'à la fin de la rafale ; `gaps` reçoit
+    l'intervalle entre deux réponses (une boucle bloquée l'allonge).
+    """
+    last = time.perf_counter()
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/")
+        end = time.perf_counter()
+        latencies.append((end - start) * 1000)
+        gaps.append((end - last) * 1000)
+        last = end
+        await asyncio.sleep(0.005)
+
+
+async def run(logins):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"username": os.environ["ADMIN"], "password": os.environ["PASSWD"]}
+        stop = asyncio.Event()
+        latencies, gaps = [], []
+        prober = asyncio.create_task(probe(client, stop, latencies, gaps))
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.post("/token", data=credentials) for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await prober
+
+    ok = sum(r.status_code == 200 for r in responses)
+    latencies.sort()
+    print(f"{logins} logins ({ok} réussis) en {elapsed:.2f} s")
+    print(f"GET / pendant la rafale : {len(latencies)} requêtes, "
+          f"médiane {statistics.median(latencies):.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f} ms, max {latencies[-1]:.1f} ms")
+    print(f"Plus longue attente entre deux réponses : {max(gaps):.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--on-loop", action="store_true", help="Vérifie les mots de passe dans la boucle asyncio")
+    args = parser.parse_args()
+    if args.on_loop:
+        async def authenticate_on_loop(username, password):
+            return security.authenticate_user(username, password)
+        routes.authenticate_user_async = authenticate_on_loop
+    asyncio.run(run(args.logins))
@@ -0,0 +1,68 @@
+"""
+Benchmark des recherches d'utilisateur par login et par id.
+
+Compare l'ancien parcours linéaire de la liste avec les index du `UserStore`
+pour des jeux de données de 1 000 à 1 000 000 d'utilisateurs. La latence des
+index doit rester stable quelle que soit la taille.
+
+À lancer avec :
+    python -m benchmarks.bench_lookup
+    python -m benchmarks.bench_lookup --sizes 1000 10000
+"""
+
+import argparse
+import random
+import time
+
+from api.models import User
+from api.store import UserStore
+from benchmarks.synthetic import generate_users
+
+
+def linear_lookup(users, login):
+    for user in users:
+        if user.login == login:
+            return user
+    return None
+
+
+def measure(func, keys, repeat):
+    """
+    Retourne la latence moyenne (µs) d'un appel à `func` sur les clés données.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for key in keys:
+            func(key)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(keys)) * 1e6
+
+
+def run(sizes, lookups, linear_max):
+    print(f"{'taille':>10} | {'login (µs)':>11} | {'login ci (µs)':>13} | {'id (µs)':>8} | {'linéaire (µs)':>13}")
+    for size in sizes:
+        users = [User(**u) for u in generate_users(size)]
+        store = UserStore(users)
+        rng = random.Random(size)
+        sample = [rng.choice(users) for _ in range(lookups)]
+        logins = [u.login for u in sample]
+        upper_logins = [u.login.upper() for u in sample]
+        ids = [u.id for u in sample]
+
+        by_login = measure(store.get_by_login, logins, 10)
+        by_login_ci = measure(lambda l: store.get_by_login(l, ignore_case=True), upper_logins, 10)
+        by_id = measure(store.get_by_id, ids, 10)
+        if size <= linear_max:
+            linear = f"{measure(lambda l: linear_lookup(users, l), logins[:20], 1):13.2f}"
+        else:
+            linear = f"{'-':>13}"
+        print(f"{size:>10} | {by_login:11.3f} | {by_login_ci:13.3f} | {by_id:8.3f} | {linear}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=10_000, help="Nombre de recherches par mesure")
+    parser.add_argument("--linear-max", type=int, default=100_000, help="Taille max pour le parcours linéaire")
+    args = parser.parse_args()
+    run(args.sizes, args.lookups, args.linear_max)
@@ -0,0 +1,61 @@
+"""
+Benchmark de l'empreinte mémoire du stockage des utilisateurs.
+
+Compare, en octets par utilisateur :
+- une liste d'objets Pydantic `User` (ancienne représentation de `api/main.py`) ;
+- le `UserStore` compact (colonnes + index exacts + index trigramme des logins) ;
+- la part de l'index trigramme seul, pour isoler le coût des colonnes.
+
+La mémoire est mesurée avec `tracemalloc` (allocations Python uniquement).
+
+À lancer avec :
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --sizes 10000 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from api.models import User
+from api.search import SubstringIndex
+from api.store import UserStore
+from benchmarks.synthetic import generate_users
+
+
+def measure(build):
+    """
+    Retourne l'objet construit par `build` et la mémoire (octets) qu'il retient.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def run(sizes):
+    print(f"{'taille':>10} | {'list[User] (o/u)':>16} | {'UserStore (o/u)':>15} | {'dont index (o/u)':>16} | {'gain':>5}")
+    for size in sizes:
+        raw_users = generate_users(size)
+
+        users, pydantic_bytes = measure(lambda: [User(**u) for u in raw_users])
+        del users
+        store, store_bytes = measure(lambda: UserStore(User(**u) for u in raw_users))
+        index, index_bytes = measure(lambda: SubstringIndex(store.dataset.logins))
+        del store, index
+
+        print(
+            f"{size:>10} | {pydantic_bytes / size:16.0f} | {store_bytes / size:15.0f} | "
+            f"{index_bytes / size:16.0f} | {pydantic_bytes / store_bytes:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
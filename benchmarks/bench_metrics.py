@@ -0,0 +1,53 @@
+"""
+Benchmark du coût de l'instrumentation Prometheus (`MetricsMiddleware`).
+
+Appelle directement une application ASGI minimale (sans réseau), avec et
+sans le middleware, et affiche le surcoût par requête.
+
+À lancer avec :
+    python -m benchmarks.bench_metrics
+"""
+
+import asyncio
+import time
+
+from api.metrics import MetricsMiddleware
+
+REQUESTS = 100_000
+
+
+class FakeRoute:
+    path = "/users/{login}"
+
+
+async def app(scope, receive, send):
+    scope["route"] = FakeRoute
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"login":"octocat"}'})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def measure(asgi_app):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await asgi_app({"type": "http", "method": "GET", "path": "/users/octocat"}, receive, send)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+async def main():
+    bare = await measure(app)
+    instrumented = await measure(MetricsMiddleware(app))
+    print(f"{REQUESTS} requêtes ASGI")
+    print(f"Sans métriques : {bare:.2f} µs/requête")
+    print(f"Avec métriques : {instrumented:.2f} µs/requête (surcoût {instrumented - bare:.2f} µs)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark de la recherche d'utilisateurs (/users/search).
+
+Compare l'ancien filtre `q.lower() in user.login.lower()` appliqué à chaque
+utilisateur avec l'index trigramme du `UserStore`, en recherche par
+sous-chaîne, par préfixe et dans les bios. La colonne « route » mesure le
+chemin complet de `/users/search` hors réseau et sans le cache de réponses :
+recherche, lecture des champs dans les colonnes, rendu JSON et ETag.
+
+À lancer avec :
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --sizes 1000 100000
+"""
+
+import argparse
+import os
+import time
+from urllib.parse import urlencode
+
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from starlette.requests import Request
+
+from api import routes
+from api.models import User
+from api.store import UserStore
+from benchmarks.synthetic import generate_users
+
+QUERIES = ["pythonRust1", "0367999", "devopscloud", "ngine", "learningSecurity10"]
+
+
+def linear_search(users, q):
+    return [user for user in users if q.lower() in user.login.lower()]
+
+
+def route_search(q):
+    """Appel de la route /users/search, réponse rendue à chaque fois (cache vidé)."""
+    routes.response_cache.clear()
+    request = Request({
+        "type": "http", "method": "GET", "path": "/users/search", "query_string": urlencode({"q": q}).encode(),
+        "headers": [], "server": ("bench", 80), "scheme": "http",
+    })
+    return routes.search_users(request, q=q, current_user="bench")
+
+
+def measure(func, queries, repeat):
+    """
+    Retourne la latence moyenne (ms) d'un appel à `func` sur les requêtes données.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for q in queries:
+            func(q)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e3
+
+
+def run(sizes, repeat):
+    print(f"{'taille':>10} | {'index (ms)':>10} | {'route (ms)':>10} | {'préfixe (ms)':>12} | {'bio (ms)':>9} | {'linéaire (ms)':>13} | {'build (s)':>9}")
+    for size in sizes:
+        users = [User(**u) for u in generate_users(size)]
+        start = time.perf_counter()
+        store = UserStore(users)
+        build = time.perf_counter() - start
+        store.dataset.bio_index  # construction hors mesure
+        routes.users_store.swap(store.dataset)
+
+        indexed = measure(store.search_records, QUERIES, repeat)
+        route = measure(route_search, QUERIES, repeat)
+        prefix = measure(lambda q: store.search_records(q, prefix=True), QUERIES, repeat)
+        bio = measure(lambda q: store.search_records(q, in_bio=True), QUERIES, repeat)
+        linear = measure(lambda q: linear_search(users, q), QUERIES, 1)
+        print(f"{size:>10} | {indexed:10.3f} | {route:10.3f} | {prefix:12.3f} | {bio:9.3f} | {linear:13.3f} | {build:9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20, help="Répétitions par requête")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,73 @@
+"""
+Benchmark de la sérialisation et de la compression des réponses de /users/.
+
+Pour une liste de `--size` utilisateurs, compare :
+- le rendu JSON : ancien chemin (`model_dump` + `json.dumps`) et celui des
+  routes (`UserStore.page_records`, dictionnaires lus dans les colonnes,
+  + orjson), en temps CPU ;
+- la taille transmise et le coût de compression : brut, gzip et brotli
+  (si le paquet `brotli` est installé). La compression n'est payée qu'une
+  fois par réponse mise en cache ; les requêtes suivantes resservent la
+  variante déjà compressée.
+
+À lancer avec :
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --size 100000
+"""
+
+import argparse
+import json
+import time
+
+from api.cache import ENCODINGS, compress, render_json
+from api.models import User
+from api.store import UserStore
+from benchmarks.synthetic import generate_users
+
+
+def best_of(func, repeat):
+    """Retourne le meilleur temps (ms) de `repeat` appels à `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def legacy_render(users):
+    content = [user.model_dump() for user in users]
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast_render(store):
+    return render_json(store.page_records()[0])
+
+
+def run(size, repeat):
+    store = UserStore(User(**u) for u in generate_users(size, seed=1))
+    users, _, _ = store.page()
+    body = fast_render(store)
+    assert body == legacy_render(users)
+
+    print(f"{size} utilisateurs\n")
+    legacy = best_of(lambda: legacy_render(users), repeat)
+    fast = best_of(lambda: fast_render(store), repeat)
+    print(f"{'rendu JSON':>28} | {'temps (ms)':>10}")
+    print(f"{'model_dump + json.dumps':>28} | {legacy:10.1f}")
+    print(f"{'page_records + orjson':>28} | {fast:10.1f}  (x{legacy / fast:.1f})")
+
+    print(f"\n{'encodage':>10} | {'octets':>12} | {'ratio':>6} | {'compression (ms)':>16}")
+    print(f"{'brut':>10} | {len(body):12d} | {1:6.2f} | {'-':>16}")
+    for encoding in ENCODINGS:
+        encoded = compress(body, encoding)
+        elapsed = best_of(lambda: compress(body, encoding), repeat)
+        print(f"{encoding:>10} | {len(encoded):12d} | {len(encoded) / len(body):6.2f} | {elapsed:16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.size, args.repeat)
@@ -0,0 +1,59 @@
+"""
+Benchmark du temps de chargement du jeu de données au démarrage de l'API.
+
+Compare le chargement de `filtered_users.json` (json.load + validation
+Pydantic + construction des index) avec la projection en mémoire du snapshot
+binaire écrit par `filtered_users.py --snapshot`.
+
+À lancer avec :
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --sizes 10000 100000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from api.models import User
+from api.reload import load_dataset
+from api.snapshot import write_snapshot
+from benchmarks.synthetic import generate_users
+
+
+def timed(func):
+    """
+    Retourne le résultat de `func` et sa durée d'exécution (ms).
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(sizes):
+    print(f"{'taille':>10} | {'JSON (ms)':>10} | {'snapshot (ms)':>13} | {'1re recherche (ms)':>18} | {'taille .snap':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            raw_users = generate_users(size)
+            json_path = os.path.join(tmp, f"users_{size}.json")
+            snap_path = os.path.join(tmp, f"users_{size}.snap")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(raw_users, f)
+            write_snapshot((User(**u) for u in raw_users), snap_path)
+            login = raw_users[size // 2]["login"]
+            del raw_users
+
+            _, json_ms = timed(lambda: load_dataset(json_path))
+            dataset, snap_ms = timed(lambda: load_dataset(snap_path))
+            _, lookup_ms = timed(lambda: dataset.user(dataset.position_by_login(login)))
+            snap_mb = os.path.getsize(snap_path) / 1e6
+            print(f"{size:>10} | {json_ms:10.0f} | {snap_ms:13.2f} | {lookup_ms:18.3f} | {snap_mb:9.1f} Mo")
+            del dataset
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
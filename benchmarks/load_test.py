@@ -0,0 +1,268 @@
+"""
+Test de charge de l'API contre un serveur uvicorn local.
+
+Déroulement :
+1. génération d'un jeu de données synthétique (`--size` utilisateurs) ;
+2. démarrage d'uvicorn sur un port libre avec ce jeu de données ;
+3. pour chaque scénario, `--concurrency` clients envoient des requêtes en
+   continu pendant `--duration` secondes (paramètres tirés au hasard avec une
+   graine fixe : résultats reproductibles) ;
+4. affichage du débit (requêtes/s) et des latences p50/p95/p99 par scénario,
+   puis enregistrement des résultats en JSON dans `benchmarks/results/`
+   (un fichier par exécution, nommé d'après la date et le commit).
+
+`--compare FICHIER` affiche l'écart avec une exécution précédente.
+
+À lancer avec :
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --size 100000 --concurrency 32 --duration 20
+    python -m benchmarks.load_test --compare benchmarks/results/<fichier>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from api.pagination import encode_cursor
+from benchmarks.synthetic import WORDS, write_dataset
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+SCENARIOS = ["users_page", "search", "user_detail", "token"]
+# Identifiants du serveur de test (indépendants du .env)
+CREDENTIALS = {"username": "bench", "password": "bench-password"}
+
+
+def percentile(sorted_values, q):
+    """
+    Args:
+        sorted_values (list[float]): Valeurs triées.
+        q (float): Percentile (0-100).
+
+    Returns:
+        float: Valeur au percentile demandé (méthode du rang le plus proche).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def free_port():
+    """Retourne un port TCP libre sur la machine locale."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def git_commit():
+    """Retourne le commit courant (ou "inconnu" hors d'un dépôt git)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "inconnu"
+
+
+def start_server(data_file, port, workers):
+    """
+    Démarre uvicorn en sous-processus et attend qu'il réponde.
+
+    Returns:
+        subprocess.Popen: Processus du serveur.
+    """
+    env = {
+        **os.environ,
+        "USERS_DATA_FILE": data_file,
+        "ADMIN": CREDENTIALS["username"],
+        "PASSWD": CREDENTIALS["password"],
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "load-test-secret"),
+        "ALGORITHM": os.environ.get("ALGORITHM", "HS256"),
+        "ACCESS_TOKEN_EXPIRE_MINUTES": os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "30"),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn s'est arrêté au démarrage (code {server.returncode})")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn n'a pas démarré dans le délai imparti")
+
+
+def make_request(scenario, rng, users):
+    """
+    Tire une requête au hasard pour un scénario.
+
+    Returns:
+        tuple[str, str, dict]: Méthode, chemin et arguments pour httpx.
+    """
+    if scenario == "users_page":
+        cursor = encode_cursor(rng.choice(users)["id"])
+        return "GET", "/users/", {"params": {"limit": 100, "cursor": cursor}}
+    if scenario == "search":
+        if rng.random() < 0.5:
+            # Sous-chaîne de login (partie numérique : peu de résultats)
+            return "GET", "/users/search", {"params": {"q": rng.choice(users)["login"][-6:]}}
+        return "GET", "/users/search", {"params": {"q": rng.choice(WORDS) + rng.choice(WORDS)[:2], "prefix": "true"}}
+    if scenario == "user_detail":
+        return "GET", f"/users/{rng.choice(users)['login']}", {}
+    return "POST", "/token", {"data": CREDENTIALS}
+
+
+async def run_scenario(base_url, token, scenario, users, concurrency, duration, seed):
+    """
+    Envoie des requêtes en continu depuis `concurrency` clients pendant `duration` secondes.
+
+    Returns:
+        dict: Nombre de requêtes, erreurs, débit et latences (ms).
+    """
+    latencies = []
+    errors = 0
+    headers = {"Authorization": f"Bearer {token}"}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker(worker_id):
+            nonlocal errors
+            rng = random.Random(f"{seed}-{scenario}-{worker_id}")
+            while time.perf_counter() < deadline:
+                method, path, kwargs = make_request(scenario, rng, users)
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, path, **kwargs)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append((time.perf_counter() - start) * 1000)
+                errors += not ok
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def print_results(results, previous=None):
+    """Affiche les résultats, avec l'écart relatif à une exécution précédente si fournie."""
+    def delta(name, key):
+        if not previous or name not in previous["scenarios"]:
+            return ""
+        old = previous["scenarios"][name][key]
+        return f" ({(results['scenarios'][name][key] - old) / old * 100:+.0f} %)" if old else ""
+
+    print(f"\n{results['size']} utilisateurs, {results['concurrency']} clients, {results['duration']} s par scénario"
+          f" (commit {results['commit']})")
+    print(f"{'scénario':>12} | {'requêtes':>8} | {'erreurs':>7} | {'req/s':>14} | {'p50 (ms)':>14} | {'p95 (ms)':>14} | {'p99 (ms)':>14}")
+    for name, stats in results["scenarios"].items():
+        print(
+            f"{name:>12} | {stats['requests']:8d} | {stats['errors']:7d} | "
+            f"{stats['rps']:7.0f}{delta(name, 'rps'):>7} | "
+            f"{stats['p50_ms']:7.1f}{delta(name, 'p50_ms'):>7} | "
+            f"{stats['p95_ms']:7.1f}{delta(name, 'p95_ms'):>7} | "
+            f"{stats['p99_ms']:7.1f}{delta(name, 'p99_ms'):>7}"
+        )
+
+
+def save_results(results):
+    """
+    Enregistre les résultats dans `benchmarks/results/`.
+
+    Returns:
+        str: Chemin du fichier écrit.
+    """
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(RESULTS_DIR, f"{stamp}_{results['commit']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    return path
+
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "filtered_users.json")
+        users = write_dataset(data_file, args.size, args.seed)
+        port = free_port()
+        server = start_server(data_file, port, args.workers)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                response = await client.post("/token", data=CREDENTIALS)
+                response.raise_for_status()
+                token = response.json()["access_token"]
+
+            scenarios = {}
+            for scenario in args.scenarios:
+                scenarios[scenario] = await run_scenario(
+                    base_url, token, scenario, users, args.concurrency, args.duration, args.seed
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+    return {
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "size": args.size,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "workers": args.workers,
+        "seed": args.seed,
+        "scenarios": scenarios,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000, help="Nombre d'utilisateurs synthétiques")
+    parser.add_argument("--concurrency", type=int, default=16, help="Clients simultanés par scénario")
+    parser.add_argument("--duration", type=float, default=10, help="Durée de chaque scénario (s)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers uvicorn")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--compare", help="Résultats d'une exécution précédente (JSON)")
+    parser.add_argument("--no-save", action="store_true", help="N'enregistre pas les résultats")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    print_results(results, previous)
+    if not args.no_save:
+        print(f"\nRésultats enregistrés dans {save_results(results)}")
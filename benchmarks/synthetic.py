@@ -0,0 +1,79 @@
+"""
+Génération de jeux de données synthétiques au format de `data/filtered_users.json`.
+
+Utilisé par les scripts de benchmark pour mesurer les performances sur des
+volumes impossibles à extraire rapidement depuis l'API GitHub.
+
+À lancer avec :
+    python -m benchmarks.synthetic --count 1000000 --output data/synthetic_users.json
+"""
+
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+FIRST_ID = 10367555
+DATE_START = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+WORDS = [
+    "python", "developer", "data", "engineer", "web", "fullstack", "backend",
+    "frontend", "devops", "cloud", "student", "open", "source", "rust", "go",
+    "java", "machine", "learning", "security", "design", "mobile", "linux",
+]
+
+
+def generate_users(count, seed=42):
+    """
+    Génère une liste de dictionnaires utilisateurs réalistes.
+
+    Args:
+        count (int): Nombre d'utilisateurs à générer.
+        seed (int): Graine du générateur aléatoire (résultats reproductibles).
+
+    Returns:
+        list[dict]: Utilisateurs au format de `filtered_users.json`.
+    """
+    rng = random.Random(seed)
+    users = []
+    for i in range(count):
+        user_id = FIRST_ID + i
+        created_at = DATE_START + timedelta(seconds=i * 37 + rng.randint(0, 36))
+        users.append({
+            "login": f"{rng.choice(WORDS)}{rng.choice(WORDS).capitalize()}{user_id}",
+            "id": user_id,
+            "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{user_id}?v=4",
+            "bio": " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 8))),
+        })
+    return users
+
+
+def write_dataset(path, count, seed=42):
+    """
+    Écrit un jeu de données synthétique au format de `filtered_users.json`.
+
+    Args:
+        path (str): Fichier de sortie.
+        count (int): Nombre d'utilisateurs.
+        seed (int): Graine du générateur aléatoire.
+
+    Returns:
+        list[dict]: Utilisateurs écrits.
+    """
+    users = generate_users(count, seed)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(users, f, ensure_ascii=False)
+    return users
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère un jeu de données synthétique")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="data/synthetic_users.json")
+    args = parser.parse_args()
+    write_dataset(args.output, args.count, args.seed)
+    print(f"{args.count} utilisateurs écrits dans {args.output}")
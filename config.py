@@ -2,4 +2,6 @@ GIT_URL_USERS = "https://api.github.com/users?since="
 
 SINCE = 10367555
 
-GIT_URL_USER_INFO = "https://api.github.com/users"
\ No newline at end of file
+GIT_URL_USER_INFO = "https://api.github.com/users"
+
+GIT_URL_GRAPHQL = "https://api.github.com/graphql"
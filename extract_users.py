@@ -1,4 +1,6 @@
 import requests
+import httpx
+import asyncio
 import os
 import time
 import argparse
@@ -6,67 +8,87 @@ import json
 from dotenv import load_dotenv
 import sys
 import io
-from config import GIT_URL_USERS, SINCE, GIT_URL_USER_INFO
-
-# Encodage UTF-8 pour éviter les erreurs d'affichage
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import textwrap
+from urllib.parse import urlsplit
+from config import GIT_URL_USERS, SINCE, GIT_URL_USER_INFO, GIT_URL_GRAPHQL
+from filtered_users import RULES, max_stored_id
+from http_cache import HttpCache
+from rate_limiter import RateLimitScheduler, is_rate_limited
 
 # Charger les variables d'environnement (.env)
 load_dotenv()
-token = os.getenv("GITHUB_TOKEN")
-headers = {"Authorization": f"token {token}"}
 
-def check_rate_limit(response):
+def load_tokens():
     """
-    Vérifie les quotas de l'API GitHub et met le script en pause si la limite est atteinte.
+    Lit les tokens GitHub : `GITHUB_TOKENS` (liste séparée par des virgules)
+    ou, à défaut, `GITHUB_TOKEN`.
 
-    Args:
-        response (requests.Response): La réponse HTTP de l'API GitHub.
+    Returns:
+        list[str]: Tokens disponibles (vide pour des requêtes anonymes).
     """
-    remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
-    reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+    raw = os.getenv("GITHUB_TOKENS") or os.getenv("GITHUB_TOKEN") or ""
+    return [token.strip() for token in raw.split(",") if token.strip()]
 
-    if remaining == 0:
-        wait_time = reset_time - int(time.time())
-        if wait_time > 0:
-            print(f"[Quota] Limite atteinte. Pause de {wait_time} secondes (~{wait_time // 60} min).")
-            time.sleep(wait_time + 1)
+# Ordonnanceur des requêtes : quotas, rotation des tokens et pauses
+scheduler = RateLimitScheduler(load_tokens())
+# L'API GraphQL a son propre quota (en points) : ordonnanceur séparé
+graphql_scheduler = RateLimitScheduler(load_tokens())
+
+# Cache disque des réponses (HttpCache), activé par le point d'entrée du script
+http_cache = None
 
 def safe_request(url, max_retries=5):
     """
     Effectue une requête GET sécurisée avec gestion des erreurs, des quotas et des tentatives.
 
+    Le rythme des requêtes et le choix du token sont confiés à `scheduler`.
+
     Args:
         url (str): L'URL à interroger.
         max_retries (int): Le nombre maximum de tentatives en cas d'erreur.
 
     Returns:
-        requests.Response | None: La réponse HTTP en cas de succès, sinon None.
+        requests.Response | CachedResponse | None: La réponse HTTP en cas de succès
+        (éventuellement issue du cache `http_cache`), sinon None.
     """
-    delay = 5
+    conditional = {}
+    if http_cache is not None:
+        cached, conditional = http_cache.lookup(url)
+        if cached is not None:
+            return cached
+
     for attempt in range(max_retries):
+        token, delay = scheduler.reserve()
+        if delay > 0:
+            time.sleep(delay)
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers={**scheduler.auth_headers(token), **conditional})
             status = response.status_code
+            scheduler.update(token, response.headers)
 
-            if status == 200:
-                check_rate_limit(response)
+            if status == 304 and http_cache is not None:
+                cached = http_cache.revalidate(url, response)
+                if cached is not None:
+                    return cached
+                # Entrée évincée entre-temps : nouvelle requête inconditionnelle
+                conditional = {}
+
+            elif status == 200:
+                if http_cache is not None:
+                    http_cache.store(url, response)
                 return response
 
-            elif status == 403:
-                print(f"[403] Accès interdit. Vérifie ton token ou quota. URL : {url}")
-                check_rate_limit(response)
-                time.sleep(delay)
+            elif status in (403, 429) and is_rate_limited(status, response.headers, response.text):
+                pause = scheduler.penalize(token, response.headers, attempt)
+                print(f"[{status}] Limite de requêtes atteinte (vérifie ton token ou quota). Token en pause {pause:.0f} s. URL : {url}")
 
-            elif status == 429:
-                print(f"[429] Trop de requêtes. Attente de {delay} secondes...")
-                time.sleep(delay)
-                delay *= 2
+            elif status == 403:
+                print(f"[403] Accès refusé (hors limite de requêtes), requête abandonnée. URL : {url}")
+                break
 
             elif 500 <= status < 600:
                 print(f"[{status}] Erreur serveur GitHub. Tentative {attempt+1}/{max_retries}")
-                time.sleep(delay)
-                delay *= 2
+                time.sleep(scheduler.backoff(attempt))
 
             else:
                 print(f"[{status}] Erreur inconnue pour URL : {url}")
@@ -74,25 +96,246 @@ def safe_request(url, max_retries=5):
 
         except requests.exceptions.RequestException as e:
             print(f"[Exception] {e}")
-            time.sleep(delay)
+            time.sleep(scheduler.backoff(attempt))
 
     return None
 
-def fetch_users(max_users):
+def extract_profile(detail):
     """
-    Récupère les profils d'utilisateurs GitHub via l'API publique jusqu'à atteindre le nombre demandé.
+    Ne conserve que les champs utiles d'un profil détaillé GitHub.
 
     Args:
-        max_users (int): Nombre maximum d'utilisateurs à récupérer.
+        detail (dict): Réponse JSON de l'endpoint /users/{login}.
 
     Returns:
-        list[dict]: Liste de dictionnaires contenant les données des utilisateurs.
+        dict: Profil réduit (login, id, created_at, avatar_url, bio).
+    """
+    return {
+        "login": detail.get("login"),
+        "id": detail.get("id"),
+        "created_at": detail.get("created_at"),
+        "avatar_url": detail.get("avatar_url"),
+        "bio": detail.get("bio")
+    }
+
+def graphql_query(count):
     """
-    users_data = []
-    since = SINCE
+    Construit la requête GraphQL demandant `count` profils, un alias par login.
+
+    Args:
+        count (int): Nombre de profils demandés.
+
+    Returns:
+        str: Requête GraphQL (logins passés en variables `$l0`, `$l1`, ...).
+    """
+    variables = ", ".join(f"$l{i}: String!" for i in range(count))
+    fields = " ".join(f"u{i}: user(login: $l{i}) {{ ...profile }}" for i in range(count))
+    return (
+        f"query({variables}) {{ rateLimit {{ cost remaining resetAt }} {fields} }} "
+        "fragment profile on User { login databaseId createdAt avatarUrl bio }"
+    )
+
+def graphql_profile(node):
+    """
+    Convertit un profil GraphQL au format de `extract_profile`.
+
+    Args:
+        node (dict): Champs `login`, `databaseId`, `createdAt`, `avatarUrl` et `bio`.
+
+    Returns:
+        dict: Profil réduit (login, id, created_at, avatar_url, bio).
+    """
+    return {
+        "login": node.get("login"),
+        "id": node.get("databaseId"),
+        "created_at": node.get("createdAt"),
+        "avatar_url": node.get("avatarUrl"),
+        "bio": node.get("bio")
+    }
+
+class GraphQLDetailFetcher:
+    """
+    Récupère les profils détaillés par lots via l'API GraphQL de GitHub.
+
+    Une requête GraphQL renvoie les profils de `batch_size` logins (un alias
+    `user(login:)` par login) pour un coût de l'ordre d'un point de quota, au
+    lieu d'un appel REST par profil. La taille des lots s'ajuste au coût
+    annoncé par `rateLimit.cost` : elle double tant que le coût reste dans
+    `target_cost` et diminue en proportion au-delà ; une requête en échec
+    (5xx, délai dépassé, erreur sans données) est découpée en deux.
+
+    Les profils introuvables en GraphQL (organisations, logins renommés) sont
+    demandés en REST (`safe_request`), de même que le reste de la page si une
+    requête échoue encore une fois réduite à un seul login. Un 401 (GraphQL
+    exige un token) désactive GraphQL pour le reste de l'extraction.
+
+    Attributs :
+        url (str)            : URL de l'API GraphQL.
+        user_info_url (str)  : URL de base des profils REST (repli).
+        batch_size (int)     : Taille courante des lots.
+        max_batch_size (int) : Taille maximale des lots.
+        target_cost (int)    : Coût (points) visé par requête.
+        requests (int)       : Requêtes GraphQL envoyées.
+        fallbacks (int)      : Profils demandés en REST.
+        disabled (bool)      : True après un refus d'authentification ou d'accès (401, 403 hors limite).
+    """
+
+    def __init__(self, url=GIT_URL_GRAPHQL, user_info_url=GIT_URL_USER_INFO, batch_size=50, max_batch_size=100, target_cost=1):
+        self.url = url
+        self.user_info_url = user_info_url
+        self.batch_size = batch_size
+        self.max_batch_size = max_batch_size
+        self.target_cost = target_cost
+        self.requests = 0
+        self.fallbacks = 0
+        self.disabled = False
+
+    def fetch(self, logins):
+        """
+        Args:
+            logins (list[str]): Logins dont on veut le profil détaillé.
+
+        Returns:
+            list[dict | None]: Profils réduits dans l'ordre de `logins` (None si introuvable).
+        """
+        found = {}
+        pending = list(logins)
+        while pending and not self.disabled:
+            batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+            data = self._post(batch)
+            if data is None:
+                if len(batch) > 1 and not self.disabled:
+                    # Lot trop lourd ou erreur passagère : nouvel essai en deux fois plus petit
+                    self.batch_size = max(1, len(batch) // 2)
+                    pending = batch + pending
+                    continue
+                # Échec même pour un seul login : le reste de la page passe en REST
+                break
+            for i, login in enumerate(batch):
+                node = data.get(f"u{i}")
+                if node:
+                    found[login] = graphql_profile(node)
+            self._adapt(len(batch), data.get("rateLimit"))
+
+        profiles = []
+        for login in logins:
+            profile = found.get(login)
+            if profile is None:
+                self.fallbacks += 1
+                response = safe_request(f"{self.user_info_url}/{login}")
+                profile = extract_profile(response.json()) if response else None
+            profiles.append(profile)
+        return profiles
+
+    def _adapt(self, size, rate_limit):
+        """Ajuste la taille des lots au coût de la dernière requête."""
+        cost = (rate_limit or {}).get("cost") or 1
+        if cost > self.target_cost:
+            self.batch_size = max(1, size * self.target_cost // cost)
+        elif size >= self.batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
 
-    while len(users_data) < max_users:
-        url = f"{GIT_URL_USERS}{since}"
+    def _post(self, logins, max_retries=5):
+        """
+        Envoie une requête GraphQL pour un lot de logins.
+
+        Returns:
+            dict | None: Champ `data` de la réponse (un alias `u<i>` par login,
+            None si le profil est introuvable), ou None si la requête a échoué.
+        """
+        payload = {"query": graphql_query(len(logins)), "variables": {f"l{i}": login for i, login in enumerate(logins)}}
+        for attempt in range(max_retries):
+            token, delay = graphql_scheduler.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            self.requests += 1
+            try:
+                response = requests.post(self.url, json=payload, headers=graphql_scheduler.auth_headers(token), timeout=30)
+            except requests.exceptions.RequestException as e:
+                print(f"[Exception] {e}")
+                time.sleep(graphql_scheduler.backoff(attempt))
+                continue
+            status = response.status_code
+            graphql_scheduler.update(token, response.headers)
+
+            if status == 200:
+                body = response.json()
+                if body.get("data") is None:
+                    print(f"[GraphQL] Requête rejetée : {body.get('errors')}")
+                return body.get("data")
+
+            elif status == 401:
+                print("[401] GraphQL refusé (token requis) : repli sur l'API REST.")
+                self.disabled = True
+                return None
+
+            elif status in (403, 429) and is_rate_limited(status, response.headers, response.text):
+                pause = graphql_scheduler.penalize(token, response.headers, attempt)
+                print(f"[{status}] Limite GraphQL atteinte. Token en pause {pause:.0f} s.")
+
+            elif status == 403:
+                print("[403] GraphQL refusé (hors limite de requêtes) : repli sur l'API REST.")
+                self.disabled = True
+                return None
+
+            elif 500 <= status < 600:
+                # Souvent un délai dépassé sur un lot trop lourd : l'appelant le découpe
+                print(f"[{status}] Erreur serveur GitHub (GraphQL, lot de {len(logins)}).")
+                time.sleep(graphql_scheduler.backoff(attempt))
+                return None
+
+            else:
+                print(f"[{status}] Erreur inconnue pour la requête GraphQL.")
+                return None
+
+        return None
+
+def keep_profile(profile, rules, on_skip=None):
+    """
+    Args:
+        profile (dict): Profil détaillé réduit.
+        rules (FilterRules | None): Critères appliqués dès l'extraction.
+        on_skip (Callable[[int], None] | None): Appelée avec l'id d'un profil écarté.
+
+    Returns:
+        bool: True si le profil doit être produit.
+    """
+    if rules is None or rules.match(profile):
+        return True
+    if on_skip is not None:
+        on_skip(profile["id"])
+    return False
+
+def iter_users(max_users, users_url=GIT_URL_USERS, user_info_url=GIT_URL_USER_INFO, since=None, graphql=None, rules=None, on_skip=None):
+    """
+    Génère les profils d'utilisateurs GitHub un par un, dans l'ordre croissant des ids.
+
+    Aucun profil n'est conservé en mémoire : l'appelant peut les écrire au fil de l'eau.
+
+    Args:
+        max_users (int): Nombre maximum d'utilisateurs à récupérer.
+        users_url (str): URL de la liste paginée (suivie de l'id `since`).
+        user_info_url (str): URL de base des profils détaillés.
+        since (int | None): Id à partir duquel reprendre (par défaut `SINCE`).
+        graphql (GraphQLDetailFetcher | None): Si fourni, les profils détaillés
+            d'une page sont demandés par lots en GraphQL au lieu d'un appel REST chacun.
+        rules (FilterRules | None): Si fourni, seuls les profils satisfaisant ces
+            critères sont produits (et comptés) ; les ids antérieurs à la date
+            minimale et les comptes déjà écartés par leur résumé dans la liste ne
+            coûtent pas de requête de détail.
+        on_skip (Callable[[int], None] | None): Appelée avec l'id de chaque profil
+            détaillé écarté par `rules`, dans l'ordre des ids (ex. `ExtractionCheckpoint.skip`).
+
+    Yields:
+        dict: Profil réduit d'un utilisateur.
+    """
+    count = 0
+    since = SINCE if since is None else since
+    if rules is not None:
+        since = rules.start_id(since)
+
+    while count < max_users:
+        url = f"{users_url}{since}"
         response = safe_request(url)
 
         if response is None:
@@ -102,29 +345,360 @@ def fetch_users(max_users):
         if not users:
             break
 
+        last_id = users[-1]['id']
+        if rules is not None:
+            users = [user for user in users if rules.match_partial(user)]
+
+        if graphql is not None:
+            wanted = users[:max_users - count]
+            if len(wanted) < len(users):
+                # Page entamée : la suite sera relue si des profils sont écartés
+                last_id = wanted[-1]['id']
+            for user, profile in zip(wanted, graphql.fetch([user['login'] for user in wanted])):
+                if profile is None:
+                    print(f"[Erreur] Impossible de récupérer les infos pour {user['login']}")
+                elif keep_profile(profile, rules, on_skip):
+                    yield profile
+                    count += 1
+            since = last_id
+            continue
+
         for user in users:
             login = user['login']
-            detail_url = f"{GIT_URL_USER_INFO}/{login}"
+            detail_url = f"{user_info_url}/{login}"
             detail_response = safe_request(detail_url)
 
             if detail_response:
-                detail = detail_response.json()
-                users_data.append({
-                    "login": detail.get("login"),
-                    "id": detail.get("id"),
-                    "created_at": detail.get("created_at"),
-                    "avatar_url": detail.get("avatar_url"),
-                    "bio": detail.get("bio")
-                })
-
-                if len(users_data) >= max_users:
+                profile = extract_profile(detail_response.json())
+                if keep_profile(profile, rules, on_skip):
+                    yield profile
+                    count += 1
+
+                if count >= max_users:
                     break
             else:
                 print(f"[Erreur] Impossible de récupérer les infos pour {login}")
 
-        since = users[-1]['id']
+        since = last_id
+
+def fetch_users(max_users, users_url=GIT_URL_USERS, user_info_url=GIT_URL_USER_INFO, graphql=None, rules=None):
+    """
+    Récupère les profils d'utilisateurs GitHub via l'API publique jusqu'à atteindre le nombre demandé.
+
+    Args:
+        max_users (int): Nombre maximum d'utilisateurs à récupérer.
+        users_url (str): URL de la liste paginée (suivie de l'id `since`).
+        user_info_url (str): URL de base des profils détaillés.
+        graphql (GraphQLDetailFetcher | None): Récupération des profils par lots en GraphQL.
+        rules (FilterRules | None): Critères appliqués dès l'extraction (voir `iter_users`).
+
+    Returns:
+        list[dict]: Liste de dictionnaires contenant les données des utilisateurs.
+    """
+    return list(iter_users(max_users, users_url, user_info_url, graphql=graphql, rules=rules))
+
+async def async_safe_request(client, url, semaphores, max_retries=5):
+    """
+    Équivalent asynchrone de `safe_request` : mêmes codes gérés, même ordonnanceur.
+
+    Les réservations de `scheduler` se font sans point d'attente : les tâches
+    concurrentes se répartissent donc les jetons de façon cohérente. Les accès
+    au cache disque (SQLite, synchrones) sont faits dans un thread
+    (`asyncio.to_thread`) pour ne pas bloquer la boucle d'événements.
+
+    Args:
+        client (httpx.AsyncClient): Client HTTP partagé (pool de connexions keep-alive).
+        url (str): L'URL à interroger.
+        semaphores (dict[str, asyncio.Semaphore]): Sémaphore par hôte limitant la concurrence.
+        max_retries (int): Le nombre maximum de tentatives en cas d'erreur.
+
+    Returns:
+        httpx.Response | CachedResponse | None: La réponse HTTP en cas de succès
+        (éventuellement issue du cache `http_cache`), sinon None.
+    """
+    conditional = {}
+    if http_cache is not None:
+        cached, conditional = await asyncio.to_thread(http_cache.lookup, url)
+        if cached is not None:
+            return cached
+
+    semaphore = semaphores[urlsplit(url).netloc]
+    for attempt in range(max_retries):
+        token, delay = scheduler.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            async with semaphore:
+                response = await client.get(url, headers={**scheduler.auth_headers(token), **conditional})
+            status = response.status_code
+            scheduler.update(token, response.headers)
 
-    return users_data
+            if status == 304 and http_cache is not None:
+                cached = await asyncio.to_thread(http_cache.revalidate, url, response)
+                if cached is not None:
+                    return cached
+                conditional = {}
+
+            elif status == 200:
+                if http_cache is not None:
+                    await asyncio.to_thread(http_cache.store, url, response)
+                return response
+
+            elif status in (403, 429) and is_rate_limited(status, response.headers, response.text):
+                pause = scheduler.penalize(token, response.headers, attempt)
+                print(f"[{status}] Limite de requêtes atteinte (vérifie ton token ou quota). Token en pause {pause:.0f} s. URL : {url}")
+
+            elif status == 403:
+                print(f"[403] Accès refusé (hors limite de requêtes), requête abandonnée. URL : {url}")
+                break
+
+            elif 500 <= status < 600:
+                print(f"[{status}] Erreur serveur GitHub. Tentative {attempt+1}/{max_retries}")
+                await asyncio.sleep(scheduler.backoff(attempt))
+
+            else:
+                print(f"[{status}] Erreur inconnue pour URL : {url}")
+                break
+
+        except httpx.HTTPError as e:
+            print(f"[Exception] {e}")
+            await asyncio.sleep(scheduler.backoff(attempt))
+
+    return None
+
+async def aiter_users(max_users, concurrency=10, users_url=GIT_URL_USERS, user_info_url=GIT_URL_USER_INFO, since=None, rules=None, on_skip=None):
+    """
+    Variante asynchrone de `iter_users` : les profils détaillés d'une page sont
+    récupérés en parallèle (au plus `concurrency` requêtes simultanées par hôte)
+    sur un pool de connexions HTTP partagé.
+
+    Args:
+        max_users (int): Nombre maximum d'utilisateurs à récupérer.
+        concurrency (int): Nombre maximum de requêtes simultanées par hôte.
+        users_url (str): URL de la liste paginée (suivie de l'id `since`).
+        user_info_url (str): URL de base des profils détaillés.
+        since (int | None): Id à partir duquel reprendre (par défaut `SINCE`).
+        rules (FilterRules | None): Critères appliqués dès l'extraction (voir `iter_users`).
+        on_skip (Callable[[int], None] | None): Appelée avec l'id de chaque profil écarté.
+
+    Yields:
+        dict: Profil réduit d'un utilisateur, dans le même ordre que le mode séquentiel.
+    """
+    count = 0
+    since = SINCE if since is None else since
+    if rules is not None:
+        since = rules.start_id(since)
+    semaphores = {}
+    for base_url in (users_url, user_info_url):
+        semaphores.setdefault(urlsplit(base_url).netloc, asyncio.Semaphore(concurrency))
+    limits = httpx.Limits(max_connections=concurrency * len(semaphores), max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        while count < max_users:
+            response = await async_safe_request(client, f"{users_url}{since}", semaphores)
+            if response is None:
+                break
+
+            users = response.json()
+            if not users:
+                break
+
+            last_id = users[-1]['id']
+            if rules is not None:
+                users = [user for user in users if rules.match_partial(user)]
+
+            # Seuls les profils encore nécessaires sont demandés
+            wanted = users[:max_users - count]
+            if len(wanted) < len(users):
+                last_id = wanted[-1]['id']
+            details = await asyncio.gather(*(
+                async_safe_request(client, f"{user_info_url}/{user['login']}", semaphores)
+                for user in wanted
+            ))
+            for user, detail_response in zip(wanted, details):
+                if detail_response is None:
+                    print(f"[Erreur] Impossible de récupérer les infos pour {user['login']}")
+                    continue
+                profile = extract_profile(detail_response.json())
+                if keep_profile(profile, rules, on_skip):
+                    yield profile
+                    count += 1
+
+            since = last_id
+
+async def fetch_users_async(max_users, concurrency=10, users_url=GIT_URL_USERS, user_info_url=GIT_URL_USER_INFO, rules=None):
+    """
+    Variante asynchrone de `fetch_users` (voir `aiter_users`).
+
+    Args:
+        max_users (int): Nombre maximum d'utilisateurs à récupérer.
+        concurrency (int): Nombre maximum de requêtes simultanées par hôte.
+        users_url (str): URL de la liste paginée (suivie de l'id `since`).
+        user_info_url (str): URL de base des profils détaillés.
+        rules (FilterRules | None): Critères appliqués dès l'extraction.
+
+    Returns:
+        list[dict]: Liste de dictionnaires contenant les données des utilisateurs.
+    """
+    return [user async for user in aiter_users(max_users, concurrency, users_url, user_info_url, rules=rules)]
+
+class ExtractionCheckpoint:
+    """
+    Sortie JSONL incrémentale et point de reprise d'une extraction.
+
+    Chaque profil est ajouté au fichier JSONL dès sa réception, puis le point
+    de reprise (dernier id écrit et nombre de profils) est réécrit de façon
+    atomique. Les profils arrivant par ordre d'id croissant, ce dernier id
+    suffit comme valeur `since` pour reprendre sans redemander les profils
+    déjà écrits : la mémoire utilisée reste constante quelle que soit la
+    durée de l'extraction.
+
+    Attributs :
+        output_path (str)     : Fichier JSONL des profils (un objet JSON par ligne).
+        checkpoint_path (str) : Fichier JSON du point de reprise.
+        since (int | None)    : Dernier id écrit (None si rien n'a été écrit).
+        count (int)           : Nombre de profils écrits.
+    """
+
+    def __init__(self, output_path="data/users.jsonl", checkpoint_path="data/extract_checkpoint.json"):
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path
+        self.since = None
+        self.count = 0
+        self.last_login = None
+        self._file = None
+
+    def open(self, resume=False):
+        """
+        Ouvre le fichier de sortie.
+
+        Args:
+            resume (bool): Si True, reprend depuis le point de reprise existant
+                (s'il existe) ; sinon, repart d'une sortie vide.
+        """
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        if resume and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.since = state["since"]
+            self.count = state["count"]
+            self.last_login = state.get("last_login")
+            self._truncate_partial_line()
+            mode = "a"
+        else:
+            self.since, self.count, self.last_login = None, 0, None
+            mode = "w"
+        self._file = open(self.output_path, mode, encoding="utf-8")
+
+    def append(self, profile):
+        """
+        Écrit un profil dans le fichier JSONL puis met à jour le point de reprise.
+
+        Args:
+            profile (dict): Profil réduit d'un utilisateur.
+        """
+        self._file.write(json.dumps(profile, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.since = profile["id"]
+        self.count += 1
+        self.last_login = profile["login"]
+        self._save()
+
+    def skip(self, user_id):
+        """
+        Avance le point de reprise après un profil écarté dès l'extraction
+        (non écrit) : il ne sera pas redemandé à la reprise.
+
+        Args:
+            user_id (int): Id du profil écarté.
+        """
+        self.since = user_id
+        self._save()
+
+    def _truncate_partial_line(self):
+        """
+        Supprime une éventuelle dernière ligne incomplète (arrêt pendant une écriture).
+
+        Une ligne complète mais absente du point de reprise sera simplement
+        réécrite : le doublon est éliminé par `remove_duplicates` au filtrage.
+        """
+        if not os.path.exists(self.output_path):
+            return
+        with open(self.output_path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            if position != size:
+                f.truncate(position)
+
+    def _save(self):
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"since": self.since, "count": self.count, "last_login": self.last_login}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def close(self):
+        """Ferme le fichier de sortie."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def incremental_since(dataset_path, checkpoint_path="data/extract_checkpoint.json"):
+    """
+    Point de départ d'une extraction incrémentale : le plus grand id déjà stocké.
+
+    Le jeu filtré ne contient pas les profils écartés au filtrage : le dernier
+    id du point de reprise de l'extraction précédente est donc aussi pris en
+    compte, pour ne pas redemander ces profils.
+
+    Args:
+        dataset_path (str): Jeu de données déjà constitué (JSON ou JSONL).
+        checkpoint_path (str): Point de reprise de l'extraction précédente.
+
+    Returns:
+        int: Valeur `since` de la prochaine extraction (au moins `SINCE`).
+    """
+    candidates = [SINCE, max_stored_id(dataset_path)]
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            candidates.append(json.load(f).get("since"))
+    return max(since for since in candidates if since is not None)
+
+def jsonl_to_json(jsonl_path, json_path="data/users.json"):
+    """
+    Convertit un fichier JSONL en tableau JSON (même format que `save_to_json`)
+    sans charger tous les profils en mémoire.
+
+    Args:
+        jsonl_path (str): Fichier JSONL source.
+        json_path (str): Fichier JSON de sortie.
+    """
+    os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+    with open(jsonl_path, "r", encoding="utf-8") as src, open(json_path, "w", encoding="utf-8") as dst:
+        dst.write("[")
+        separator = "\n"
+        for line in src:
+            if not line.strip():
+                continue
+            record = json.dumps(json.loads(line), indent=4, ensure_ascii=False)
+            dst.write(separator + textwrap.indent(record, "    "))
+            separator = ",\n"
+        dst.write("\n]" if separator != "\n" else "]")
+    print(f"\n✅ Données enregistrées dans {json_path}")
 
 def save_to_json(data, path="data/users.json"):
     """
@@ -143,10 +717,64 @@ if __name__ == "__main__":
     """
     Point d'entrée principal du script. Parse les arguments et lance l'extraction puis l'enregistrement des utilisateurs GitHub.
     """
+    # Encodage UTF-8 pour éviter les erreurs d'affichage
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--max-users", type=int, default=30, help="Nombre d'utilisateurs à récupérer")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requêtes simultanées (1 = mode séquentiel)")
+    parser.add_argument("--resume", action="store_true", help="Reprend depuis le dernier point de reprise")
+    parser.add_argument("--incremental", nargs="?", const="data/filtered_users.json",
+                        help="N'extrait que les profils d'id supérieur au plus grand id déjà stocké dans ce jeu "
+                             "(défaut : data/filtered_users.json) ou dans le point de reprise")
+    parser.add_argument("--jsonl", default="data/users.jsonl", help="Fichier JSONL écrit au fil de l'extraction")
+    parser.add_argument("--checkpoint", default="data/extract_checkpoint.json", help="Fichier du point de reprise")
+    parser.add_argument("--prefilter", action="store_true",
+                        help="Applique les critères de filtered_users.py dès l'extraction (profils écartés non écrits)")
+    parser.add_argument("--graphql", action="store_true", help="Profils détaillés demandés par lots via l'API GraphQL")
+    parser.add_argument("--graphql-batch", type=int, default=50, help="Taille initiale des lots GraphQL")
+    parser.add_argument("--http-cache", default="data/http_cache.sqlite", help="Cache disque des réponses GitHub")
+    parser.add_argument("--cache-ttl", type=float, default=3600, help="Durée (s) sans revalidation d'un profil en cache")
+    parser.add_argument("--cache-max-mb", type=int, default=512, help="Taille maximale du cache (Mo)")
+    parser.add_argument("--no-cache", action="store_true", help="Désactive le cache disque")
     args = parser.parse_args()
 
-    print(f"🔍 Extraction de {args.max_users} utilisateurs depuis l'API GitHub...")
-    utilisateurs = fetch_users(args.max_users)
-    save_to_json(utilisateurs)
+    if not args.no_cache:
+        http_cache = HttpCache(args.http_cache, ttl=args.cache_ttl, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+    # Lu avant `open` : sans --resume, l'extraction repart d'un JSONL vide (le delta)
+    since = incremental_since(args.incremental, args.checkpoint) if args.incremental else None
+
+    with ExtractionCheckpoint(args.jsonl, args.checkpoint) as checkpoint:
+        checkpoint.open(resume=args.resume)
+        remaining = args.max_users - checkpoint.count
+        if checkpoint.since is not None:
+            print(f"↩️  Reprise après {checkpoint.last_login} (id {checkpoint.since}), {checkpoint.count} profils déjà extraits.")
+        if since is not None and since > (checkpoint.since or 0):
+            checkpoint.since = since
+            print(f"🔁 Extraction incrémentale après l'id {since}.")
+
+        print(f"🔍 Extraction de {remaining} utilisateurs depuis l'API GitHub...")
+        graphql = None
+        rules = RULES if args.prefilter else None
+        if args.graphql:
+            # Une requête par lot : le mode séquentiel suffit
+            graphql = GraphQLDetailFetcher(batch_size=args.graphql_batch, max_batch_size=max(100, args.graphql_batch))
+            for profile in iter_users(remaining, since=checkpoint.since, graphql=graphql, rules=rules, on_skip=checkpoint.skip):
+                checkpoint.append(profile)
+        elif args.concurrency > 1:
+            async def run():
+                async for profile in aiter_users(remaining, args.concurrency, since=checkpoint.since, rules=rules, on_skip=checkpoint.skip):
+                    checkpoint.append(profile)
+            asyncio.run(run())
+        else:
+            for profile in iter_users(remaining, since=checkpoint.since, rules=rules, on_skip=checkpoint.skip):
+                checkpoint.append(profile)
+
+    jsonl_to_json(args.jsonl)
+    print(f"⏱️  Ordonnanceur : {scheduler.summary()}")
+    if graphql is not None:
+        print(f"🧩 GraphQL : {graphql.requests} requêtes (lots de {graphql.batch_size}), {graphql.fallbacks} profils en REST ; {graphql_scheduler.summary()}")
+    if http_cache is not None:
+        print(f"🗄️  Cache : {http_cache.hits} réponses fraîches, {http_cache.revalidated} revalidées (304), {http_cache.misses} absentes.")
+        http_cache.close()
@@ -1,6 +1,24 @@
+import argparse
 import json
 import os
+import textwrap
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import compress, islice
+
+import numpy as np
+
+REQUIRED_KEYS = {"login", "id", "created_at", "avatar_url", "bio"}
+DATE_MIN = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+# Format des dates renvoyées par GitHub (AAAA-MM-JJTHH:MM:SSZ) : 20 caractères
+# ASCII, ce qui permet de décoder une colonne entière comme une matrice d'octets.
+DIGIT_COLUMNS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+SEPARATOR_COLUMNS = [4, 7, 10, 13, 16, 19]
+SEPARATORS = np.frombuffer(b"--T::Z", dtype=np.uint8)
+DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
 
 def load_users(filepath):
     """
@@ -16,14 +34,33 @@ def load_users(filepath):
         users = json.load(f)
 
     # Vérification de la structure
-    required_keys = {"login", "id", "created_at", "avatar_url", "bio"}
-    cleaned = []
+    return list(iter_valid(users))
+
+def iter_valid(users):
+    """
+    Ne laisse passer que les utilisateurs ayant la structure minimale requise.
+
+    Args:
+        users (Iterable[dict]): Utilisateurs bruts.
+
+    Yields:
+        dict: Utilisateurs valides.
+    """
     for user in users:
-        if isinstance(user, dict) and required_keys.issubset(user):
-            cleaned.append(user)
+        if is_valid(user):
+            yield user
         else:
             print(f"[⚠️  Ignoré] Structure invalide : {user}")
-    return cleaned
+
+def is_valid(user):
+    """
+    Args:
+        user (Any): Enregistrement brut.
+
+    Returns:
+        bool: True si l'enregistrement a la structure minimale requise.
+    """
+    return isinstance(user, dict) and REQUIRED_KEYS.issubset(user)
 
 def remove_duplicates(users):
     """
@@ -40,41 +77,600 @@ def remove_duplicates(users):
         unique_users[user["id"]] = user
     return list(unique_users.values()), len(users) - len(unique_users)
 
-def filter_users(users):
+def created_after(value, date_min=DATE_MIN):
+    """
+    Critère de date d'un seul utilisateur.
+
+    Args:
+        value (Any): Valeur de `created_at`.
+        date_min (datetime): Borne (exclue), avec fuseau horaire.
+
+    Returns:
+        bool: True si la date est valide et strictement postérieure à `date_min`.
+    """
+    if not isinstance(value, str):
+        return False
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")) > date_min
+    except (ValueError, TypeError):
+        # TypeError : date sans fuseau horaire, non comparable à la borne
+        return False
+
+def parse_canonical_dates(values):
     """
-    Applique un filtrage métier sur les utilisateurs :
+    Décode en une fois une colonne de dates au format GitHub.
+
+    Args:
+        values (list[str]): Valeurs de `created_at`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray] | None: Pour chaque ligne, un booléen
+        indiquant si la date est au format canonique et valide, et sa clé
+        entière AAAAMMJJHHMMSS ; None si la colonne ne peut pas être décodée
+        en bloc (longueurs différentes ou caractères non ASCII).
+    """
+    try:
+        raw = "".join(values).encode("ascii")
+    except (TypeError, UnicodeEncodeError):
+        return None
+    if len(raw) != 20 * len(values):
+        return None
+
+    chars = np.frombuffer(raw, dtype=np.uint8).reshape(len(values), 20)
+    # Soustraction en uint8 : tout caractère hors de '0'..'9' donne une valeur > 9
+    digits = chars[:, DIGIT_COLUMNS] - np.uint8(ord("0"))
+    shape_ok = (digits <= 9).all(axis=1) & (chars[:, SEPARATOR_COLUMNS] == SEPARATORS).all(axis=1)
+
+    digits = digits.astype(np.int32)
+    pairs = digits[:, 0::2] * 10 + digits[:, 1::2]
+    century, year_low, month, day, hour, minute, second = pairs.T
+    year = century * 100 + year_low
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_ok = (month >= 1) & (month <= 12)
+    days = DAYS_IN_MONTH[np.where(month_ok, month, 0)] + (leap & (month == 2))
+    valid = (
+        shape_ok & month_ok & (year >= 1) & (day >= 1) & (day <= days)
+        & (hour < 24) & (minute < 60) & (second < 60)
+    )
+    key = (((year * 100 + month) * 100 + day).astype(np.int64) * 1_000_000) + (hour * 100 + minute) * 100 + second
+    return valid, key
+
+def created_after_mask(values, date_min=DATE_MIN):
+    """
+    Évalue le critère de date (`created_after`) sur une colonne entière de `created_at`.
+
+    Les dates au format GitHub sont décodées et comparées de façon vectorisée
+    (`parse_canonical_dates`) ; les autres passent par `created_after`.
+
+    Args:
+        values (list[str]): Valeurs de `created_at`.
+        date_min (datetime): Borne (exclue), avec fuseau horaire.
+
+    Returns:
+        np.ndarray: Masque booléen, True pour chaque date valide strictement postérieure à `date_min`.
+    """
+    parsed = parse_canonical_dates(values)
+    if parsed is None:
+        fallback = range(len(values))
+        mask = np.zeros(len(values), dtype=bool)
+    else:
+        valid, key = parsed
+        mask = valid & (key > int(date_min.astimezone(timezone.utc).strftime("%Y%m%d%H%M%S")))
+        # Lignes au format non canonique (ex. "2016-01-01 00:00:00Z") ou invalides :
+        # datetime.fromisoformat tranche, exactement comme dans created_after
+        fallback = np.flatnonzero(~valid).tolist()
+
+    for index in fallback:
+        mask[index] = created_after(values[index], date_min)
+    return mask
+
+def has_text(value):
+    """
+    Args:
+        value (Any): Valeur d'un champ.
+
+    Returns:
+        bool: True pour une chaîne non vide une fois les espaces retirés.
+    """
+    return isinstance(value, str) and bool(value.strip())
+
+def publish(user):
+    """
+    Args:
+        user (dict): Utilisateur retenu.
+
+    Returns:
+        dict: Utilisateur réduit aux champs publiés, dans l'ordre du fichier de sortie.
+    """
+    return {
+        "login": user["login"],
+        "id": user["id"],
+        "created_at": user["created_at"],
+        "avatar_url": user["avatar_url"],
+        "bio": user["bio"]
+    }
+
+class Rule:
+    """
+    Critère métier élémentaire portant sur un champ.
+
+    Attributs :
+        field (str)             : Champ évalué (absent = None).
+        test (Callable)         : Prédicat sur la valeur du champ (fonction de
+            module ou `partial`, pour pouvoir être envoyé aux processus de filtrage).
+        column (Callable | None): Évaluation vectorisée du même prédicat sur une
+            liste de valeurs (renvoie un masque booléen NumPy).
+        cost (int)              : Coût relatif ; les critères les moins coûteux sont évalués d'abord.
+    """
+
+    def __init__(self, field, test, column=None, cost=1):
+        self.field = field
+        self.test = test
+        self.column = column
+        self.cost = cost
+
+class FilterRules:
+    """
+    Critères du filtrage métier, décrits une fois et partagés par
+    `filtered_users.py` et `extract_users.py`.
+
+    Les critères sont triés par coût : chaque utilisateur est évalué en un
+    passage qui s'arrête au premier critère non satisfait (la date, plus
+    coûteuse à analyser, n'est décodée que pour les utilisateurs ayant une
+    bio et un avatar). Sur un lot (`select`), les critères vectorisés ne sont
+    évalués que sur les lignes encore retenues.
+
+    Pour l'extraction, `match_partial` n'évalue que les critères dont le
+    champ est déjà connu (ex. `avatar_url` dans la liste `/users?since=`) :
+    les comptes écartés ne coûtent pas de requête de détail. Si `min_id` est
+    fourni, `start_id` saute aussi les ids antérieurs.
+
+    Attributs :
+        rules (tuple[Rule, ...]) : Critères, par coût croissant.
+        project (Callable)       : Réduction d'un utilisateur retenu aux champs publiés.
+        min_id (int | None)      : Borne vérifiée telle que tout compte d'id
+            inférieur ou égal a été créé avant la date minimale (ids GitHub
+            attribués dans l'ordre de création) ; None = pas de saut d'ids.
+    """
+
+    def __init__(self, rules, project=publish, min_id=None):
+        self.rules = tuple(sorted(rules, key=lambda rule: rule.cost))
+        self.project = project
+        self.min_id = min_id
+        self._checks = tuple((rule.field, rule.test) for rule in self.rules)
+        self._row_rules = tuple(rule for rule in self.rules if rule.column is None)
+        self._column_rules = tuple(rule for rule in self.rules if rule.column is not None)
+
+    def match(self, user):
+        """
+        Args:
+            user (dict): Utilisateur.
+
+        Returns:
+            bool: True si l'utilisateur satisfait tous les critères.
+        """
+        for field, test in self._checks:
+            if not test(user.get(field)):
+                return False
+        return True
+
+    def apply(self, user):
+        """
+        Args:
+            user (dict): Utilisateur valide.
+
+        Returns:
+            dict | None: Utilisateur réduit aux champs publiés, ou None s'il est écarté.
+        """
+        for field, test in self._checks:
+            if not test(user.get(field)):
+                return None
+        return self.project(user)
+
+    def match_partial(self, user):
+        """
+        Évalue les seuls critères dont le champ est présent (résumé de la liste paginée).
+
+        Args:
+            user (dict): Utilisateur incomplet.
+
+        Returns:
+            bool: False si l'utilisateur est certainement écarté ; True s'il peut être retenu.
+        """
+        if self.min_id is not None and isinstance(user.get("id"), int) and user["id"] <= self.min_id:
+            return False
+        for field, test in self._checks:
+            if field in user and not test(user[field]):
+                return False
+        return True
+
+    def start_id(self, since):
+        """
+        Args:
+            since (int): Id à partir duquel l'extraction commencerait.
+
+        Returns:
+            int: Même valeur, relevée à `min_id` s'il est fourni.
+        """
+        return since if self.min_id is None else max(since, self.min_id)
+
+    def select(self, users):
+        """
+        Filtrage d'un lot, critère par critère sur la colonne des seules
+        lignes encore retenues : d'abord les critères simples, puis les
+        critères vectorisés (`Rule.column`).
+
+        Args:
+            users (list[dict]): Lot d'utilisateurs.
+
+        Returns:
+            list[int]: Positions des utilisateurs satisfaisant tous les critères, dans l'ordre.
+        """
+        rows = range(len(users))
+        for rule in self._row_rules + self._column_rules:
+            if not rows:
+                break
+            field = rule.field
+            if rule.column is None:
+                test = rule.test
+                rows = [row for row in rows if test(users[row].get(field))]
+            else:
+                rows = list(compress(rows, rule.column([users[row].get(field) for row in rows]).tolist()))
+        return list(rows)
+
+# Critères métier : bio présente, avatar présent, compte créé après DATE_MIN.
+# Fonctions de module : l'ensemble peut être envoyé aux processus de filtrage.
+RULES = FilterRules(
+    [
+        Rule("bio", bool),
+        Rule("avatar_url", has_text),
+        Rule("created_at", created_after, column=created_after_mask, cost=10),
+    ]
+)
+
+def filter_users(users, rules=RULES):
+    """
+    Applique un filtrage métier sur les utilisateurs (voir `RULES`) :
     - Avatar présent
     - Bio présente
     - Compte créé après le 1er janvier 2015
 
     Args:
         users (list[dict]): Liste des utilisateurs uniques.
+        rules (FilterRules): Critères appliqués.
 
     Returns:
         list[dict]: Liste des utilisateurs filtrés.
     """
-    filtered = []
-    date_min = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    return list(iter_filtered(users, rules))
+
+def iter_filtered(users, rules=RULES):
+    """
+    Version génératrice de `filter_users` : mêmes critères, un utilisateur à la fois.
 
+    Args:
+        users (Iterable[dict]): Utilisateurs uniques.
+        rules (FilterRules): Critères appliqués.
+
+    Yields:
+        dict: Utilisateurs retenus, réduits aux champs publiés.
+    """
+    apply = rules.apply
     for user in users:
-        bio = user.get("bio")
-        avatar_url = user.get("avatar_url", "").strip()
-        created_at_str = user.get("created_at", "")
-        try:
-            created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-        except ValueError:
+        kept = apply(user)
+        if kept is not None:
+            yield kept
+
+def filter_batch(users, rules=RULES):
+    """
+    Filtrage par lot (`FilterRules.select`) : critères simples puis critère de
+    date évalué en colonne, chacun sur les seules lignes encore retenues. Le
+    résultat est identique à `filter_users` sur le même lot.
+
+    Args:
+        users (list[dict]): Lot d'utilisateurs uniques.
+        rules (FilterRules): Critères appliqués.
+
+    Returns:
+        list[dict]: Utilisateurs retenus, réduits aux champs publiés.
+    """
+    return list(map(rules.project, map(users.__getitem__, rules.select(users))))
+
+def iter_batches(users, batch_size):
+    """
+    Args:
+        users (Iterable[dict]): Utilisateurs.
+        batch_size (int): Taille des lots.
+
+    Yields:
+        list[dict]: Lots consécutifs d'au plus `batch_size` utilisateurs.
+    """
+    users = iter(users)
+    while batch := list(islice(users, batch_size)):
+        yield batch
+
+def iter_filtered_parallel(users, workers=None, batch_size=10_000, rules=RULES):
+    """
+    Filtrage par lots (`filter_batch`) réparti sur plusieurs processus.
+
+    L'ordre des utilisateurs est conservé et au plus `2 × workers` lots sont en
+    cours à la fois, ce qui garde la mémoire bornée en mode streaming.
+
+    Args:
+        users (Iterable[dict]): Utilisateurs uniques.
+        workers (int | None): Nombre de processus (None = nombre de cœurs ;
+            1 = filtrage par lots dans le processus courant).
+        batch_size (int): Taille des lots envoyés aux processus.
+        rules (FilterRules): Critères appliqués.
+
+    Yields:
+        dict: Utilisateurs retenus.
+    """
+    if workers == 1:
+        for batch in iter_batches(users, batch_size):
+            yield from filter_batch(batch, rules)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        max_pending = 2 * workers
+        for batch in iter_batches(users, batch_size):
+            pending.append(executor.submit(filter_batch, batch, rules))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def filter_users_parallel(users, workers=None, batch_size=10_000, rules=RULES):
+    """
+    Équivalent de `filter_users` utilisant le filtrage par lots sur plusieurs cœurs.
+
+    Args:
+        users (list[dict]): Liste des utilisateurs uniques.
+        workers (int | None): Nombre de processus (None = nombre de cœurs).
+        batch_size (int): Taille des lots envoyés aux processus.
+        rules (FilterRules): Critères appliqués.
+
+    Returns:
+        list[dict]: Liste des utilisateurs filtrés.
+    """
+    return list(iter_filtered_parallel(users, workers, batch_size, rules))
+
+def iter_json_array(f, chunk_size=1 << 16, max_item_size=1 << 24):
+    """
+    Lit un tableau JSON élément par élément, sans charger le fichier entier.
+
+    Args:
+        f (TextIO): Fichier ouvert en lecture, contenant un tableau JSON.
+        chunk_size (int): Nombre de caractères lus à chaque fois.
+        max_item_size (int): Taille maximale d'un élément (protège la mémoire
+            si le fichier est corrompu).
+
+    Yields:
+        Any: Éléments du tableau, dans l'ordre.
+
+    Raises:
+        ValueError: Si le contenu n'est pas un tableau JSON valide.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def refill():
+        nonlocal buffer, position, eof
+        if len(buffer) - position > max_item_size:
+            raise ValueError("Élément JSON invalide ou trop volumineux")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+        return not eof
+
+    def next_char():
+        # Prochain caractère significatif (None en fin de fichier)
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not refill():
+                return None
+
+    if next_char() != "[":
+        raise ValueError("Tableau JSON attendu")
+    position += 1
+
+    first = True
+    while True:
+        char = next_char()
+        if char is None:
+            raise ValueError("Fin de fichier inattendue dans le tableau JSON")
+        if char == "]":
+            return
+        if not first:
+            if char != ",":
+                raise ValueError("Virgule attendue entre deux éléments du tableau JSON")
+            position += 1
+            next_char()
+        first = False
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                refill()
+                continue
+            # Un élément n'est complet que s'il est suivi d'un séparateur :
+            # sinon il peut être tronqué par la fin du tampon (ex. "3" de "3.5e10")
+            if eof or (end < len(buffer) and (buffer[end] in ",]" or buffer[end].isspace())):
+                break
+            refill()
+        yield item
+        position = end
+
+def iter_records(filepath):
+    """
+    Lit les utilisateurs d'un fichier JSON (tableau) ou JSONL (un objet par ligne)
+    au fil de l'eau.
+
+    Args:
+        filepath (str): Chemin du fichier ; l'extension `.jsonl` sélectionne le format JSONL.
+
+    Yields:
+        Any: Enregistrements bruts.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        if filepath.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(f)
+
+class PipelineStats:
+    """
+    Compteurs du pipeline en streaming et mesure du débit.
+
+    Attributs :
+        loaded (int)     : Utilisateurs valides lus.
+        duplicates (int) : Doublons supprimés.
+        kept (int)       : Utilisateurs écrits en sortie.
+        report_every (int): Fréquence (en enregistrements lus) de l'affichage du débit.
+    """
+
+    def __init__(self, report_every=100_000):
+        self.loaded = 0
+        self.duplicates = 0
+        self.kept = 0
+        self.report_every = report_every
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        """float: Débit moyen en enregistrements lus par seconde."""
+        return self.loaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def count_loaded(self, users):
+        """
+        Compte les utilisateurs qui traversent l'étape et affiche le débit périodiquement.
+
+        Args:
+            users (Iterable[dict]): Utilisateurs valides.
+
+        Yields:
+            dict: Les mêmes utilisateurs.
+        """
+        for user in users:
+            self.loaded += 1
+            if self.report_every and self.loaded % self.report_every == 0:
+                print(f"[⏱️ ] {self.loaded} utilisateurs lus ({self.rate:,.0f} enr/s)")
+            yield user
+
+def latest_duplicates(users):
+    """
+    Premier passage du dédoublonnage en streaming : relève la dernière version
+    de chaque id présent plusieurs fois. Seuls l'ensemble des ids et ces
+    versions sont gardés en mémoire.
+
+    Args:
+        users (Iterable[dict]): Utilisateurs valides.
+
+    Returns:
+        dict[int, dict]: Id en double → dernière occurrence.
+    """
+    seen, latest = set(), {}
+    for user in users:
+        if user["id"] in seen:
+            latest[user["id"]] = user
+        else:
+            seen.add(user["id"])
+    return latest
+
+def iter_unique(users, stats, latest=None):
+    """
+    Suppression des doublons en streaming, avec la même règle que
+    `remove_duplicates` : chaque id garde la position de sa première
+    occurrence et le contenu de sa dernière (`latest`, relevé par un premier
+    passage avec `latest_duplicates`).
+
+    Args:
+        users (Iterable[dict]): Utilisateurs valides.
+        stats (PipelineStats): Compteurs mis à jour.
+        latest (dict[int, dict] | None): Dernière occurrence des ids en double
+            (None = la première occurrence est conservée).
+
+    Yields:
+        dict: Utilisateurs uniques.
+    """
+    latest = latest or {}
+    seen = set()
+    for user in users:
+        if user["id"] in seen:
+            stats.duplicates += 1
             continue
+        seen.add(user["id"])
+        yield latest.get(user["id"], user)
+
+def write_users_stream(users, output_path, stats=None):
+    """
+    Écrit les utilisateurs au fil de l'eau, au même format que `save_filtered_users`
+    (ou en JSONL si `output_path` se termine par `.jsonl`).
+
+    Args:
+        users (Iterable[dict]): Utilisateurs à écrire.
+        output_path (str): Chemin du fichier de sortie.
+        stats (PipelineStats | None): Compteurs mis à jour.
+    """
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    jsonl = output_path.endswith(".jsonl")
+    with open(output_path, "w", encoding="utf-8") as f:
+        separator = "[\n" if not jsonl else ""
+        for user in users:
+            if jsonl:
+                f.write(json.dumps(user, ensure_ascii=False) + "\n")
+            else:
+                f.write(separator + textwrap.indent(json.dumps(user, indent=4, ensure_ascii=False), "    "))
+                separator = ",\n"
+            if stats is not None:
+                stats.kept += 1
+        if not jsonl:
+            f.write("\n]" if separator == ",\n" else "[]")
 
-        if bio and avatar_url and created_at > date_min:
-            filtered.append({
-                "login": user["login"],
-                "id": user["id"],
-                "created_at": user["created_at"],
-                "avatar_url": user["avatar_url"],
-                "bio": user["bio"]
-            })
+def run_stream(input_path, output_path, report_every=100_000, workers=0):
+    """
+    Pipeline en streaming : lecture incrémentale → validation → dédoublonnage →
+    filtrage → écriture, sans liste intermédiaire. Le fichier d'entrée est lu
+    deux fois : le premier passage relève la dernière version des ids en
+    double, pour garder la même version que le mode classique.
 
-    return filtered
+    Args:
+        input_path (str): Fichier d'entrée (JSON ou JSONL).
+        output_path (str): Fichier de sortie (JSON ou JSONL).
+        report_every (int): Fréquence d'affichage du débit.
+        workers (int | None): 0 = filtrage simple ; sinon filtrage par lots
+            sur `workers` processus (None = nombre de cœurs).
+
+    Returns:
+        PipelineStats: Compteurs du traitement.
+    """
+    stats = PipelineStats(report_every)
+    latest = latest_duplicates(user for user in iter_records(input_path) if is_valid(user))
+    users = iter_unique(stats.count_loaded(iter_valid(iter_records(input_path))), stats, latest)
+    if workers == 0:
+        filtered = iter_filtered(users)
+    else:
+        filtered = iter_filtered_parallel(users, workers)
+    write_users_stream(filtered, output_path, stats)
+    return stats
 
 def save_filtered_users(users, output_path):
     """
@@ -88,27 +684,202 @@ def save_filtered_users(users, output_path):
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(users, f, indent=4, ensure_ascii=False)
 
+def max_stored_id(filepath):
+    """
+    Plus grand id présent dans un fichier d'utilisateurs (JSON ou JSONL).
+
+    Args:
+        filepath (str): Chemin du fichier.
+
+    Returns:
+        int | None: Plus grand id, ou None si le fichier est absent ou ne contient aucun utilisateur.
+    """
+    if not os.path.exists(filepath):
+        return None
+    ids = (record["id"] for record in iter_records(filepath) if isinstance(record, dict) and isinstance(record.get("id"), int))
+    return max(ids, default=None)
+
+def merge_users(existing, updates, rules=RULES):
+    """
+    Fusionne des profils nouveaux ou rafraîchis dans un jeu de données filtré, par id.
+
+    Chaque profil de `updates` passe par les critères `rules` :
+    - retenu et absent du jeu : ajouté (`added`) ;
+    - retenu et différent de la version stockée : remplacé (`updated`) ;
+    - écarté alors qu'il était stocké (bio supprimée, etc.) : retiré (`removed`).
+    Un id présent plusieurs fois dans `updates` est pris dans sa dernière
+    version, comme avec `remove_duplicates`.
+
+    Args:
+        existing (Iterable[dict]): Jeu de données filtré actuel.
+        updates (Iterable[dict]): Profils valides extraits depuis.
+        rules (FilterRules): Critères appliqués.
+
+    Returns:
+        tuple[list[dict], list[dict]]: Jeu fusionné (trié par id) et journal des
+        changements, dans l'ordre des ids : `{"op": "added" | "updated", "id", "user"}`
+        ou `{"op": "removed", "id", "login"}`.
+    """
+    merged = {user["id"]: user for user in existing}
+    latest = {}
+    for user in updates:
+        latest[user["id"]] = user
+
+    changes = []
+    for user_id in sorted(latest):
+        kept = rules.apply(latest[user_id])
+        previous = merged.get(user_id)
+        if kept is None:
+            if previous is not None:
+                del merged[user_id]
+                changes.append({"op": "removed", "id": user_id, "login": previous["login"]})
+        elif previous is None:
+            merged[user_id] = kept
+            changes.append({"op": "added", "id": user_id, "user": kept})
+        elif kept != previous:
+            merged[user_id] = kept
+            changes.append({"op": "updated", "id": user_id, "user": kept})
+    return sorted(merged.values(), key=lambda user: user["id"]), changes
+
+def write_changes(changes, changes_path):
+    """
+    Écrit le journal des changements d'une fusion (JSONL, un changement par ligne).
+
+    Args:
+        changes (list[dict]): Changements renvoyés par `merge_users`.
+        changes_path (str): Chemin du journal (remplacé à chaque exécution).
+    """
+    os.makedirs(os.path.dirname(changes_path) or ".", exist_ok=True)
+    with open(changes_path, "w", encoding="utf-8") as f:
+        for change in changes:
+            f.write(json.dumps(change, ensure_ascii=False) + "\n")
+
+def run_merge(input_path, base_path, output_path, changes_path):
+    """
+    Synchronisation incrémentale : fusionne les profils extraits depuis la dernière
+    exécution dans le jeu filtré existant au lieu de tout retraiter.
+
+    Le jeu fusionné est écrit à côté puis renommé : `output_path` peut être
+    `base_path`, et l'API qui surveille ce fichier ne lit jamais un fichier incomplet.
+
+    Args:
+        input_path (str): Profils nouveaux ou rafraîchis (JSON ou JSONL).
+        base_path (str): Jeu filtré existant (absent = jeu vide).
+        output_path (str): Jeu fusionné (JSON ou JSONL).
+        changes_path (str): Journal des changements (JSONL).
+
+    Returns:
+        tuple[PipelineStats, list[dict]]: Compteurs du traitement et journal des changements.
+    """
+    stats = PipelineStats(report_every=0)
+    existing = list(iter_records(base_path)) if os.path.exists(base_path) else []
+    merged, changes = merge_users(existing, stats.count_loaded(iter_valid(iter_records(input_path))))
+
+    root, extension = os.path.splitext(output_path)
+    tmp_path = f"{root}.tmp{extension}"
+    write_users_stream(merged, tmp_path, stats)
+    os.replace(tmp_path, output_path)
+    write_changes(changes, changes_path)
+    return stats, changes
+
+def save_snapshot(input_path, snapshot_path):
+    """
+    Écrit le snapshot binaire chargé au démarrage par l'API (voir `api/snapshot.py`).
+
+    Args:
+        input_path (str): Fichier des utilisateurs filtrés (JSON ou JSONL).
+        snapshot_path (str): Chemin du snapshot (extension `.snap`).
+
+    Returns:
+        int: Nombre d'utilisateurs écrits.
+    """
+    # Import local : seul ce mode dépend du code de l'API (Pydantic)
+    from api.models import User
+    from api.snapshot import write_snapshot
+
+    return write_snapshot((User(**u) for u in iter_records(input_path)), snapshot_path)
+
+def save_sqlite(input_path, sqlite_path):
+    """
+    Écrit la base SQLite utilisable comme moteur de stockage par l'API (voir `api/sqlite_store.py`).
+
+    Args:
+        input_path (str): Fichier des utilisateurs filtrés (JSON ou JSONL).
+        sqlite_path (str): Chemin de la base (extension `.sqlite`).
+
+    Returns:
+        int: Nombre d'utilisateurs écrits.
+    """
+    from api.models import User
+    from api.sqlite_store import write_sqlite
+
+    return write_sqlite((User(**u) for u in iter_records(input_path)), sqlite_path)
+
 if __name__ == "__main__":
     """
     Point d'entrée du script :
     - Charge les utilisateurs
-    - Supprime les doublons
+    - Supprime les doublons (ou, avec --merge, fusionne dans le jeu existant)
     - Filtre les utilisateurs
-    - Sauvegarde le résultat final
+    - Sauvegarde le résultat final (et, avec --snapshot / --sqlite, les fichiers chargés par l'API)
     - Affiche un résumé du traitement
     """
-    input_file = "data/users.json"
-    output_file = "data/filtered_users.json"
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="data/users.json", help="Fichier d'entrée (JSON ou JSONL)")
+    parser.add_argument("--output", default="data/filtered_users.json", help="Fichier de sortie (JSON ou JSONL)")
+    parser.add_argument("--stream", action="store_true", help="Traitement en streaming (mémoire bornée)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Filtrage par lots sur N processus (0 = filtrage simple, -1 = tous les cœurs)")
+    parser.add_argument("--merge", nargs="?", const="data/filtered_users.json",
+                        help="Fusionne l'entrée dans ce jeu filtré existant (défaut : data/filtered_users.json)")
+    parser.add_argument("--changes", default="data/changes.jsonl", help="Journal des changements écrit par --merge")
+    parser.add_argument("--snapshot", nargs="?", const="data/filtered_users.snap",
+                        help="Écrit aussi le snapshot binaire chargé par l'API (défaut : data/filtered_users.snap)")
+    parser.add_argument("--sqlite", nargs="?", const="data/filtered_users.sqlite",
+                        help="Écrit aussi la base SQLite de l'API (défaut : data/filtered_users.sqlite)")
+    args = parser.parse_args()
+    workers = None if args.workers < 0 else args.workers
+
+    if args.merge:
+        stats, changes = run_merge(args.input, args.merge, args.output, args.changes)
+        counts = {op: sum(change["op"] == op for change in changes) for op in ("added", "updated", "removed")}
+        print("\n✅ Résumé de la fusion :")
+        print(f"Profils lus            : {stats.loaded}")
+        print(f"Ajoutés                : {counts['added']}")
+        print(f"Mis à jour             : {counts['updated']}")
+        print(f"Retirés                : {counts['removed']}")
+        print(f"Utilisateurs en sortie : {stats.kept}")
+        print(f"Journal                : {args.changes}")
+    elif args.stream:
+        stats = run_stream(args.input, args.output, workers=workers)
+        print("\n✅ Résumé du traitement (streaming) :")
+        print(f"Utilisateurs chargés   : {stats.loaded}")
+        print(f"Doublons supprimés     : {stats.duplicates}")
+        print(f"Utilisateurs filtrés   : {stats.kept}")
+        print(f"Débit                  : {stats.rate:,.0f} enregistrements/s ({stats.elapsed:.2f} s)")
+    else:
+        all_users = load_users(args.input)
+        initial_count = len(all_users)
+
+        deduped_users, nb_doublons = remove_duplicates(all_users)
+        if workers == 0:
+            filtered_users = filter_users(deduped_users)
+        else:
+            filtered_users = filter_users_parallel(deduped_users, workers)
 
-    all_users = load_users(input_file)
-    initial_count = len(all_users)
+        save_filtered_users(filtered_users, args.output)
 
-    deduped_users, nb_doublons = remove_duplicates(all_users)
-    filtered_users = filter_users(deduped_users)
+        print("\n✅ Résumé du traitement :")
+        print(f"Utilisateurs chargés   : {initial_count}")
+        print(f"Doublons supprimés     : {nb_doublons}")
+        print(f"Utilisateurs filtrés   : {len(filtered_users)}")
 
-    save_filtered_users(filtered_users, output_file)
+    if args.snapshot:
+        start = time.perf_counter()
+        count = save_snapshot(args.output, args.snapshot)
+        print(f"Snapshot               : {args.snapshot} ({count} utilisateurs, {time.perf_counter() - start:.2f} s)")
 
-    print("\n✅ Résumé du traitement :")
-    print(f"Utilisateurs chargés   : {initial_count}")
-    print(f"Doublons supprimés     : {nb_doublons}")
-    print(f"Utilisateurs filtrés   : {len(filtered_users)}")
+    if args.sqlite:
+        start = time.perf_counter()
+        count = save_sqlite(args.output, args.sqlite)
+        print(f"Base SQLite            : {args.sqlite} ({count} utilisateurs, {time.perf_counter() - start:.2f} s)")
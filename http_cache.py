@@ -0,0 +1,181 @@
+"""
+Cache disque des réponses de l'API GitHub (requêtes conditionnelles).
+
+Chaque réponse 200 est enregistrée dans une base SQLite avec ses en-têtes
+`ETag` / `Last-Modified`. Un profil (URL sans paramètres) de moins de `ttl`
+secondes est resservi sans appel réseau ; au-delà, et toujours pour les pages
+de liste (`/users?since=...`, dont le contenu change à chaque nouveau compte),
+la requête est renvoyée avec `If-None-Match` / `If-Modified-Since` et un
+`304 Not Modified` (non décompté du quota GitHub) suffit à la rafraîchir.
+
+La taille totale des corps stockés est bornée par `max_bytes` : les entrées
+les moins récemment utilisées sont supprimées en premier. Le total est lu une
+fois à l'ouverture puis tenu à jour en mémoire à chaque écriture et éviction
+(aucun parcours de la table par requête) ; l'index sur `accessed_at` donne
+les victimes dans l'ordre sans tri.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class CachedResponse:
+    """
+    Réponse reconstruite depuis le cache, compatible avec l'usage fait de
+    `requests.Response` / `httpx.Response` dans `extract_users.py`.
+    """
+
+    status_code = 200
+
+    def __init__(self, url, content, headers=None):
+        self.url = url
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """
+    Cache HTTP persistant, indexé par URL.
+
+    Attributs :
+        path (str)      : Fichier SQLite du cache.
+        ttl (float)     : Durée (s) pendant laquelle un profil est servi sans revalidation.
+        max_bytes (int) : Taille maximale cumulée des corps stockés.
+        total_bytes (int): Taille cumulée actuelle des corps stockés.
+        hits (int)      : Réponses servies sans requête.
+        revalidated (int): Réponses confirmées par un 304.
+        misses (int)    : Requêtes sans entrée exploitable.
+    """
+
+    def __init__(self, path="data/http_cache.sqlite", ttl=3600, max_bytes=512 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._db.commit()
+        self.total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def lookup(self, url):
+        """
+        Recherche une entrée pour `url`.
+
+        Seules les URL sans paramètres (profils) sont servies sans requête
+        pendant `ttl` secondes : les pages de liste sont toujours revalidées.
+
+        Args:
+            url (str): URL demandée.
+
+        Returns:
+            tuple[CachedResponse | None, dict]: La réponse si elle est encore
+            fraîche (aucune requête nécessaire), sinon None ; et les en-têtes
+            conditionnels à envoyer avec la requête.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, body, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, {}
+            etag, last_modified, body, stored_at = row
+            now = time.time()
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self._db.commit()
+            if "?" not in url and now - stored_at < self.ttl:
+                self.hits += 1
+                return CachedResponse(url, body), {}
+
+        conditional = {}
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        return None, conditional
+
+    def revalidate(self, url, response):
+        """
+        Traite un `304 Not Modified` : l'entrée redevient fraîche et est resservie.
+
+        Args:
+            url (str): URL demandée.
+            response: Réponse 304 (ses en-têtes de quota sont conservés).
+
+        Returns:
+            CachedResponse | None: Le corps en cache, ou None s'il a été évincé entre-temps.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            self._db.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._db.commit()
+            self.revalidated += 1
+        return CachedResponse(url, row[0], response.headers)
+
+    def store(self, url, response):
+        """
+        Enregistre une réponse 200.
+
+        Args:
+            url (str): URL demandée.
+            response (requests.Response | httpx.Response): Réponse à mettre en cache.
+        """
+        body = response.content
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get("ETag"), response.headers.get("Last-Modified"), body, len(body), now, now),
+            )
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        # Parcours de l'index `responses_accessed`, arrêté dès que le total repasse sous la borne
+        rows = self._db.execute("SELECT url, size FROM responses ORDER BY accessed_at")
+        victims = []
+        for url, size in rows:
+            if self.total_bytes <= self.max_bytes:
+                break
+            victims.append((url,))
+            self.total_bytes -= size
+        rows.close()
+        self._db.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+    def close(self):
+        """Ferme la base SQLite."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,269 @@
+"""
+Ordonnanceur de requêtes respectant les quotas de l'API GitHub.
+
+Au lieu d'attendre que `X-RateLimit-Remaining` tombe à 0 pour suspendre tout
+le script, chaque token GitHub dispose d'un seau à jetons (token bucket) dont
+le débit de remplissage répartit le quota restant sur le temps qui reste
+avant `X-RateLimit-Reset`. Les requêtes sont ainsi étalées sur toute la
+fenêtre de quota.
+
+L'ordonnanceur gère également :
+- l'en-tête `Retry-After` et les limites secondaires de GitHub (403/429),
+  reconnues à leurs en-têtes ou à leur message (`is_rate_limited`) : les
+  autres 403 (accès refusé) ne sont pas retentés ;
+- des pauses exponentielles avec gigue (« full jitter ») pour les erreurs 5xx ;
+- la rotation entre plusieurs tokens (`GITHUB_TOKENS=tok1,tok2,...`) ;
+- des métriques sur le temps passé à attendre.
+"""
+
+import random
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+# Pause minimale recommandée par GitHub après une limite secondaire sans Retry-After
+SECONDARY_LIMIT_DELAY = 60
+MAX_SECONDARY_LIMIT_DELAY = 900
+
+
+def is_rate_limited(status, headers, message=""):
+    """
+    Indique si une réponse 403/429 est due à une limite de requêtes de GitHub.
+
+    Un 429, un en-tête `Retry-After`, un quota épuisé (`X-RateLimit-Remaining: 0`)
+    ou un message mentionnant une limite (« API rate limit exceeded »,
+    « You have exceeded a secondary rate limit ») le signalent. Les autres 403
+    (ressource interdite, compte bloqué, token sans droits) ne se résolvent
+    pas en attendant.
+
+    Args:
+        status (int): Code HTTP de la réponse.
+        headers (Mapping): En-têtes de la réponse.
+        message (str): Corps de la réponse.
+
+    Returns:
+        bool: True si la requête peut être retentée après une pause.
+    """
+    return (
+        status == 429
+        or "Retry-After" in headers
+        or headers.get("X-RateLimit-Remaining") == "0"
+        or "rate limit" in (message or "").lower()
+    )
+
+
+def parse_retry_after(value, now):
+    """
+    Convertit un en-tête `Retry-After` en durée d'attente.
+
+    La norme HTTP autorise un nombre de secondes (« 120 ») ou une date HTTP
+    (« Wed, 21 Oct 2015 07:28:00 GMT »).
+
+    Args:
+        value (str | None): Valeur de l'en-tête.
+        now (float): Date courante (epoch).
+
+    Returns:
+        float | None: Pause en secondes (au moins 0), None si l'en-tête est
+        absent ou illisible.
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:  # « -0000 » : date UTC
+        date = date.replace(tzinfo=timezone.utc)
+    return max(date.timestamp() - now, 0.0)
+
+
+class TokenBucket:
+    """
+    État de quota d'un token GitHub.
+
+    Attributs :
+        token (str | None)   : Token GitHub (None = requêtes anonymes).
+        remaining (int | None): Dernière valeur connue de `X-RateLimit-Remaining`.
+        reset_at (float)     : Date (epoch) de réinitialisation du quota.
+        rate (float | None)  : Débit autorisé en requêtes/s (None = pas de limite connue).
+        level (float)        : Jetons disponibles (peut être négatif : requêtes réservées).
+        blocked_until (float): Date avant laquelle le token ne doit pas être utilisé.
+        requests (int)       : Nombre de requêtes envoyées avec ce token.
+    """
+
+    def __init__(self, token, burst, now):
+        self.token = token
+        self.remaining = None
+        self.reset_at = 0.0
+        self.rate = None
+        self.level = float(burst)
+        self.updated = now
+        self.blocked_until = 0.0
+        self.requests = 0
+
+    def wait_time(self, now, burst):
+        """
+        Args:
+            now (float): Date courante (epoch).
+            burst (int): Capacité du seau.
+
+        Returns:
+            float: Secondes à attendre avant de pouvoir envoyer une requête.
+        """
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.rate is None:
+            return 0.0
+        level = min(burst, self.level + (now - self.updated) * self.rate)
+        return 0.0 if level >= 1 else (1 - level) / self.rate
+
+    def consume(self, now, burst):
+        """Réserve un jeton (remplit d'abord le seau du temps écoulé)."""
+        if self.rate is not None:
+            self.level = min(burst, self.level + (now - self.updated) * self.rate)
+            self.level -= 1
+        self.updated = now
+        self.requests += 1
+
+
+class RateLimitScheduler:
+    """
+    Répartit les requêtes entre les tokens disponibles en respectant leurs quotas.
+
+    Usage :
+        token, delay = scheduler.reserve()
+        time.sleep(delay)
+        response = requests.get(url, headers=scheduler.auth_headers(token))
+        scheduler.update(token, response.headers)
+
+    Attributs :
+        burst (int)    : Nombre de requêtes pouvant partir sans espacement.
+        waited (float) : Temps total (s) imposé aux requêtes par l'ordonnanceur.
+        waits (int)    : Nombre de requêtes ayant dû attendre.
+    """
+
+    def __init__(self, tokens=None, burst=10, clock=time.time, rng=None):
+        self.burst = burst
+        self.clock = clock
+        self.rng = rng or random.Random()
+        now = clock()
+        self.buckets = {token: TokenBucket(token, burst, now) for token in (tokens or [None])}
+        self.waited = 0.0
+        self.waits = 0
+
+    @staticmethod
+    def auth_headers(token):
+        """
+        Args:
+            token (str | None): Token GitHub.
+
+        Returns:
+            dict: En-tête d'authentification (vide pour une requête anonyme).
+        """
+        return {"Authorization": f"token {token}"} if token else {}
+
+    def reserve(self):
+        """
+        Choisit le token pouvant servir le plus tôt et y réserve une requête.
+
+        Returns:
+            tuple[str | None, float]: Token à utiliser et délai (s) à respecter avant l'envoi.
+        """
+        now = self.clock()
+        bucket = min(
+            self.buckets.values(),
+            key=lambda b: (b.wait_time(now, self.burst), -(b.remaining if b.remaining is not None else float("inf"))),
+        )
+        delay = bucket.wait_time(now, self.burst)
+        bucket.consume(now, self.burst)
+        self._record_wait(delay)
+        return bucket.token, delay
+
+    def update(self, token, headers):
+        """
+        Met à jour le quota d'un token à partir des en-têtes `X-RateLimit-*`.
+
+        Args:
+            token (str | None): Token utilisé pour la requête.
+            headers (Mapping): En-têtes de la réponse.
+        """
+        bucket = self.buckets[token]
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        now = self.clock()
+        bucket.remaining = int(remaining)
+        bucket.reset_at = float(reset)
+        if bucket.reset_at <= now:
+            bucket.rate = None
+        elif bucket.remaining == 0:
+            bucket.blocked_until = max(bucket.blocked_until, bucket.reset_at + 1)
+            bucket.rate = None
+        else:
+            # Quota restant étalé sur le temps restant avant la réinitialisation
+            bucket.rate = bucket.remaining / (bucket.reset_at - now)
+
+    def penalize(self, token, headers, attempt):
+        """
+        Traite une réponse 403/429 reconnue par `is_rate_limited` : le token
+        fautif est mis en pause le temps indiqué par `Retry-After` (secondes ou
+        date HTTP, voir `parse_retry_after`), par la
+        réinitialisation du quota, ou à défaut (limite secondaire) au moins une
+        minute, doublée à chaque tentative.
+
+        Args:
+            token (str | None): Token utilisé pour la requête.
+            headers (Mapping): En-têtes de la réponse.
+            attempt (int): Numéro de la tentative (0 pour la première).
+
+        Returns:
+            float: Durée de la pause appliquée au token (s).
+        """
+        bucket = self.buckets[token]
+        now = self.clock()
+        pause = parse_retry_after(headers.get("Retry-After"), now)
+        if pause is None and headers.get("X-RateLimit-Remaining") == "0" and float(headers.get("X-RateLimit-Reset", 0)) > now:
+            pause = float(headers["X-RateLimit-Reset"]) - now + 1
+        elif pause is None:
+            pause = min(SECONDARY_LIMIT_DELAY * 2 ** attempt, MAX_SECONDARY_LIMIT_DELAY)
+            pause += self.rng.uniform(0, pause / 10)
+        bucket.blocked_until = max(bucket.blocked_until, now + pause)
+        return pause
+
+    def backoff(self, attempt, base=1.0, cap=60.0):
+        """
+        Pause exponentielle avec gigue pour les erreurs serveur et réseau.
+
+        Args:
+            attempt (int): Numéro de la tentative (0 pour la première).
+            base (float): Pause de référence (s).
+            cap (float): Pause maximale (s).
+
+        Returns:
+            float: Durée à attendre avant la prochaine tentative (s).
+        """
+        delay = self.rng.uniform(0, min(cap, base * 2 ** attempt))
+        self._record_wait(delay)
+        return delay
+
+    def _record_wait(self, delay):
+        if delay > 0:
+            self.waited += delay
+            self.waits += 1
+
+    def summary(self):
+        """
+        Returns:
+            str: Résumé des requêtes par token et du temps d'attente.
+        """
+        per_token = ", ".join(
+            f"{(b.token or 'anonyme')[:6]}…: {b.requests}" for b in self.buckets.values()
+        )
+        return f"{self.waits} attentes, {self.waited:.1f} s au total ; requêtes par token : {per_token}"
@@ -0,0 +1,189 @@
+"""
+Fixtures partagées des tests.
+
+`github_server` démarre un faux serveur de l'API GitHub en local (thread HTTP)
+pour tester les scripts d'extraction sans réseau ni quota. Il sert :
+- GET /users?since=<id> : pages de `per_page` utilisateurs d'id strictement supérieur
+- GET /users/<login>    : profil détaillé d'un utilisateur (avec ETag, 304 si
+  l'en-tête If-None-Match correspond)
+- POST /graphql         : champs `user(login:)` groupés par alias (profils
+  absents de `graphql_missing` uniquement) et `rateLimit`
+"""
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+class FakeGitHub:
+    """
+    État du faux serveur GitHub.
+
+    Attributs :
+        users (list[dict]) : Profils détaillés servis, triés par id.
+        per_page (int)     : Taille des pages de /users?since=.
+        requests (list)    : Chemins demandés, dans l'ordre d'arrivée.
+        failures (dict)    : Chemin → liste de codes HTTP à renvoyer avant de répondre 200.
+        not_modified (int) : Nombre de réponses 304 envoyées.
+        graphql_batches (list[int]): Nombre de profils demandés par chaque requête GraphQL.
+        graphql_missing (set[str]) : Logins introuvables en GraphQL (ex. organisations).
+        graphql_max_batch (int)    : Au-delà, la requête GraphQL échoue en 502 (délai dépassé).
+        graphql_cost (int)         : Coût renvoyé dans `rateLimit.cost`.
+    """
+
+    def __init__(self, users, per_page=3):
+        self.users = sorted(users, key=lambda user: user["id"])
+        self.per_page = per_page
+        self.requests = []
+        self.failures = {}
+        self.not_modified = 0
+        self.graphql_batches = []
+        self.graphql_missing = set()
+        self.graphql_max_batch = 1000
+        self.graphql_cost = 1
+        self.lock = threading.Lock()
+        self.base_url = None
+
+    @property
+    def users_url(self):
+        return f"{self.base_url}/users?since="
+
+    @property
+    def user_info_url(self):
+        return f"{self.base_url}/users"
+
+    @property
+    def graphql_url(self):
+        return f"{self.base_url}/graphql"
+
+
+def make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def send_json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.send_header("X-RateLimit-Reset", "0")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            with fake.lock:
+                fake.requests.append(self.path)
+                pending = fake.failures.get(parts.path)
+                failure = pending.pop(0) if pending else None
+            if failure is not None:
+                self.send_json(failure, {"message": "erreur simulée"})
+                return
+
+            if parts.path == "/users":
+                since = int(parse_qs(parts.query).get("since", ["0"])[0])
+                page = [{"login": u["login"], "id": u["id"], "avatar_url": u["avatar_url"]} for u in fake.users if u["id"] > since]
+                self.send_json(200, page[:fake.per_page])
+                return
+
+            login = parts.path.removeprefix("/users/")
+            for user in fake.users:
+                if user["login"] == login:
+                    etag = '"' + hashlib.md5(json.dumps(user, sort_keys=True).encode()).hexdigest() + '"'
+                    if self.headers.get("If-None-Match") == etag:
+                        with fake.lock:
+                            fake.not_modified += 1
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("X-RateLimit-Remaining", "4999")
+                        self.send_header("X-RateLimit-Reset", "0")
+                        self.end_headers()
+                        return
+                    self.send_json(200, user, {"ETag": etag})
+                    return
+            self.send_json(404, {"message": "Not Found"})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            with fake.lock:
+                fake.requests.append(self.path)
+                pending = fake.failures.get(self.path)
+                failure = pending.pop(0) if pending else None
+            if failure is not None:
+                self.send_json(failure, {"message": "erreur simulée"})
+                return
+            if self.path != "/graphql":
+                self.send_json(404, {"message": "Not Found"})
+                return
+
+            # Champs `alias: user(login: $variable)` de la requête
+            fields = re.findall(r"(\w+): user\(login: \$(\w+)\)", body["query"])
+            with fake.lock:
+                fake.graphql_batches.append(len(fields))
+            if len(fields) > fake.graphql_max_batch:
+                self.send_json(502, {"message": "Délai dépassé"})
+                return
+
+            by_login = {user["login"]: user for user in fake.users}
+            data = {"rateLimit": {"cost": fake.graphql_cost, "remaining": 4999, "resetAt": "2030-01-01T00:00:00Z"}}
+            errors = []
+            for alias, variable in fields:
+                login = body["variables"][variable]
+                user = by_login.get(login)
+                if user is None or login in fake.graphql_missing:
+                    data[alias] = None
+                    errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve to a User with the login of '{login}'."})
+                else:
+                    data[alias] = {
+                        "login": user["login"],
+                        "databaseId": user["id"],
+                        "createdAt": user["created_at"],
+                        "avatarUrl": user["avatar_url"],
+                        "bio": user["bio"],
+                    }
+            self.send_json(200, {"data": data, "errors": errors} if errors else {"data": data})
+
+    return Handler
+
+
+def make_github_users(count, first_id=100):
+    return [
+        {
+            "login": f"user{first_id + i}",
+            "id": first_id + i,
+            "created_at": "2016-01-01T00:00:00Z",
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{first_id + i}?v=4",
+            "bio": f"Bio {i}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def github_server(monkeypatch):
+    """
+    Démarre le faux serveur GitHub avec 10 utilisateurs (ids 100 à 109)
+    et fixe `SINCE` à 0 dans `extract_users`.
+    """
+    import extract_users
+
+    fake = FakeGitHub(make_github_users(10))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(fake))
+    fake.base_url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(extract_users, "SINCE", 0)
+    # Pas d'attente réelle entre deux tentatives
+    monkeypatch.setattr(extract_users.time, "sleep", lambda seconds: None)
+    yield fake
+    server.shutdown()
+    server.server_close()
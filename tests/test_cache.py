@@ -0,0 +1,134 @@
+"""
+Tests unitaires du cache de réponses pré-rendues (`api.cache`)
+
+Fonctions testées :
+-------------------
+- test_render_once : une réponse n'est rendue qu'une fois par génération
+- test_generation_change_clears : un changement de génération vide le cache
+- test_lru_eviction : l'entrée la moins récemment utilisée est évincée
+- test_size_bound_in_bytes : taille bornée en octets (variantes comprises), grosses réponses non conservées
+- test_errors_not_cached : une exception pendant le rendu n'est pas mémorisée
+- test_etag_matches : analyse de l'en-tête If-None-Match
+- test_negotiate_encoding : choix de l'encodage d'après Accept-Encoding
+- test_brotli_optional : sans le paquet `brotli`, `br` n'est jamais proposé (repli sur gzip)
+- test_compressed_variant_cached : variante gzip calculée une fois, avec son propre ETag
+- test_gzip_stream : compression d'un flux, chaque morceau décodable dès sa réception
+
+À lancer avec :
+---------------
+    pytest tests/test_cache.py
+"""
+
+import gzip
+import zlib
+
+import pytest
+from api.cache import ENCODINGS, ResponseCache, brotli, etag_matches, gzip_stream, negotiate_encoding
+
+
+def counting_render(calls, content):
+    def render():
+        calls.append(content)
+        return content, {}
+    return render
+
+
+def test_render_once():
+    cache, calls = ResponseCache(), []
+    first = cache.get_or_render(0, "a", counting_render(calls, [1]))
+    second = cache.get_or_render(0, "a", counting_render(calls, [1]))
+    assert first is second
+    assert first.body == b"[1]"
+    assert len(calls) == 1
+
+def test_generation_change_clears():
+    cache, calls = ResponseCache(), []
+    cache.get_or_render(0, "a", counting_render(calls, [1]))
+    entry = cache.get_or_render(1, "a", counting_render(calls, [2]))
+    assert entry.body == b"[2]"
+    assert len(calls) == 2
+
+def test_lru_eviction():
+    # Chaque corps ('"a"') fait 3 octets : deux entrées au plus
+    cache, calls = ResponseCache(max_bytes=6), []
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_render(0, key, counting_render(calls, key))
+    assert (len(cache), cache.size) == (2, 6)
+    cache.get_or_render(0, "b", counting_render(calls, "b"))
+    assert calls == ["a", "b", "c", "b"]
+
+def test_size_bound_in_bytes():
+    cache, calls = ResponseCache(max_bytes=1000, max_entry_bytes=100), []
+    large = cache.get_or_render(0, "large", counting_render(calls, "x" * 200))
+    assert len(large.body) > 100 and len(cache) == 0
+    cache.get_or_render(0, "large", counting_render(calls, "x" * 200))
+    assert len(calls) == 2
+
+    # Les variantes compressées comptent dans la taille du cache
+    cache = ResponseCache(max_bytes=1000, max_entry_bytes=1000)
+    entry = cache.get_or_render(0, "a", lambda: ("a" * 500, {}))
+    assert cache.size == len(entry.body)
+    body, _ = cache.encoded("a", entry, "gzip")
+    assert cache.size == len(entry.body) + len(body)
+    cache.encoded("a", entry, "gzip")
+    assert cache.size == len(entry.body) + len(body)
+    cache.get_or_render(0, "b", lambda: ("b" * 500, {}))
+    assert len(cache) == 1 and cache.size <= 1000
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
+
+def test_errors_not_cached():
+    cache = ResponseCache()
+
+    def failing():
+        raise ValueError("absent")
+
+    with pytest.raises(ValueError):
+        cache.get_or_render(0, "a", failing)
+    assert len(cache) == 0
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("GZIP;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*", ("gzip",)) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip, br;q=0.1", ("br", "gzip")) == "gzip"
+
+
+
+def test_brotli_optional():
+    assert ("br" in ENCODINGS) == (brotli is not None)
+    # Encodages disponibles sans brotli
+    assert negotiate_encoding("br", ("gzip",)) is None
+    assert negotiate_encoding("br, gzip;q=0.5", ("gzip",)) == "gzip"
+    if brotli is None:
+        assert negotiate_encoding("br") is None
+        assert negotiate_encoding("br, gzip") == "gzip"
+
+def test_compressed_variant_cached():
+    cache = ResponseCache()
+    entry = cache.get_or_render(0, "a", lambda: ([{"login": "user"}] * 100, {}))
+    body, etag = entry.encoded("gzip")
+    assert gzip.decompress(body) == entry.body
+    assert etag != entry.etag and etag.startswith(entry.etag[:-1])
+    assert entry.encoded("gzip")[0] is body
+    assert entry.encoded(None) == (entry.body, entry.etag)
+
+
+def test_gzip_stream():
+    chunks = [b'{"id":1}\n' * 50, b'{"id":2}\n' * 50]
+    compressed = list(gzip_stream(chunks))
+    assert gzip.decompress(b"".join(compressed)) == b"".join(chunks)
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(compressed[0]) == chunks[0]
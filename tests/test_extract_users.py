@@ -0,0 +1,220 @@
+"""
+Tests du script d'extraction (`extract_users.py`) contre un faux serveur GitHub local
+
+Fonctions testées :
+-------------------
+- test_fetch_users_sync : extraction séquentielle paginée
+- test_fetch_users_async_same_result : le mode asynchrone produit le même résultat
+- test_fetch_users_async_retries_server_error : nouvelle tentative après une erreur 5xx
+- test_fetch_users_rotates_on_rate_limit : un 429 met le token en pause et bascule sur un autre
+- test_forbidden_not_retried : un 403 sans signe de limite de requêtes n'est pas retenté (utilisateur ignoré)
+- test_checkpoint_resume : reprise d'une extraction interrompue sans redemander les profils écrits
+- test_checkpoint_truncates_partial_line : suppression d'une ligne JSONL incomplète à la reprise
+- test_jsonl_to_json : conversion du JSONL en tableau JSON
+- test_incremental_since : extraction incrémentale à partir du plus grand id déjà stocké
+- test_fetch_users_graphql : profils demandés par lots GraphQL, même résultat qu'en REST
+- test_graphql_falls_back_to_rest : profils introuvables en GraphQL et 401 repris en REST
+- test_graphql_batch_sizing : lots découpés après un échec et ajustés au coût annoncé
+- test_fetch_users_prefilter : critères de filtrage appliqués dès l'extraction, sans requête de détail inutile
+
+À lancer avec :
+---------------
+    pytest tests/test_extract_users.py
+"""
+
+import asyncio
+import json
+import time
+
+import extract_users
+from extract_users import (
+    ExtractionCheckpoint,
+    GraphQLDetailFetcher,
+    fetch_users,
+    fetch_users_async,
+    incremental_since,
+    iter_users,
+    jsonl_to_json,
+)
+from filtered_users import RULES, FilterRules
+from rate_limiter import RateLimitScheduler
+
+
+def test_fetch_users_sync(github_server):
+    users = fetch_users(7, github_server.users_url, github_server.user_info_url)
+    assert [user["id"] for user in users] == list(range(100, 107))
+    assert set(users[0]) == {"login", "id", "created_at", "avatar_url", "bio"}
+
+def test_fetch_users_async_same_result(github_server):
+    expected = fetch_users(8, github_server.users_url, github_server.user_info_url)
+    result = asyncio.run(fetch_users_async(8, 4, github_server.users_url, github_server.user_info_url))
+    assert result == expected
+
+def test_fetch_users_async_retries_server_error(github_server, monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(extract_users.asyncio, "sleep", no_sleep)
+    github_server.failures["/users/user101"] = [502]
+    result = asyncio.run(fetch_users_async(3, 4, github_server.users_url, github_server.user_info_url))
+    assert [user["login"] for user in result] == ["user100", "user101", "user102"]
+    assert github_server.requests.count("/users/user101") == 2
+
+def test_fetch_users_rotates_on_rate_limit(github_server, monkeypatch):
+    scheduler = RateLimitScheduler(["tok_a", "tok_b"])
+    monkeypatch.setattr(extract_users, "scheduler", scheduler)
+    github_server.failures["/users/user100"] = [429]
+    users = fetch_users(2, github_server.users_url, github_server.user_info_url)
+    assert [user["login"] for user in users] == ["user100", "user101"]
+    assert sum(bucket.requests for bucket in scheduler.buckets.values()) == 4
+    assert max(bucket.blocked_until for bucket in scheduler.buckets.values()) > time.time()
+
+def test_forbidden_not_retried(github_server, monkeypatch):
+    scheduler = RateLimitScheduler(["tok_a"])
+    monkeypatch.setattr(extract_users, "scheduler", scheduler)
+    github_server.failures["/users/user100"] = [403]
+    users = fetch_users(2, github_server.users_url, github_server.user_info_url)
+    assert [user["login"] for user in users] == ["user101", "user102"]
+    assert github_server.requests.count("/users/user100") == 1
+    assert scheduler.buckets["tok_a"].blocked_until == 0
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_checkpoint_resume(github_server, tmp_path):
+    output, state = tmp_path / "users.jsonl", tmp_path / "checkpoint.json"
+    with ExtractionCheckpoint(str(output), str(state)) as checkpoint:
+        checkpoint.open()
+        for profile in iter_users(4, github_server.users_url, github_server.user_info_url):
+            checkpoint.append(profile)
+
+    github_server.requests.clear()
+    with ExtractionCheckpoint(str(output), str(state)) as checkpoint:
+        checkpoint.open(resume=True)
+        assert (checkpoint.since, checkpoint.count) == (103, 4)
+        for profile in iter_users(6 - checkpoint.count, github_server.users_url, github_server.user_info_url, since=checkpoint.since):
+            checkpoint.append(profile)
+
+    assert [user["id"] for user in read_jsonl(output)] == list(range(100, 106))
+    assert github_server.requests[0] == "/users?since=103"
+    assert "/users/user103" not in github_server.requests
+
+def test_checkpoint_truncates_partial_line(tmp_path):
+    output, state = tmp_path / "users.jsonl", tmp_path / "checkpoint.json"
+    with ExtractionCheckpoint(str(output), str(state)) as checkpoint:
+        checkpoint.open()
+        checkpoint.append({"login": "a", "id": 1})
+    with open(output, "a", encoding="utf-8") as f:
+        f.write('{"login": "b", "i')
+
+    with ExtractionCheckpoint(str(output), str(state)) as checkpoint:
+        checkpoint.open(resume=True)
+        checkpoint.append({"login": "c", "id": 3})
+    assert read_jsonl(output) == [{"login": "a", "id": 1}, {"login": "c", "id": 3}]
+
+def test_jsonl_to_json(tmp_path):
+    source, target = tmp_path / "users.jsonl", tmp_path / "users.json"
+    source.write_text('{"login": "é", "id": 1}\n{"login": "b", "id": 2}\n', encoding="utf-8")
+    jsonl_to_json(str(source), str(target))
+    data = json.loads(target.read_text(encoding="utf-8"))
+    assert data == [{"login": "é", "id": 1}, {"login": "b", "id": 2}]
+    assert target.read_text(encoding="utf-8") == json.dumps(data, indent=4, ensure_ascii=False)
+
+    source.write_text("", encoding="utf-8")
+    jsonl_to_json(str(source), str(target))
+    assert target.read_text(encoding="utf-8") == "[]"
+
+def test_incremental_since(github_server, tmp_path):
+    dataset, state = tmp_path / "filtered_users.json", tmp_path / "checkpoint.json"
+    assert incremental_since(str(dataset), str(state)) == 0
+
+    dataset.write_text(json.dumps([{"login": "user104", "id": 104}, {"login": "user102", "id": 102}]), encoding="utf-8")
+    since = incremental_since(str(dataset), str(state))
+    assert since == 104
+    users = list(iter_users(3, github_server.users_url, github_server.user_info_url, since=since))
+    assert [user["id"] for user in users] == [105, 106, 107]
+
+    # Profils écartés au filtrage après 104 : le point de reprise évite de les redemander
+    state.write_text(json.dumps({"since": 107, "count": 3, "last_login": "user107"}), encoding="utf-8")
+    assert incremental_since(str(dataset), str(state)) == 107
+
+def graphql_fetcher(github_server, **kwargs):
+    return GraphQLDetailFetcher(github_server.graphql_url, github_server.user_info_url, **kwargs)
+
+def test_fetch_users_graphql(github_server):
+    expected = fetch_users(7, github_server.users_url, github_server.user_info_url)
+    github_server.requests.clear()
+    github_server.per_page = 10
+    graphql = graphql_fetcher(github_server)
+    assert fetch_users(7, github_server.users_url, github_server.user_info_url, graphql=graphql) == expected
+    # Une page de liste et une requête GraphQL au lieu de 7 appels REST
+    assert github_server.requests == ["/users?since=0", "/graphql"]
+    assert github_server.graphql_batches == [7]
+    assert (graphql.requests, graphql.fallbacks) == (1, 0)
+
+def test_graphql_falls_back_to_rest(github_server):
+    github_server.graphql_missing = {"user101"}
+    graphql = graphql_fetcher(github_server)
+    users = fetch_users(3, github_server.users_url, github_server.user_info_url, graphql=graphql)
+    assert [user["login"] for user in users] == ["user100", "user101", "user102"]
+    assert "/users/user101" in github_server.requests
+    assert "/users/user100" not in github_server.requests
+    assert graphql.fallbacks == 1
+
+    github_server.requests.clear()
+    github_server.failures["/graphql"] = [401]
+    graphql = graphql_fetcher(github_server)
+    assert graphql.fetch(["user100", "inconnu"]) == [users[0], None]
+    assert graphql.disabled
+    assert github_server.requests == ["/graphql", "/users/user100", "/users/inconnu"]
+
+def test_graphql_batch_sizing(github_server):
+    github_server.per_page = 10
+    github_server.graphql_max_batch = 3
+    graphql = graphql_fetcher(github_server, batch_size=8, max_batch_size=8)
+    logins = [f"user{i}" for i in range(100, 110)]
+    profiles = graphql.fetch(logins)
+    assert [profile["login"] for profile in profiles] == logins
+    # 8 → 502, 4 → 502, puis lots de 2 (qui redoublent à 4 → 502, puis 2)
+    assert github_server.graphql_batches[:3] == [8, 4, 2]
+    assert max(size for size in github_server.graphql_batches if size <= 3) <= 3
+    assert graphql.fallbacks == 0
+
+    # Coût annoncé supérieur à la cible : lots réduits en proportion
+    github_server.graphql_max_batch = 1000
+    github_server.graphql_cost = 4
+    graphql = graphql_fetcher(github_server, batch_size=8)
+    graphql.fetch(logins[:8])
+    assert graphql.batch_size == 2
+
+def test_fetch_users_prefilter(github_server, tmp_path):
+    by_id = {user["id"]: user for user in github_server.users}
+    by_id[102]["bio"] = None
+    by_id[103]["avatar_url"] = ""
+    by_id[104]["created_at"] = "2010-01-01T00:00:00Z"
+    # Ids jusqu'à 100 réputés antérieurs à la date minimale
+    rules = FilterRules(RULES.rules, min_id=100)
+
+    skipped = []
+    users = list(iter_users(3, github_server.users_url, github_server.user_info_url, rules=rules, on_skip=skipped.append))
+    assert [user["id"] for user in users] == [101, 105, 106]
+    assert skipped == [102, 104]
+    assert github_server.requests[0] == "/users?since=100"
+    # Avatar absent dès la liste : pas de requête de détail
+    assert "/users/user103" not in github_server.requests
+    assert "/users/user100" not in github_server.requests
+
+    assert asyncio.run(fetch_users_async(3, 4, github_server.users_url, github_server.user_info_url, rules=rules)) == users
+    graphql = graphql_fetcher(github_server)
+    assert fetch_users(3, github_server.users_url, github_server.user_info_url, graphql=graphql, rules=rules) == users
+    # user103 écarté dès la liste, puis seulement les profils encore nécessaires
+    assert github_server.graphql_batches == [2, 2, 1]
+
+    # Reprise : les profils écartés ne sont pas redemandés
+    output, state = tmp_path / "users.jsonl", tmp_path / "checkpoint.json"
+    with ExtractionCheckpoint(str(output), str(state)) as checkpoint:
+        checkpoint.open()
+        for profile in iter_users(1, github_server.users_url, github_server.user_info_url, since=101, rules=rules, on_skip=checkpoint.skip):
+            checkpoint.append(profile)
+    assert (checkpoint.since, checkpoint.count) == (105, 1)
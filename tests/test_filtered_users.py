@@ -0,0 +1,256 @@
+"""
+Tests du script de filtrage (`filtered_users.py`)
+
+Fonctions testées :
+-------------------
+- test_remove_duplicates : suppression des doublons par id
+- test_filter_users : critères bio / avatar / date de création
+- test_iter_json_array_chunks : lecture incrémentale quelle que soit la taille des blocs
+- test_iter_json_array_invalid : contenus qui ne sont pas des tableaux JSON
+- test_run_stream_matches_batch : le mode streaming produit le même fichier que le mode classique
+- test_run_stream_keeps_last_duplicate : doublons différents, la dernière version est conservée comme en mode classique
+- test_run_stream_jsonl : entrée et sortie au format JSONL
+- test_created_after_mask : critère de date évalué en colonne, identique à datetime.fromisoformat
+- test_filter_batch_matches_filter_users : filtrage en colonnes identique au filtrage classique
+- test_filter_users_parallel : filtrage multi-processus identique et ordonné
+- test_merge_users : fusion par id et journal des changements (ajouts, mises à jour, retraits)
+- test_run_merge : fusion en place du fichier filtré et écriture du journal
+- test_max_stored_id : plus grand id d'un fichier JSON ou JSONL
+- test_filter_rules_single_pass : critères évalués par coût croissant avec arrêt au premier échec
+- test_filter_rules_partial : critères évaluables sur un résumé (liste paginée) et ids antérieurs à la date
+- test_rules_keep_early_ids_created_after_date_min : aucun compte écarté sur son seul id par les critères par défaut
+
+À lancer avec :
+---------------
+    pytest tests/test_filtered_users.py
+"""
+
+import io
+import json
+import pickle
+from datetime import datetime
+
+import pytest
+
+from filtered_users import (
+    created_after_mask,
+    FilterRules,
+    Rule,
+    RULES,
+    filter_batch,
+    filter_users,
+    filter_users_parallel,
+    iter_json_array,
+    load_users,
+    max_stored_id,
+    merge_users,
+    remove_duplicates,
+    run_merge,
+    run_stream,
+    save_filtered_users,
+    DATE_MIN,
+)
+
+USERS = [
+    {"login": "ok", "id": 1, "created_at": "2016-05-01T00:00:00Z", "avatar_url": "https://a/1", "bio": "Dév"},
+    {"login": "old", "id": 2, "created_at": "2010-05-01T00:00:00Z", "avatar_url": "https://a/2", "bio": "Bio"},
+    {"login": "nobio", "id": 3, "created_at": "2016-05-01T00:00:00Z", "avatar_url": "https://a/3", "bio": None},
+    {"login": "noavatar", "id": 4, "created_at": "2016-05-01T00:00:00Z", "avatar_url": "  ", "bio": "Bio"},
+    {"login": "baddate", "id": 5, "created_at": "pas une date", "avatar_url": "https://a/5", "bio": "Bio"},
+    {"login": "ok", "id": 1, "created_at": "2016-05-01T00:00:00Z", "avatar_url": "https://a/1", "bio": "Dév"},
+    {"login": "ok2", "id": 6, "created_at": "2020-01-01T00:00:00Z", "avatar_url": "https://a/6", "bio": "x", "extra": 1},
+    {"login": "invalide"},
+]
+
+
+def test_remove_duplicates():
+    unique, duplicates = remove_duplicates(USERS[:7])
+    assert duplicates == 1
+    assert [user["id"] for user in unique] == [1, 2, 3, 4, 5, 6]
+
+def test_filter_users():
+    assert [user["login"] for user in filter_users(USERS[:5] + USERS[6:7])] == ["ok", "ok2"]
+    assert "extra" not in filter_users(USERS[6:7])[0]
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+def test_iter_json_array_chunks(chunk_size):
+    data = [1, 12345, "chaîne, avec ] et [", {"a": [1, 2, {"b": None}]}, [], 3.5e10, True]
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == data
+    assert list(iter_json_array(io.StringIO(" [ ] "), chunk_size=chunk_size)) == []
+
+@pytest.mark.parametrize("text", ['{"a": 1}', "[1, 2", "[1 2]", "[1,]", ""])
+def test_iter_json_array_invalid(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size=3))
+
+def test_run_stream_matches_batch(tmp_path):
+    source = tmp_path / "users.json"
+    source.write_text(json.dumps(USERS), encoding="utf-8")
+
+    batch_output = tmp_path / "batch.json"
+    unique, _ = remove_duplicates(load_users(str(source)))
+    save_filtered_users(filter_users(unique), str(batch_output))
+
+    stream_output = tmp_path / "stream.json"
+    stats = run_stream(str(source), str(stream_output))
+    assert stream_output.read_text(encoding="utf-8") == batch_output.read_text(encoding="utf-8")
+    assert (stats.loaded, stats.duplicates, stats.kept) == (7, 1, 2)
+
+def test_run_stream_keeps_last_duplicate(tmp_path):
+    updated = dict(USERS[0], bio="Bio mise à jour")
+    users = [USERS[0], USERS[6], updated, dict(USERS[6], bio=None)]
+    unique, duplicates = remove_duplicates(users)
+    assert duplicates == 2
+    assert [user["bio"] for user in unique] == ["Bio mise à jour", None]
+
+    for name in ("users.json", "users.jsonl"):
+        source = tmp_path / name
+        if name.endswith(".jsonl"):
+            source.write_text("\n".join(json.dumps(user) for user in users), encoding="utf-8")
+        else:
+            source.write_text(json.dumps(users), encoding="utf-8")
+        output = tmp_path / "filtered.json"
+        stats = run_stream(str(source), str(output))
+        assert json.loads(output.read_text(encoding="utf-8")) == filter_users(unique)
+        assert [user["bio"] for user in json.loads(output.read_text(encoding="utf-8"))] == ["Bio mise à jour"]
+        assert (stats.loaded, stats.duplicates, stats.kept) == (4, 2, 1)
+
+def test_run_stream_jsonl(tmp_path):
+    source = tmp_path / "users.jsonl"
+    source.write_text("\n".join(json.dumps(user) for user in USERS) + "\n", encoding="utf-8")
+    output = tmp_path / "filtered.jsonl"
+    run_stream(str(source), str(output))
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["login"] for line in lines] == ["ok", "ok2"]
+
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("", encoding="utf-8")
+    run_stream(str(empty), str(tmp_path / "empty.json"))
+    assert json.loads((tmp_path / "empty.json").read_text(encoding="utf-8")) == []
+
+DATES = [
+    "2015-01-01T00:00:00Z",       # égal à la borne : exclu
+    "2015-01-01T00:00:01Z",
+    "2014-12-31T23:59:59Z",
+    "2016-02-30T10:00:00Z",       # jour inexistant
+    "2016-02-29T24:00:00Z",       # heure invalide
+    "2016-02-29T23:59:59Z",
+    "2016-01-01T01:00:00+02:00",  # format non canonique
+    "2015-01-01T01:00:00+02:00",
+    "pas une date",
+    "",
+]
+
+def test_created_after_mask():
+    expected = []
+    for value in DATES:
+        try:
+            expected.append(datetime.fromisoformat(value.replace("Z", "+00:00")) > DATE_MIN)
+        except ValueError:
+            expected.append(False)
+    assert created_after_mask(DATES).tolist() == expected
+    assert created_after_mask(DATES[:6]).tolist() == expected[:6]
+
+def test_filter_batch_matches_filter_users():
+    users = [dict(USERS[0], id=i, created_at=value) for i, value in enumerate(DATES)]
+    users += USERS[:7]
+    assert filter_batch(users) == filter_users(users)
+
+def test_filter_users_parallel():
+    users = [dict(USERS[i % 7], id=i) for i in range(50)]
+    expected = filter_users(users)
+    assert filter_users_parallel(users, workers=1, batch_size=4) == expected
+    assert filter_users_parallel(users, workers=2, batch_size=4) == expected
+
+def test_merge_users():
+    existing = filter_users(USERS[:5] + USERS[6:7])
+    refreshed = [
+        dict(USERS[0], bio="Nouvelle bio"),
+        dict(USERS[6], bio=""),
+        USERS[2],
+        {"login": "new", "id": 9, "created_at": "2021-01-01T00:00:00Z", "avatar_url": "https://a/9", "bio": "b"},
+        {"login": "new", "id": 8, "created_at": "2021-01-01T00:00:00Z", "avatar_url": "https://a/8", "bio": "v1"},
+        {"login": "new", "id": 8, "created_at": "2021-01-01T00:00:00Z", "avatar_url": "https://a/8", "bio": "v2"},
+    ]
+    merged, changes = merge_users(existing, refreshed)
+    assert [(user["id"], user["bio"]) for user in merged] == [(1, "Nouvelle bio"), (8, "v2"), (9, "b")]
+    assert [(change["op"], change["id"]) for change in changes] == [
+        ("updated", 1), ("removed", 6), ("added", 8), ("added", 9)
+    ]
+    assert changes[1]["login"] == "ok2"
+    assert changes[2]["user"] == merged[1]
+
+    # Profils inchangés : aucun changement
+    assert merge_users(merged, merged) == (merged, [])
+
+def test_run_merge(tmp_path):
+    base = tmp_path / "filtered.json"
+    save_filtered_users(filter_users(USERS[:1]), str(base))
+    delta = tmp_path / "delta.jsonl"
+    delta.write_text("\n".join(json.dumps(user) for user in USERS[5:]) + "\n", encoding="utf-8")
+    changes_path = tmp_path / "changes.jsonl"
+
+    stats, changes = run_merge(str(delta), str(base), str(base), str(changes_path))
+    assert [user["login"] for user in json.loads(base.read_text(encoding="utf-8"))] == ["ok", "ok2"]
+    assert (stats.loaded, stats.kept) == (2, 2)
+    assert [json.loads(line) for line in changes_path.read_text(encoding="utf-8").splitlines()] == changes
+    assert [change["op"] for change in changes] == ["added"]
+    assert not list(tmp_path.glob("*.tmp*"))
+
+    # Jeu de départ absent : équivalent d'un premier filtrage
+    output = tmp_path / "new.json"
+    run_merge(str(delta), str(tmp_path / "absent.json"), str(output), str(changes_path))
+    assert output.read_text(encoding="utf-8") == base.read_text(encoding="utf-8")
+
+def test_max_stored_id(tmp_path):
+    source = tmp_path / "users.json"
+    source.write_text(json.dumps(USERS), encoding="utf-8")
+    assert max_stored_id(str(source)) == 6
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("", encoding="utf-8")
+    assert max_stored_id(str(empty)) is None
+    assert max_stored_id(str(tmp_path / "absent.json")) is None
+
+def test_filter_rules_single_pass():
+    calls = []
+
+    def costly(value):
+        calls.append(value)
+        return value == "oui"
+
+    def id_bio(user):
+        return {"id": user["id"], "bio": user["bio"]}
+
+    rules = FilterRules([Rule("flag", costly, cost=5), Rule("bio", bool)], project=id_bio)
+    users = [{"id": 1, "bio": None, "flag": "oui"}, {"id": 2, "bio": "b", "flag": "non"}, {"id": 3, "bio": "b", "flag": "oui"}]
+    assert [rules.match(user) for user in users] == [False, False, True]
+    assert calls == ["non", "oui"]
+    assert [rules.apply(user) for user in users] == [None, None, {"id": 3, "bio": "b"}]
+    assert rules.select(users) == [2]
+
+    # Les critères par défaut passent d'un processus à l'autre
+    restored = pickle.loads(pickle.dumps(RULES))
+    assert [restored.apply(user) for user in USERS[:7]] == [RULES.apply(user) for user in USERS[:7]]
+    assert filter_users(USERS[:7], restored) == filter_users(USERS[:7])
+
+def test_filter_rules_partial():
+    rules = FilterRules(RULES.rules, min_id=100)
+    assert rules.match_partial({"login": "a", "id": 101, "avatar_url": "https://a"})
+    assert not rules.match_partial({"login": "a", "id": 101, "avatar_url": " "})
+    assert not rules.match_partial({"login": "a", "id": 100, "avatar_url": "https://a"})
+    assert not rules.match_partial({"id": 101, "created_at": "2010-01-01T00:00:00Z"})
+    assert (rules.start_id(0), rules.start_id(150)) == (100, 150)
+    assert FilterRules(RULES.rules).start_id(0) == 0
+
+def test_rules_keep_early_ids_created_after_date_min():
+    # Les ids ne sont pas strictement chronologiques autour du 1er janvier 2015 :
+    # les critères par défaut ne doivent écarter aucun compte sur son seul id
+    user = {
+        "login": "late", "id": 10367000, "created_at": "2015-01-01T12:00:00Z",
+        "avatar_url": "https://avatars.githubusercontent.com/u/10367000", "bio": "bio",
+    }
+    assert RULES.match_partial({key: user[key] for key in ("login", "id", "avatar_url")})
+    assert RULES.start_id(0) == 0
+    assert RULES.apply(user) == user
+    assert filter_batch([user]) == [user]
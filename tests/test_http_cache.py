@@ -0,0 +1,90 @@
+"""
+Tests du cache disque des réponses GitHub (`http_cache.py`)
+
+Fonctions testées :
+-------------------
+- test_fresh_entry_served_without_request : entrée fraîche servie directement
+- test_stale_entry_sends_conditional_headers : entrée expirée → en-têtes conditionnels
+- test_listing_pages_always_revalidated : les pages de liste ne sont jamais servies sans requête
+- test_eviction_by_size : éviction des entrées les moins récemment utilisées et suivi de la taille totale
+- test_extraction_revalidates_with_304 : une seconde extraction ne consomme que des 304
+- test_async_extraction_uses_cache : le cache sert aussi le mode asynchrone (accès faits hors de la boucle d'événements)
+
+À lancer avec :
+---------------
+    pytest tests/test_http_cache.py
+"""
+
+import asyncio
+
+import extract_users
+from extract_users import fetch_users, fetch_users_async
+from http_cache import HttpCache
+
+
+class FakeResponse:
+    def __init__(self, content, headers=None):
+        self.content = content
+        self.headers = headers or {}
+
+
+def test_fresh_entry_served_without_request(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.store("http://x/u", FakeResponse(b'{"id": 1}', {"ETag": '"a"'}))
+    cached, conditional = cache.lookup("http://x/u")
+    assert cached.json() == {"id": 1}
+    assert conditional == {}
+    assert cache.hits == 1
+
+def test_stale_entry_sends_conditional_headers(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=0)
+    cache.store("http://x/u", FakeResponse(b"{}", {"ETag": '"a"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+    cached, conditional = cache.lookup("http://x/u")
+    assert cached is None
+    assert conditional == {"If-None-Match": '"a"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert cache.revalidate("http://x/u", FakeResponse(b"")).content == b"{}"
+    assert cache.lookup("http://x/missing") == (None, {})
+
+def test_listing_pages_always_revalidated(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.store("http://x/users?since=0", FakeResponse(b"[]", {"ETag": '"l"'}))
+    cached, conditional = cache.lookup("http://x/users?since=0")
+    assert cached is None
+    assert conditional == {"If-None-Match": '"l"'}
+    assert cache.hits == 0
+
+def test_eviction_by_size(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=20)
+    cache.store("http://x/a", FakeResponse(b"a" * 10))
+    cache.store("http://x/b", FakeResponse(b"b" * 10))
+    cache.lookup("http://x/a")
+    cache.store("http://x/c", FakeResponse(b"c" * 10))
+    assert len(cache) == 2
+    assert cache.lookup("http://x/b") == (None, {})
+    assert cache.total_bytes == 20
+
+    # Remplacement d'une entrée : seul l'écart de taille est compté
+    cache.store("http://x/a", FakeResponse(b"a" * 5))
+    assert (len(cache), cache.total_bytes) == (2, 15)
+    cache.close()
+    assert HttpCache(str(tmp_path / "cache.sqlite"), max_bytes=20).total_bytes == 15
+
+def test_extraction_revalidates_with_304(github_server, tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=0)
+    monkeypatch.setattr(extract_users, "http_cache", cache)
+    first = fetch_users(5, github_server.users_url, github_server.user_info_url)
+    assert github_server.not_modified == 0
+
+    second = fetch_users(5, github_server.users_url, github_server.user_info_url)
+    assert second == first
+    assert github_server.not_modified == 5
+    assert cache.revalidated == 5
+
+def test_async_extraction_uses_cache(github_server, tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=0)
+    monkeypatch.setattr(extract_users, "http_cache", cache)
+    first = asyncio.run(fetch_users_async(5, 4, github_server.users_url, github_server.user_info_url))
+    second = asyncio.run(fetch_users_async(5, 4, github_server.users_url, github_server.user_info_url))
+    assert second == first
+    assert github_server.not_modified == 5
+    assert cache.revalidated == 5
@@ -0,0 +1,73 @@
+"""
+Tests des métriques Prometheus (`api.metrics`)
+
+Fonctions testées :
+-------------------
+- test_histogram_buckets_are_cumulative : séries `_bucket`, `_sum` et `_count` d'un histogramme
+- test_collect_reads_values_at_scrape_time : métriques lues au moment de la collecte
+- test_metrics_route : requêtes mesurées par route, échecs d'authentification, jeu de données et caches
+
+À lancer avec :
+---------------
+    pytest tests/test_metrics.py
+"""
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.metrics import Counter, Gauge, Histogram
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latence.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, ("/users/",))
+    lines = list(histogram.render())
+    assert lines[:2] == ["# HELP latency_seconds Latence.", "# TYPE latency_seconds histogram"]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/users/",le="0.1"} 2',
+        'latency_seconds_bucket{route="/users/",le="1"} 3',
+        'latency_seconds_bucket{route="/users/",le="+Inf"} 4',
+        'latency_seconds_sum{route="/users/"} 3.65',
+        'latency_seconds_count{route="/users/"} 4',
+    ]
+
+
+def test_collect_reads_values_at_scrape_time():
+    state = {"size": 1}
+    gauge = Gauge("size", "Taille.", collect=lambda: state["size"])
+    state["size"] = 42
+    assert list(gauge.render())[-1] == "size 42"
+
+    counter = Counter("errors_total", 'Erreurs "graves".', ("kind",))
+    counter.inc(("a\nb",), 2)
+    assert list(counter.render()) == [
+        '# HELP errors_total Erreurs \\"graves\\".',
+        "# TYPE errors_total counter",
+        'errors_total{kind="a\\nb"} 2',
+    ]
+
+
+def test_metrics_route():
+    client = TestClient(app)
+    token = client.post("/token", data={"username": "admin123", "password": "password"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/users/octocat-inconnu", headers=headers)
+    client.post("/token", data={"username": "admin123", "password": "mauvais"})
+    client.get("/chemin/inexistant")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    # Étiquette = modèle de la route, pas le chemin demandé
+    assert 'http_requests_total{method="GET",route="/users/{login}",status="404"}' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/token"}' in body
+    assert 'http_response_size_bytes_bucket{route="/users/{login}",le="+Inf"}' in body
+    assert 'http_auth_failures_total{route="/token"}' in body
+    assert "http_requests_in_flight 1" in body
+    assert "users_dataset_size " in body
+    assert 'users_dataset_reloads_total{result="success"}' in body
+    assert 'cache_hit_ratio{cache="token"}' in body
+    assert 'cache_misses_total{cache="response"}' in body
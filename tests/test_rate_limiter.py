@@ -0,0 +1,94 @@
+"""
+Tests unitaires de l'ordonnanceur de quotas GitHub (`rate_limiter.py`)
+
+Fonctions testées :
+-------------------
+- test_no_limit_known : sans en-têtes de quota, aucune attente
+- test_paces_over_quota_window : le quota restant est étalé jusqu'à la réinitialisation
+- test_exhausted_token_rotation : un token épuisé est remplacé par un autre
+- test_retry_after_respected : l'en-tête Retry-After bloque le token
+- test_retry_after_http_date : Retry-After sous forme de date HTTP, ou illisible (→ pause exponentielle)
+- test_secondary_limit_backoff : limite secondaire sans Retry-After → au moins 60 s
+- test_is_rate_limited : seuls les 403/429 signalant une limite (en-têtes ou message) sont retentés
+- test_backoff_jitter_bounds : pause exponentielle avec gigue bornée
+
+À lancer avec :
+---------------
+    pytest tests/test_rate_limiter.py
+"""
+
+import random
+from rate_limiter import RateLimitScheduler, is_rate_limited
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_no_limit_known():
+    scheduler = RateLimitScheduler(["a"], clock=FakeClock())
+    assert [scheduler.reserve() for _ in range(50)] == [("a", 0.0)] * 50
+    assert scheduler.waits == 0
+
+def test_paces_over_quota_window():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(["a"], burst=1, clock=clock)
+    # 10 requêtes restantes pour 100 s : une requête toutes les 10 s
+    scheduler.update("a", {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(clock.now + 100)})
+    assert scheduler.reserve() == ("a", 0.0)
+    token, delay = scheduler.reserve()
+    assert abs(delay - 10) < 1e-6
+    token, delay = scheduler.reserve()
+    assert abs(delay - 20) < 1e-6
+    assert abs(scheduler.waited - 30) < 1e-6
+
+def test_exhausted_token_rotation():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(["a", "b"], clock=clock)
+    scheduler.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.now + 300)})
+    assert scheduler.reserve() == ("b", 0.0)
+    scheduler.update("b", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.now + 100)})
+    token, delay = scheduler.reserve()
+    assert token == "b"
+    assert delay == 101
+
+def test_retry_after_respected():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(["a"], clock=clock)
+    assert scheduler.penalize("a", {"Retry-After": "30"}, 0) == 30
+    token, delay = scheduler.reserve()
+    assert delay == 30
+
+def test_retry_after_http_date():
+    clock = FakeClock(now=1445412480.0)  # Wed, 21 Oct 2015 07:28:00 GMT
+    scheduler = RateLimitScheduler(["a"], clock=clock, rng=random.Random(1))
+    assert scheduler.penalize("a", {"Retry-After": "Wed, 21 Oct 2015 07:28:45 GMT"}, 0) == 45
+    assert scheduler.penalize("a", {"Retry-After": "Wed, 21 Oct 2015 07:00:00 GMT"}, 0) == 0
+    assert 60 <= scheduler.penalize("a", {"Retry-After": "bientôt"}, 0) <= 66
+
+def test_secondary_limit_backoff():
+    scheduler = RateLimitScheduler(["a"], clock=FakeClock(), rng=random.Random(1))
+    first = scheduler.penalize("a", {}, 0)
+    second = scheduler.penalize("a", {}, 1)
+    assert 60 <= first <= 66
+    assert 120 <= second <= 132
+
+def test_is_rate_limited():
+    assert is_rate_limited(429, {})
+    assert is_rate_limited(403, {"Retry-After": "30"})
+    assert is_rate_limited(403, {"X-RateLimit-Remaining": "0"})
+    assert is_rate_limited(403, {}, '{"message": "You have exceeded a secondary rate limit."}')
+    assert is_rate_limited(403, {"X-RateLimit-Remaining": "12"}, '{"message": "API rate limit exceeded for user."}')
+    assert not is_rate_limited(403, {"X-RateLimit-Remaining": "4999"}, '{"message": "Resource not accessible"}')
+    assert not is_rate_limited(403, {}, None)
+
+def test_backoff_jitter_bounds():
+    scheduler = RateLimitScheduler(rng=random.Random(0))
+    delays = [scheduler.backoff(attempt) for attempt in range(10)]
+    assert all(0 <= delay <= min(60, 2 ** attempt) for attempt, delay in enumerate(delays))
+    assert scheduler.reserve() == (None, 0.0)
+    assert scheduler.auth_headers(None) == {}
@@ -0,0 +1,112 @@
+"""
+Tests du rechargement à chaud des utilisateurs (`api.reload`)
+
+Fonctions testées :
+-------------------
+- test_reload_only_when_file_changes : rechargement uniquement si le fichier a changé
+- test_invalid_file_keeps_previous_dataset : un fichier invalide ne remplace pas les données
+- test_watch_picks_up_changes : la surveillance recharge le fichier modifié
+- test_admin_reload_route : route POST /admin/reload
+
+À lancer avec :
+---------------
+    pytest tests/test_reload.py
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.reload import DatasetReloader
+from api.security import get_current_user
+from api.store import UserStore
+
+
+def write_users(path, logins, mtime=None):
+    users = [
+        {
+            "login": login,
+            "id": i + 1,
+            "created_at": "2015-01-01T00:00:00Z",
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{i + 1}?v=4",
+            "bio": None,
+        }
+        for i, login in enumerate(logins)
+    ]
+    path.write_text(json.dumps(users), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_reload_only_when_file_changes(tmp_path):
+    path = tmp_path / "users.json"
+    write_users(path, ["alice"], mtime=1_000_000)
+    store = UserStore()
+    reloader = DatasetReloader(store, str(path))
+
+    assert reloader.reload() is True
+    assert reloader.reload() is False
+    assert store.generation == 1
+
+    write_users(path, ["alice", "bob"], mtime=2_000_000)
+    assert reloader.reload() is True
+    assert store.get_by_login("bob").id == 2
+    assert reloader.status()["users"] == 2
+
+
+def test_invalid_file_keeps_previous_dataset(tmp_path):
+    path = tmp_path / "users.json"
+    write_users(path, ["alice"])
+    store = UserStore()
+    reloader = DatasetReloader(store, str(path))
+    reloader.reload()
+
+    path.write_text('[{"login": "bob"}]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        reloader.reload(force=True)
+    assert store.get_by_login("alice") is not None
+    assert store.generation == 1
+    assert reloader.status()["last_error"]
+
+
+def test_watch_picks_up_changes(tmp_path):
+    path = tmp_path / "users.json"
+    write_users(path, ["alice"], mtime=1_000_000)
+    store = UserStore()
+    reloader = DatasetReloader(store, str(path), interval=0.01)
+    reloader.reload()
+
+    async def scenario():
+        watcher = asyncio.create_task(reloader.watch())
+        write_users(path, ["alice", "bob"], mtime=2_000_000)
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if len(store) == 2:
+                break
+        watcher.cancel()
+
+    asyncio.run(scenario())
+    assert store.get_by_login("bob") is not None
+
+
+def test_admin_reload_route(tmp_path, monkeypatch):
+    path = tmp_path / "users.json"
+    write_users(path, ["alice", "bob", "carol"])
+    store = UserStore()
+    monkeypatch.setattr(app.state, "reloader", DatasetReloader(store, str(path)))
+    app.dependency_overrides[get_current_user] = lambda: "user1"
+    client = TestClient(app)
+
+    r = client.post("/admin/reload")
+    assert r.status_code == 200
+    assert r.json()["users"] == 3
+    assert len(store) == 3
+
+    path.write_text("{", encoding="utf-8")
+    r = client.post("/admin/reload")
+    assert r.status_code == 500
+    assert len(store) == 3
@@ -11,9 +11,22 @@ Authentification :
 Utilisateurs :
 -----------------
 - Récupération de tous les utilisateurs (/users/)
-- Récupération d’un utilisateur spécifique (/users/{login})
+- Liste complète dans l'ordre de chargement, liste paginée triée par id
+- Pagination par limit/curseur et projection de champs (/users/?limit=&cursor=&fields=)
+- Filtres sur la date de création et la bio (/users/?created_after=&created_before=&has_bio=)
+- Récupération d’un utilisateur spécifique (/users/{login}, /users/id/{id})
+- Recherche de login insensible à la casse (?ignore_case=true)
 - Gestion des utilisateurs inexistants (404)
-- Recherche d’utilisateurs via query (/users/search?q=...)
+- Consultation groupée de logins et d'ids (POST /users/batch), taille maximale du lot
+- Recherche d’utilisateurs via query (/users/search?q=...), par préfixe ou dans les bios
+- Export NDJSON en flux (/users/export), incrémental avec since_id, compressé en gzip
+
+Cache des réponses :
+-----------------------
+- ETag et réponse 304 sur If-None-Match
+- Clé de cache construite à partir des paramètres validés (paramètres inconnus ignorés)
+- Invalidation du cache au rechargement des utilisateurs
+- Compression gzip négociée au-delà d'une taille minimale
 
 Routes protégées :
 ---------------------
@@ -35,7 +48,7 @@ Remarque : nécessite un fichier `.env` valide contenant `ADMIN` et `PASSWD`.
 import pytest
 from fastapi.testclient import TestClient
 from api.main import app
-from api.routes import users_data
+from api.routes import users_store
 from api.security import get_current_user
 import os
 from dotenv import load_dotenv
@@ -57,8 +70,7 @@ def setup_users():
     """
     Fixture exécutée avant chaque test : initialise une liste de deux utilisateurs.
     """
-    users_data.clear()
-    users_data.extend([
+    users_store.load([
         User(
             id=1,
             login="user1",
@@ -106,7 +118,48 @@ def test_get_all_users():
     assert len(data) == 2
     assert data[0]["login"] == "user1"
     assert data[1]["login"] == "user2"
-    
+
+
+def test_get_all_users_load_order():
+    """Sans paramètre, ordre du fichier et doublons conservés ; paginée, triée par id"""
+    users_store.load([
+        User(id=3, login="user3", created_at="2024-01-03T00:00:00Z", avatar_url="", bio=None),
+        User(id=1, login="user1", created_at="2024-01-01T00:00:00Z", avatar_url="", bio=None),
+        User(id=3, login="user3bis", created_at="2024-01-03T00:00:00Z", avatar_url="", bio=None),
+    ])
+    r = client.get("/users/")
+    assert [user["login"] for user in r.json()] == ["user3", "user1", "user3bis"]
+    assert r.headers["X-Total-Count"] == "3"
+    r = client.get("/users/?limit=10")
+    assert [user["login"] for user in r.json()] == ["user1", "user3"]
+    assert r.headers["X-Total-Count"] == "2"
+
+
+def test_get_users_paginated():
+    """Test de la pagination par curseur (GET /users/?limit=1)"""
+    r = client.get("/users/?limit=1")
+    assert r.status_code == 200
+    assert [user["login"] for user in r.json()] == ["user1"]
+    assert r.headers["X-Total-Count"] == "2"
+    cursor = r.headers["X-Next-Cursor"]
+    assert 'rel="next"' in r.headers["Link"]
+
+    r = client.get(f"/users/?limit=1&cursor={cursor}")
+    assert [user["login"] for user in r.json()] == ["user2"]
+    assert "X-Next-Cursor" not in r.headers
+
+
+def test_get_users_fields_projection():
+    """Test de la projection de champs (GET /users/?fields=login,id)"""
+    r = client.get("/users/?fields=login,id&offset=1")
+    assert r.json() == [{"login": "user2", "id": 2}]
+
+
+def test_get_users_bad_parameters():
+    """Test des paramètres invalides (curseur ou champ inconnu → 400)"""
+    assert client.get("/users/?cursor=invalide").status_code == 400
+    assert client.get("/users/?fields=password").status_code == 400
+
 
 def test_get_user_ok():
     """Test de récupération d'un utilisateur existant (GET /users/{login})"""
@@ -121,6 +174,22 @@ def test_get_user_not_found():
     assert r.status_code == 404
 
 
+def test_get_user_ignore_case():
+    """Test de récupération d'un utilisateur sans tenir compte de la casse"""
+    assert client.get("/users/USER1").status_code == 404
+    r = client.get("/users/USER1?ignore_case=true")
+    assert r.status_code == 200
+    assert r.json()["login"] == "user1"
+
+
+def test_get_user_by_id():
+    """Test de récupération d'un utilisateur par id (GET /users/id/{id})"""
+    r = client.get("/users/id/2")
+    assert r.status_code == 200
+    assert r.json()["login"] == "user2"
+    assert client.get("/users/id/999").status_code == 404
+
+
 def test_search():
     """Test de la recherche d'utilisateurs par login (GET /users/search?q=...)"""
     r = client.get("/users/search?q=user")
@@ -129,6 +198,119 @@ def test_search():
     assert all("user" in user["login"].lower() for user in results)
 
 
+def test_search_prefix_and_bio():
+    """Test de la recherche par préfixe et dans les bios"""
+    assert len(client.get("/users/search?q=USER&prefix=true").json()) == 2
+    assert client.get("/users/search?q=ser1&prefix=true").json() == []
+    assert client.get("/users/search?q=bio de").json() == []
+    r = client.get("/users/search?q=bio de user2&in_bio=true")
+    assert [user["login"] for user in r.json()] == ["user2"]
+
+
+def test_users_batch(monkeypatch):
+    """Test de la consultation groupée : utilisateurs trouvés et introuvables"""
+    from api import routes
+    r = client.post("/users/batch", json={"logins": ["user2", "USER1", "ghost", "user2"], "ids": [1, 99]})
+    assert r.status_code == 200
+    assert [u["login"] for u in r.json()["users"]] == ["user2", "user1"]
+    assert r.json()["missing"] == {"logins": ["USER1", "ghost"], "ids": [99]}
+    assert r.json()["users"][0] == client.get("/users/user2").json()
+
+    r = client.post("/users/batch", json={"logins": ["USER1"], "ignore_case": True})
+    assert [u["id"] for u in r.json()["users"]] == [1]
+
+    monkeypatch.setattr(routes, "max_batch_size", 2)
+    assert client.post("/users/batch", json={"logins": ["a", "b"], "ids": [1]}).status_code == 413
+    assert client.post("/users/batch", json={"ids": ["pas un id"]}).status_code == 422
+
+    # Liste plus longue que BATCH_MAX_SIZE : rejetée par le modèle
+    from api.models import BATCH_MAX_SIZE
+    assert client.post("/users/batch", json={"ids": list(range(BATCH_MAX_SIZE + 1))}).status_code == 422
+
+
+def test_users_filters():
+    """Test des filtres de dates de création et de bio"""
+    users_store.load(users_store.all() + [
+        User(id=3, login="user3", created_at="2010-06-01T00:00:00Z", avatar_url="", bio=None),
+    ])
+    assert [u["id"] for u in client.get("/users/?created_after=2015-01-01").json()] == [1, 2]
+    assert [u["id"] for u in client.get("/users/?created_before=2015-01-01T00:00:00Z").json()] == [3]
+    assert [u["id"] for u in client.get("/users/?has_bio=false").json()] == [3]
+    r = client.get("/users/?created_after=2000-01-01&has_bio=true&limit=1")
+    assert [u["id"] for u in r.json()] == [1]
+    assert r.headers["X-Total-Count"] == "2"
+    assert client.get("/users/?created_after=hier").status_code == 422
+
+
+def test_export_ndjson(monkeypatch):
+    """Test de l'export NDJSON, par paquets et à partir d'un id"""
+    import json
+    from api import routes
+    monkeypatch.setattr(routes, "export_chunk_size", 1)
+    r = client.get("/users/export", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = r.text.splitlines()
+    assert [json.loads(line) for line in lines] == client.get("/users/").json()
+
+    r = client.get("/users/export?since_id=1&fields=login")
+    assert [json.loads(line) for line in r.text.splitlines()] == [{"login": "user2"}]
+    assert client.get("/users/export?since_id=2").content == b""
+
+
+def test_export_gzip():
+    """Test de l'export compressé en gzip au fil de l'eau (décompressé par le client)"""
+    r = client.get("/users/export", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["Content-Encoding"] == "gzip"
+    expected = client.get("/users/export", headers={"Accept-Encoding": "identity"}).content
+    assert r.content == expected
+
+
+def test_etag_not_modified():
+    """Test du 304 Not Modified lorsque le client possède déjà la réponse"""
+    r = client.get("/users/user1")
+    etag = r.headers["ETag"]
+    r = client.get("/users/user1", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test_cache_key_from_parameters():
+    """Test de la clé de cache : paramètres validés de la route, pas l'URL brute"""
+    from api import routes
+    routes.response_cache.clear()
+    for url in ["/users/?limit=1", "/users/?limit=1&junk=1", "/users/?junk=2&limit=1"]:
+        assert client.get(url).status_code == 200
+    assert len(routes.response_cache) == 1
+    r = client.get("/users/?limit=1&junk=3")
+    assert r.headers["Link"].startswith("<http://testserver/users/?limit=1&junk=3&cursor=")
+
+
+def test_cache_invalidated_on_reload():
+    """Test de l'invalidation du cache quand les utilisateurs sont rechargés"""
+    etag = client.get("/users/").headers["ETag"]
+    users_store.load(users_store.all()[:1])
+    r = client.get("/users/", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert len(r.json()) == 1
+
+
+def test_compression(monkeypatch):
+    """Test de la compression gzip des réponses selon Accept-Encoding"""
+    from api import routes
+    expected = client.get("/users/", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in expected.headers
+
+    monkeypatch.setattr(routes, "compression_min_size", 0)
+    r = client.get("/users/", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert r.headers["Vary"] == "Accept-Encoding"
+    assert r.content == expected.content
+    assert r.headers["ETag"] != expected.headers["ETag"]
+    r = client.get("/users/", headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["ETag"]})
+    assert r.status_code == 304
+
+
 def test_protected():
     """Test d'accès à la route protégée (GET /protected)"""
     r = client.get("/protected")
@@ -0,0 +1,40 @@
+"""
+Tests unitaires de l'index de recherche (`api.search`)
+
+Fonctions testées :
+-------------------
+- test_find_substring : recherche par sous-chaîne via l'index trigramme
+- test_find_short_query : requêtes de moins de 3 caractères
+- test_find_no_match : trigramme absent de l'index
+- test_find_prefix : recherche par préfixe
+
+À lancer avec :
+---------------
+    pytest tests/test_search.py
+"""
+
+from api.search import SubstringIndex
+
+TEXTS = ["Alice", "bob", "Alicia", "malice", "Bobby"]
+
+
+def test_find_substring():
+    index = SubstringIndex(TEXTS)
+    assert index.find("LIC") == [0, 2, 3]
+    assert index.find("alice") == [0, 3]
+
+def test_find_short_query():
+    index = SubstringIndex(TEXTS)
+    assert index.find("bo") == [1, 4]
+    assert index.find("") == [0, 1, 2, 3, 4]
+
+def test_find_no_match():
+    index = SubstringIndex(TEXTS)
+    assert index.find("xyz") == []
+    assert index.find("bobo") == []
+
+def test_find_prefix():
+    index = SubstringIndex(TEXTS)
+    assert index.find_prefix("ali") == [0, 2]
+    assert index.find_prefix("BOB") == [1, 4]
+    assert index.find_prefix("lic") == []
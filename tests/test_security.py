@@ -18,6 +18,11 @@ Fonctions testées :
 - test_create_access_token_and_decode : création et décodage JWT
 - test_get_current_user_valid_token : extraction correcte de l'utilisateur depuis un token valide
 - test_get_current_user_invalid_token : rejet d’un token JWT invalide
+- test_get_current_user_uses_token_cache : un token déjà vérifié est servi depuis le cache
+- test_token_cache_expires_with_token : une entrée expire avec le token (ou après le TTL)
+- test_token_cache_is_bounded : le cache est borné (LRU)
+- test_password_hashing : hachage PBKDF2 des mots de passe
+- test_authenticate_user_async_runs_in_auth_executor : vérification hors de la boucle asyncio
 
 À lancer avec :
 ---------------
@@ -26,16 +31,25 @@ Fonctions testées :
 Assurez-vous que le fichier `.env` est présent et correctement configuré avant de lancer les tests.
 """
 
+import asyncio
+import threading
 import pytest
 from datetime import timedelta
 from fastapi import HTTPException
 from jose import jwt
 import os
 from dotenv import load_dotenv
+from api import security
 from api.security import (
     authenticate_user,
+    authenticate_user_async,
+    hash_password,
+    load_password_hash,
+    verify_password,
     create_access_token,
     get_current_user,
+    token_cache,
+    TokenCache,
     USERS,
     secret_key,
     algorithm,
@@ -74,3 +88,58 @@ def test_get_current_user_invalid_token():
         get_current_user("invalid.token.value")
     assert exc_info.value.status_code == 401
     assert "invalide" in exc_info.value.detail.lower()
+
+def test_get_current_user_uses_token_cache():
+    token_cache.clear()
+    token = create_access_token({"sub": admin}, timedelta(minutes=5))
+    hits = token_cache.hits
+    assert get_current_user(token) == admin
+    assert get_current_user(token) == admin
+    assert token_cache.hits == hits + 1
+    assert len(token_cache) == 1
+
+def test_token_cache_expires_with_token():
+    now = [1000.0]
+    cache = TokenCache(maxsize=2, ttl=300, clock=lambda: now[0])
+    cache.put("a", "alice", exp=1010)
+    cache.put("b", "bob")
+    assert cache.get("a") == "alice"
+    now[0] = 1010
+    assert cache.get("a") is None
+    assert cache.get("b") == "bob"
+    now[0] = 1300
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+def test_token_cache_is_bounded():
+    cache = TokenCache(maxsize=2)
+    for token in ["a", "b", "c"]:
+        cache.put(token, token)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+
+def test_password_hashing():
+    password_hash = hash_password("s3cret", iterations=1000)
+    assert password_hash.startswith("pbkdf2_sha256$1000$")
+    assert verify_password("s3cret", password_hash)
+    assert not verify_password("other", password_hash)
+    assert not verify_password("s3cret", "s3cret")
+    assert load_password_hash(password_hash) == password_hash
+    assert verify_password("s3cret", load_password_hash("s3cret"))
+    assert USERS[admin] != password
+
+def test_authenticate_user_async_runs_in_auth_executor(monkeypatch):
+    threads = []
+
+    def fake_authenticate(username, password):
+        threads.append(threading.current_thread().name)
+        return username == "ok"
+
+    monkeypatch.setattr(security, "authenticate_user", fake_authenticate)
+
+    async def burst():
+        return await asyncio.gather(*(authenticate_user_async(name, "pw") for name in ["ok", "ko"] * 4))
+
+    assert asyncio.run(burst()) == [True, False] * 4
+    assert all(name.startswith("auth") for name in threads)
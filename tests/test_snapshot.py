@@ -0,0 +1,91 @@
+"""
+Tests du snapshot binaire du jeu de données (`api.snapshot`)
+
+Fonctions testées :
+-------------------
+- test_snapshot_matches_in_memory_dataset : mêmes réponses qu'un `UserDataset` construit en mémoire (y compris recherche vide)
+- test_empty_snapshot : snapshot sans utilisateur
+- test_invalid_snapshot : fichier tronqué ou d'un autre format
+- test_reloader_loads_snapshot : chargement d'un `.snap` par `DatasetReloader`
+
+À lancer avec :
+---------------
+    pytest tests/test_snapshot.py
+"""
+
+import pytest
+
+from api.models import User
+from api.reload import DatasetReloader
+from api.snapshot import SnapshotDataset, write_snapshot
+from api.store import UserStore
+
+
+def make_users():
+    users = [
+        User(login=login, id=user_id, created_at="2016-03-04T05:06:07Z",
+             avatar_url=f"https://avatars.githubusercontent.com/u/{user_id}?v=4", bio=f"Bio de {login}")
+        for user_id, login in [(30, "Alice"), (10, "bob"), (20, "carol"), (40, "alice"), (50, "Élodie")]
+    ]
+    users.append(User(login="dave", id=5, created_at="2015-01-01", avatar_url="", bio=None))
+    users.append(User(login="erin", id=10, created_at="2020-01-01T00:00:00Z", avatar_url="x", bio=""))
+    return users
+
+
+def test_snapshot_matches_in_memory_dataset(tmp_path):
+    path = str(tmp_path / "users.snap")
+    users = make_users()
+    assert write_snapshot(users, path) == len(users)
+
+    expected = UserStore(users)
+    store = UserStore()
+    store.swap(SnapshotDataset(path))
+    assert isinstance(store.dataset, SnapshotDataset)
+
+    assert store.all() == expected.all() == users
+    for login in ["Alice", "alice", "ALICE", "élodie", "Élodie", "nobody", ""]:
+        for ignore_case in (False, True):
+            assert store.get_by_login(login, ignore_case) == expected.get_by_login(login, ignore_case)
+    for user_id in [5, 10, 20, 30, 35, 50, 60]:
+        assert store.get_by_id(user_id) == expected.get_by_id(user_id)
+    assert store.page(limit=2, after_id=10) == expected.page(limit=2, after_id=10)
+    assert store.page(offset=3) == expected.page(offset=3)
+    for created_after, created_before in [(None, None), (1451606400, None), (None, 1451606400), (1420070400, 1500000000)]:
+        for has_bio in (None, True, False):
+            filters = {"created_after": created_after, "created_before": created_before, "has_bio": has_bio}
+            assert store.page(**filters) == expected.page(**filters)
+            assert store.page(limit=1, after_id=5, **filters) == expected.page(limit=1, after_id=5, **filters)
+    for q in ["", "a", "AL", "ali", "lodi", "ice", "zzz", "é"]:
+        for prefix in (False, True):
+            assert store.search(q, prefix=prefix) == expected.search(q, prefix=prefix)
+    assert store.search("bio de bob", in_bio=True) == expected.search("bio de bob", in_bio=True)
+    assert len(store.search("")) == len(users)
+    assert store.search("", in_bio=True) == expected.search("", in_bio=True)
+
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / "empty.snap")
+    write_snapshot([], path)
+    dataset = SnapshotDataset(path)
+    assert len(dataset) == 0
+    assert dataset.position_by_login("alice") is None
+    assert dataset.login_index.find("ali") == []
+
+
+def test_invalid_snapshot(tmp_path):
+    path = tmp_path / "users.snap"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        SnapshotDataset(str(path))
+    path.write_bytes(b'[{"login": "alice"}]')
+    with pytest.raises(ValueError):
+        SnapshotDataset(str(path))
+
+
+def test_reloader_loads_snapshot(tmp_path):
+    path = str(tmp_path / "users.snap")
+    write_snapshot(make_users(), path)
+    store = UserStore()
+    DatasetReloader(store, path).reload()
+    assert isinstance(store.dataset, SnapshotDataset)
+    assert store.get_by_login("carol").id == 20
@@ -0,0 +1,78 @@
+"""
+Tests du moteur de stockage SQLite (`api.sqlite_store`)
+
+Fonctions testées :
+-------------------
+- test_sqlite_matches_in_memory_dataset : mêmes réponses que le stockage en mémoire
+- test_invalid_database : fichier absent ou qui n'est pas une base SQLite
+- test_reloader_opens_sqlite : ouverture d'une base `.sqlite` par `DatasetReloader`
+
+À lancer avec :
+---------------
+    pytest tests/test_sqlite_store.py
+"""
+
+import pytest
+
+from api.models import User
+from api.reload import DatasetReloader
+from api.sqlite_store import SqliteDataset, write_sqlite
+from api.store import UserStore
+
+
+def make_users():
+    users = [
+        User(login=login, id=user_id, created_at="2016-03-04T05:06:07Z",
+             avatar_url=f"https://avatars.githubusercontent.com/u/{user_id}?v=4", bio=f"Bio de {login}")
+        for user_id, login in [(30, "Alice"), (10, "bob"), (20, "carol"), (40, "alice"), (50, "Élodie")]
+    ]
+    users.append(User(login="dave", id=5, created_at="2015-01-01", avatar_url="", bio=None))
+    users.append(User(login="erin", id=10, created_at="2020-01-01T00:00:00Z", avatar_url="x", bio='Dit "ÉTÉ"'))
+    return users
+
+
+def test_sqlite_matches_in_memory_dataset(tmp_path):
+    path = str(tmp_path / "users.sqlite")
+    users = make_users()
+    assert write_sqlite(users, path, batch_size=3) == len(users)
+
+    expected = UserStore(users)
+    store = UserStore()
+    store.swap(SqliteDataset(path))
+
+    assert len(store) == len(users)
+    assert store.all() == expected.all() == users
+    for login in ["Alice", "alice", "ALICE", "élodie", "Élodie", "nobody", ""]:
+        for ignore_case in (False, True):
+            assert store.get_by_login(login, ignore_case) == expected.get_by_login(login, ignore_case)
+    for user_id in [5, 10, 20, 30, 35, 50, 60]:
+        assert store.get_by_id(user_id) == expected.get_by_id(user_id)
+    for limit, offset, after_id in [(2, 0, None), (2, 0, 10), (None, 3, None), (10, 0, 40), (1, 10, None)]:
+        assert store.page(limit, offset, after_id) == expected.page(limit, offset, after_id)
+    for created_after, created_before in [(None, None), (1451606400, None), (None, 1451606400), (1420070400, 1500000000)]:
+        for has_bio in (None, True, False):
+            filters = {"created_after": created_after, "created_before": created_before, "has_bio": has_bio}
+            assert store.page(**filters) == expected.page(**filters)
+            assert store.page(limit=1, after_id=5, **filters) == expected.page(limit=1, after_id=5, **filters)
+    for q in ["", "a", "AL", "ali", "lodi", "ice", "zzz", "é", '"été"', "e "]:
+        for prefix in (False, True):
+            for in_bio in (False, True):
+                assert store.search(q, prefix, in_bio) == expected.search(q, prefix, in_bio), (q, prefix, in_bio)
+
+
+def test_invalid_database(tmp_path):
+    with pytest.raises(OSError):
+        SqliteDataset(str(tmp_path / "missing.sqlite"))
+    path = tmp_path / "users.sqlite"
+    path.write_text('[{"login": "alice"}]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        SqliteDataset(str(path))
+
+
+def test_reloader_opens_sqlite(tmp_path):
+    path = str(tmp_path / "users.sqlite")
+    write_sqlite(make_users(), path)
+    store = UserStore()
+    DatasetReloader(store, path).reload()
+    assert isinstance(store.dataset, SqliteDataset)
+    assert store.get_by_login("carol").id == 20
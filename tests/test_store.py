@@ -0,0 +1,154 @@
+"""
+Tests unitaires du stockage en mémoire des utilisateurs (`api.store`)
+
+Fonctions testées :
+-------------------
+- test_lookup_by_login : recherche exacte par login
+- test_lookup_ignore_case : recherche insensible à la casse
+- test_lookup_by_id : recherche par identifiant
+- test_load_replaces_indexes : un rechargement remplace la liste et les index ensemble
+- test_users_are_rebuilt_identically : les colonnes compactes restituent les utilisateurs à l'identique
+- test_records_match_users : les dictionnaires lus dans les colonnes (routes) correspondent aux objets `User`
+- test_lookup_logins_differing_by_case : logins ne différant que par la casse
+- test_page_filters : filtres de dates de création et de bio, comparés à un filtrage linéaire
+- test_date_order_cached : les positions d'une plage de dates ne sont triées qu'une fois pour un parcours par curseur
+
+À lancer avec :
+---------------
+    pytest tests/test_store.py
+"""
+
+import random
+
+from api.models import User
+from api.store import DATE_ORDER_CACHE_SIZE, UserDataset, UserStore, parse_timestamp
+
+
+def make_user(user_id, login):
+    return User(
+        id=user_id,
+        login=login,
+        created_at="2020-01-01T00:00:00Z",
+        avatar_url=f"https://example.com/{login}.png",
+        bio=f"Bio de {login}",
+    )
+
+
+def test_lookup_by_login():
+    store = UserStore([make_user(1, "Alice"), make_user(2, "bob")])
+    assert store.get_by_login("Alice").id == 1
+    assert store.get_by_login("alice") is None
+
+def test_lookup_ignore_case():
+    store = UserStore([make_user(1, "Alice")])
+    assert store.get_by_login("ALICE", ignore_case=True).id == 1
+
+def test_lookup_by_id():
+    store = UserStore([make_user(1, "Alice"), make_user(2, "bob")])
+    assert store.get_by_id(2).login == "bob"
+    assert store.get_by_id(3) is None
+
+def test_load_replaces_indexes():
+    store = UserStore([make_user(1, "Alice")])
+    store.load([make_user(2, "bob")])
+    assert len(store) == 1
+    assert store.get_by_login("Alice") is None
+    assert store.get_by_id(1) is None
+    assert store.get_by_login("bob").id == 2
+
+def test_users_are_rebuilt_identically():
+    users = [
+        make_user(1, "Alice"),
+        User(id=2, login="bob", created_at="2015-01-01T23:59:36Z",
+             avatar_url="https://avatars.githubusercontent.com/u/2?v=4", bio=None),
+        User(id=3, login="Chloé", created_at="2015-01-01", avatar_url="", bio="Été ☀"),
+    ]
+    store = UserStore(users)
+    assert store.all() == users
+    assert [u.model_dump() for u in store.all()] == [u.model_dump() for u in users]
+
+def test_records_match_users():
+    users = [
+        make_user(3, "Alice"),
+        User(id=1, login="bob", created_at="2015-01-01T23:59:36Z",
+             avatar_url="https://avatars.githubusercontent.com/u/1?v=4", bio=None),
+        User(id=2, login="Chloé", created_at="2015-01-01", avatar_url="", bio="Été ☀"),
+    ]
+    store = UserStore(users)
+    records, next_id, total = store.page_records(limit=2)
+    assert records == [user.model_dump() for user in store.page(limit=2)[0]]
+    assert (next_id, total) == (2, 3)
+    assert records[0]["created_at"] == "2015-01-01T23:59:36Z"
+    assert store.search_records("l") == [user.model_dump() for user in store.search("l")]
+    assert store.get_record_by_login("chloé", ignore_case=True) == users[2].model_dump()
+    assert store.get_record_by_id(3) == users[0].model_dump()
+    assert store.get_record_by_id(4) is None
+
+def test_lookup_logins_differing_by_case():
+    store = UserStore([make_user(1, "Alice"), make_user(2, "alice")])
+    assert store.get_by_login("Alice").id == 1
+    assert store.get_by_login("alice").id == 2
+    assert store.get_by_login("ALICE", ignore_case=True).id == 1
+
+def test_page_filters():
+    rng = random.Random(7)
+    users = []
+    for i in range(300):
+        created_at = f"20{rng.randint(10, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00Z"
+        if i % 50 == 0:
+            created_at = created_at[:10]  # date seule, hors format GitHub
+        if i % 97 == 0:
+            created_at = "inconnue"
+        bio = rng.choice([None, "", "Dev"])
+        users.append(User(id=rng.randint(1, 250), login=f"user{i}", created_at=created_at, avatar_url="", bio=bio))
+    store = UserStore(users)
+    listed = store.page()[0]
+
+    def expected(after, before, has_bio):
+        result = []
+        for user in listed:
+            timestamp = parse_timestamp(user.created_at)
+            if (after is not None or before is not None) and timestamp is None:
+                continue
+            if after is not None and timestamp < after or before is not None and timestamp >= before:
+                continue
+            if has_bio is not None and bool(user.bio) != has_bio:
+                continue
+            result.append(user)
+        return result
+
+    for after, before in [(None, None), (parse_timestamp("2015-01-01"), None), (None, parse_timestamp("2016-06-01")),
+                          (parse_timestamp("2012-03-15"), parse_timestamp("2019-05-10T12:00:00")), (10**10, None)]:
+        for has_bio in (None, True, False):
+            matching = expected(after, before, has_bio)
+            users_page, next_id, total = store.page(created_after=after, created_before=before, has_bio=has_bio)
+            assert users_page == matching and next_id is None and total == len(matching)
+            # Parcours par curseur : mêmes utilisateurs, par pages de 7
+            collected, cursor = [], None
+            while True:
+                users_page, cursor, _ = store.page(limit=7, after_id=cursor, created_after=after, created_before=before, has_bio=has_bio)
+                collected += users_page
+                if cursor is None:
+                    break
+            assert collected == matching
+
+
+def test_date_order_cached():
+    users = [make_user(i, f"user{i}") for i in range(50, 0, -1)]
+    for user in users:
+        user.created_at = f"2020-01-{user.id % 28 + 1:02d}T00:00:00Z"
+    dataset = UserDataset(users)
+    after, before = parse_timestamp("2020-01-05"), parse_timestamp("2020-01-20")
+    order = dataset.date_order(after, before, None)
+    assert [dataset.ids[position] for position in order] == sorted(
+        user.id for user in users if "2020-01-05" <= user.created_at < "2020-01-20"
+    )
+    # Pages suivantes : même tableau, sans nouveau tri
+    records, cursor, _ = dataset.page_records(limit=5, created_after=after, created_before=before)
+    dataset.page_records(limit=5, after_id=cursor, created_after=after, created_before=before)
+    assert dataset.date_order(after, before, None) is order
+    # Cache borné
+    for day in range(DATE_ORDER_CACHE_SIZE + 1):
+        dataset.date_order(parse_timestamp(f"2020-01-{day + 1:02d}"), None, True)
+    assert len(dataset._date_orders) == DATE_ORDER_CACHE_SIZE
+    assert dataset.date_order(after, before, None) is not order